@@ -102,7 +102,14 @@ class config(object):
 
     # -- cli and configuration file arguments ----------------------------
     url = None
-    """Ldap server url in the scheme://hostname:port"""
+    """Ldap server url in the scheme://hostname:port or a list of urls of
+    equivalent servers, e.g. replicas, which are used as a
+    :py:class:`~ldap3_orm.pool.LatencyServerPool`"""
+
+    write_url = None
+    """Url of the writable primary server if ``url`` refers to read-only
+    replicas. Writes are sent to ``write_url`` and reads to ``url`` using a
+    :py:class:`~ldap3_orm.routing.RoutingConnection`."""
 
     base_dn = ''
     """Ldap base dn"""
@@ -187,12 +194,20 @@ class config(object):
             cls._passwordcls_or_module = cls.connconfig["password"]
             cls.connconfig[
                 "password"] = cls._passwordcls_or_module.get_password(
-                cls.url, cls.connconfig["user"]
+                cls._password_url(), cls.connconfig["user"]
             )
             if cls.password:  # update cls.password as well
                 cls.password = cls.connconfig["password"]
         cls._applied = True
 
+    @classmethod
+    def _password_url(cls):
+        """Returns the url passwords are stored for, which is the first url
+        of a list of urls."""
+        if isinstance(cls.url, (list, tuple)):
+            return cls.url[0] if cls.url else None
+        return cls.url
+
     @classmethod
     def set_password(cls, password):
         if not cls._applied:
@@ -201,7 +216,7 @@ class config(object):
         if hasattr(cls._passwordcls_or_module, "set_password"):
             cls.connconfig[
                 "password"] = cls._passwordcls_or_module.set_password(
-                cls.url, cls.connconfig["user"], password
+                cls._password_url(), cls.connconfig["user"], password
             )
         cls.connconfig["password"] = password
         if cls.password:  # update cls.password as well
@@ -1,12 +1,22 @@
 # coding: utf-8
 
 from functools import partial
+from timeit import default_timer
 
-from ldap3 import Connection as _Connection
+from ldap3 import ASYNC, AUTO_BIND_DEFAULT, AUTO_BIND_NONE, RESTARTABLE, \
+    SEQUENCE_TYPES, SUBTREE, Connection as _Connection
+from ldap3.core.exceptions import LDAPCommunicationError, LDAPException, \
+    LDAPResponseTimeoutError
 # pylint: disable=unused-import
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
 from ldap3_orm._version import __version__, __revision__
+from ldap3_orm.deadline import deadline
+from ldap3_orm.filter import optimize, server_indexed_attributes
+from ldap3_orm.hedging import HedgedConnection
+from ldap3_orm.pool import LatencyServerPool
+from ldap3_orm.routing import READ_YOUR_WRITES, RoutingConnection
+from ldap3_orm.querylog import QueryLog
 from ldap3_orm.utils import compile_filter
 
 __author__ = "Christian Felder <webmaster@bsm-felder.de>"
@@ -31,25 +41,260 @@ along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
 
 
 class Connection(_Connection):
+    """Extends :py:class:`ldap3.Connection <ldap3.core.connection.Connection>`
+    to support ORM Filter Expressions.
 
-    def search(self, search_base, search_filter, *args, **kwargs):
+    The elapsed time of all synchronous searches is collected in
+    :py:attr:`querylog`, a :py:class:`~ldap3_orm.querylog.QueryLog`. Searches
+    taking at least ``slow_query_threshold`` seconds are logged, which can be
+    configured either as keyword argument or in ``connconfig``.
+
+    If ``optimize_filters`` is set all search filters are passed to
+    :py:func:`ldap3_orm.filter.optimize` before being sent to the server.
+    Operands of ``&`` operators are reordered by ``indexed_attributes``
+    which is either a list of attribute names or ``True`` in order to read the
+    index configuration from the server on first use.
+
+    If the connection uses a :py:class:`~ldap3_orm.pool.LatencyServerPool`
+    the elapsed time and failures of all synchronous searches are reported
+    to the pool. A connection which binds automatically is reopened on
+    another server of the pool if its server has been ejected.
+
+    Searches, add, delete, modify, modify DN and compare operations accept a
+    ``timeout`` in seconds and obey the deadline of
+    :py:func:`ldap3_orm.deadline.deadline` blocks. Operations which have not
+    been answered in time raise
+    :py:class:`~ldap3.core.exceptions.LDAPResponseTimeoutError`. Using
+    asynchronous strategies the operation is abandoned, which frees the
+    connection for the next request. Synchronous strategies cannot abandon
+    an operation while waiting for its response, the server is asked to stop
+    searches using their time limit instead and the connection is closed
+    after the socket timed out, which abandons all of its operations. It is
+    reopened if it binds automatically. The ``RESTARTABLE`` strategy does not
+    resend operations performed within a deadline, which would wait without
+    a timeout.
+
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.querylog = QueryLog(kwargs.pop("slow_query_threshold", None))
+        self.optimize_filters = kwargs.pop("optimize_filters", False)
+        self.indexed_attributes = kwargs.pop("indexed_attributes", None)
+        self._deadlines = {}  # message id -> deadline
+        _Connection.__init__(self, *args, **kwargs)
+        # ldap3 assigns the get_response method of the strategy to each
+        # instance, which hides get_response of this class
+        del self.get_response
+
+    def _indexed_attributes(self):
+        if self.indexed_attributes is True:
+            self.indexed_attributes = []  # no recursion on searching the index
+            self.indexed_attributes = server_indexed_attributes(self)
+        return self.indexed_attributes
+
+    def _timed(self, limit, operation, *args, **kwargs):
+        """Performs ``operation`` within the :py:class:`Deadline
+        <ldap3_orm.deadline.Deadline>` ``limit``."""
+        if limit is None:
+            return operation(self, *args, **kwargs)
+        if not self.strategy.sync:
+            limit.remaining()
+            result = operation(self, *args, **kwargs)
+            self._deadlines[result] = limit
+            return result
+        strategy = self.strategy
+        # restartable strategies must not resend the operation on a new
+        # socket without timeout after the socket timed out
+        restarting = getattr(strategy, "_restarting", None)
+        with self.connection_lock:
+            sock = self.socket
+            timeout = sock.gettimeout() if sock is not None else None
+            if sock is not None:
+                sock.settimeout(limit.remaining())
+            if restarting is False:
+                strategy._restarting = True
+            try:
+                return operation(self, *args, **kwargs)
+            except LDAPException:
+                if not limit.expired:
+                    raise
+                # the socket has been closed on the timeout
+                try:
+                    self._reopen()
+                except LDAPException:
+                    pass  # reopened by the next operation if restartable
+                raise limit.error()
+            finally:
+                if restarting is False:
+                    strategy._restarting = False
+                if sock is not None and sock is self.socket:
+                    sock.settimeout(timeout)
+
+    def get_response(self, message_id, timeout=None, get_request=False):
+        limit = self._deadlines.get(message_id)
+        if limit is not None and (timeout is None or
+                                  limit.expiry - default_timer() <= timeout):
+            try:
+                return self.strategy.get_response(
+                    message_id, max(limit.expiry - default_timer(), 0),
+                    get_request)
+            except LDAPResponseTimeoutError:
+                self.abandon(message_id)
+                raise limit.error()
+            finally:
+                self._deadlines.pop(message_id, None)
+        result = self.strategy.get_response(message_id, timeout, get_request)
+        self._deadlines.pop(message_id, None)
+        return result
+
+    def abandon(self, message_id, *args, **kwargs):
+        result = _Connection.abandon(self, message_id, *args, **kwargs)
+        self._abandoned(message_id)
+        return result
+
+    def _abandoned(self, message_id):
+        """Discards the state of the abandoned operation ``message_id``."""
+        self._deadlines.pop(message_id, None)
+        strategy = self.strategy
+        with self.connection_lock:
+            if strategy._outstanding:
+                strategy._outstanding.pop(message_id, None)
+        if hasattr(strategy, "_events"):
+            strategy._events.pop(message_id, None)
+            with strategy.async_lock:
+                strategy._responses.pop(message_id, None)
+
+    def search(self, search_base, search_filter, search_scope=SUBTREE,
+               *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._search(limit, search_base, search_filter,
+                                search_scope, *args, **kwargs)
+
+    def _search(self, limit, search_base, search_filter, search_scope,
+                *args, **kwargs):
         query = compile_filter(search_filter)
-        return _Connection.search(self, search_base, query, *args, **kwargs)
+        if self.optimize_filters:
+            query = optimize(query, self._indexed_attributes())
+        if limit is not None and len(args) < 4 and \
+                not kwargs.get("time_limit"):
+            # asks the server to stop the search on the deadline
+            kwargs["time_limit"] = limit.time_limit()
+        start = default_timer()
+        try:
+            result = self._timed(limit, _Connection.search, search_base,
+                                 query, search_scope, *args, **kwargs)
+        except LDAPCommunicationError:
+            if isinstance(self.server_pool, LatencyServerPool):
+                self.server_pool.failure(self.server)
+            raise
+        if self.strategy.sync:
+            elapsed = default_timer() - start
+            entries = sum(1 for response in self.response or []
+                          if response["type"] == "searchResEntry")
+            attributes = kwargs.get("attributes",
+                                    args[1] if len(args) > 1 else None)
+            self.querylog.record(search_base, query, search_scope,
+                                 attributes, entries, elapsed)
+            if isinstance(self.server_pool, LatencyServerPool):
+                self.server_pool.observe(self.server, elapsed)
+                if self.server_pool.ejected(self.server):
+                    self._rebalance()
+        return result
+
+    def add(self, *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._timed(limit, _Connection.add, *args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._timed(limit, _Connection.delete, *args, **kwargs)
+
+    def modify(self, *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._timed(limit, _Connection.modify, *args, **kwargs)
+
+    def modify_dn(self, *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._timed(limit, _Connection.modify_dn, *args,
+                               **kwargs)
+
+    def compare(self, *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._timed(limit, _Connection.compare, *args, **kwargs)
 
+    def _reopen(self):
+        """Reopens and binds this connection if it binds automatically and
+        is not shared by several threads. Returns ``False`` if it has not
+        been reopened, exceptions are passed on."""
+        if self.strategy.thread_safe or \
+                self.auto_bind in (AUTO_BIND_NONE, AUTO_BIND_DEFAULT):
+            return False  # shared or bound manually
+        if not self.closed:
+            self.unbind()
+        self._do_auto_bind()
+        return True
 
-def create_connection(url, connconfig, auto_bind=True):
+    def _rebalance(self):
+        """Reopens and binds this connection on the server selected by its
+        server pool. Failures are reported to the pool, the connection is
+        reopened by the next operation using the ``RESTARTABLE`` strategy."""
+        try:
+            self._reopen()
+        except LDAPException:
+            self.server_pool.failure(self.server)
+
+
+def create_connection(url, connconfig, auto_bind=True, write_url=None):
     """Create :py:class:`ldap3_orm.Connection
     <ldap3.core.connection.Connection>` from configuration. The
     ``auto_bind`` flag can either be set as keyword argument or provided in the
     ``connconfig`` dictionary which has preference in case both options are
     used.
 
+    If ``url`` is a list of several urls the connection uses a
+    :py:class:`~ldap3_orm.pool.LatencyServerPool` of all servers created
+    using the keyword arguments in ``connconfig["pool_options"]`` and the
+    ``RESTARTABLE`` client strategy unless configured otherwise, which
+    reopens the connection on another server on failures.
+
+    If ``write_url`` is given a
+    :py:class:`~ldap3_orm.routing.RoutingConnection` is returned, which sends
+    writes to a connection to ``write_url`` and reads to a connection to
+    ``url`` except for the written DNs within
+    ``connconfig["read_your_writes"]`` seconds after a write.
+
+    If ``connconfig["hedge"]`` is given and ``url`` is a list of several urls
+    a :py:class:`~ldap3_orm.hedging.HedgedConnection` of ``ASYNC``
+    connections to all servers is returned instead of a connection using a
+    server pool, which is created using the keyword arguments in
+    ``connconfig["hedge"]``. Writes are never hedged.
+
     """
-    if connconfig:
-        if "auto_bind" not in connconfig:
-            connconfig = dict(auto_bind=auto_bind, **connconfig)
-        return Connection(url, **connconfig)
-    return Connection(url, auto_bind=auto_bind)
+    connconfig = dict(connconfig or {})
+    pool_options = connconfig.pop("pool_options", {})
+    read_your_writes = connconfig.pop("read_your_writes", READ_YOUR_WRITES)
+    hedge = connconfig.pop("hedge", None)
+    if write_url is not None:
+        return RoutingConnection(
+            create_connection(write_url, connconfig, auto_bind),
+            create_connection(url, dict(connconfig, hedge=hedge,
+                                        pool_options=pool_options),
+                              auto_bind),
+            read_your_writes)
+    if isinstance(url, SEQUENCE_TYPES):
+        if hedge is not None and len(url) > 1:
+            return HedgedConnection(
+                [create_connection(server, dict(connconfig,
+                                                client_strategy=ASYNC),
+                                   auto_bind) for server in url],
+                **hedge)
+        if len(url) > 1:
+            connconfig.setdefault("client_strategy", RESTARTABLE)
+            url = LatencyServerPool(list(url), **pool_options)
+        else:
+            url = url[0]
+    connconfig.setdefault("auto_bind", auto_bind)
+    return Connection(url, **connconfig)
 
 
 def connection(conn, *add_args):
@@ -74,6 +74,36 @@ class AttrDef(_AttrDef):
         _AttrDef.__init__(self, *args, mandatory=mandatory, **kwargs)
 
 
+class ReferenceAttrDef(AttrDef):
+    """Definition of an ldap attribute containing DNs of entries of the ORM
+    model ``model``, e.g. ``member``, ``manager`` or ``memberOf``.
+
+    ``model`` is either a class derived from
+    :py:class:`~ldap3_orm.entry.EntryBase` or a callable without arguments
+    returning such a class which allows forward references, e.g.::
+
+        class Group(EntryBase):
+            ...
+            member = ReferenceAttrDef("member", lambda: User)
+
+    Referenced entries can be resolved using
+    :py:meth:`~ldap3_orm.entry.EntryBase.entry_references` or prefetched
+    for all entries of a query using
+    :py:meth:`Query.prefetch() <ldap3_orm.query.Query.prefetch>`.
+
+    """
+
+    def __init__(self, name, model, *args, **kwargs):
+        AttrDef.__init__(self, name, *args, **kwargs)
+        self._model = model
+
+    @property
+    def model(self):
+        if isinstance(self._model, type):
+            return self._model
+        return self._model()
+
+
 class OperatorAttrDef(AttrDef):
     """Define operators for :py:class:`~ldap3.abstract.attrDef.AttrDef`
     expressions.
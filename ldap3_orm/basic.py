@@ -1,7 +1,9 @@
 # coding: utf-8
 
+from ldap3_orm import bulk
 from ldap3_orm.config import config
 from ldap3_orm.connection import connection, conn
+from ldap3_orm.deadline import deadline
 # pylint: disable=unused-import
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
@@ -30,29 +32,65 @@ along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
 
 
 @connection(conn)
-def add(conn, entry):
+def add(conn, entry, timeout=None):
     """Adds a new ``entry`` to the connected LDAP.
 
     The ``entry`` is passed to the active
     :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
-    ``conn`` in order to create a new LDAP entry.
+    ``conn`` in order to create a new LDAP entry. The operation is abandoned
+    if it has not been answered within ``timeout`` seconds.
 
     """
-    return conn.add(entry.entry_dn, entry.object_classes,
-                    entry.entry_attributes_as_dict)
+    with deadline(timeout):
+        return conn.add(entry.entry_dn, entry.object_classes,
+                        entry.entry_attributes_as_dict)
 
 
 @connection(conn)
-def delete(conn, entry):
+def delete(conn, entry, timeout=None):
     """Deletes an ``entry`` from the connected LDAP.
 
     The ``entry`` is passed to the active
     :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
     ``conn`` in order to delete an existing LDAP entry with the
-    specified ``DN``.
+    specified ``DN``. The operation is abandoned if it has not been answered
+    within ``timeout`` seconds.
 
     """
-    return conn.delete(entry.entry_dn)
+    with deadline(timeout):
+        return conn.delete(entry.entry_dn)
+
+
+@connection(conn)
+def delete_tree(conn, dn, **kwargs):
+    """Deletes ``dn`` including its subordinate entries from the LDAP.
+
+    The subtree is deleted leaf-first using the active
+    :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
+    ``conn``, deleting the entries of each level concurrently while adapting
+    the number of outstanding requests to the load of the server, or using
+    a single request if the server supports the tree delete control.
+
+    See ``help(ldap3_orm.bulk.delete_tree)`` for more details.
+
+    """
+    return bulk.delete_tree(conn, dn, **kwargs)
+
+
+@connection(conn)
+def add_many(conn, entries, **kwargs):
+    """Creates many ``entries`` in the connected LDAP.
+
+    The entries are added top-down using the active
+    :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
+    ``conn``, adding the entries of each level concurrently while adapting
+    the number of outstanding requests to the load of the server. Returns
+    the list of entries which could not be added.
+
+    See ``help(ldap3_orm.bulk.add_many)`` for more details.
+
+    """
+    return bulk.add_many(conn, entries, **kwargs)
 
 
 @connection(conn, config.base_dn)
@@ -64,9 +102,39 @@ def search(conn, *args, **kwargs):
     ``conn`` and the configured ``base_dn`` for ``search_base``.
     Further arguments are passed to
     :py:func:`ldap3_orm.Connection.search
-    <ldap3.core.connection.Connection.search>` function.
+    <ldap3.core.connection.Connection.search>` function, e.g. ``timeout``
+    in seconds after which the search is abandoned.
 
     See ``help(ldap3_orm.Connection.search)`` for more details.
 
     """
     return conn.search(*args, **kwargs)
+
+
+@connection(conn)
+def get_many(conn, dns, model=None, **kwargs):
+    """Reads many entries by their ``dns`` from the connected LDAP.
+
+    Reads the entries of all ``dns`` using the active
+    :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
+    ``conn`` with combined one-level searches per parent container.
+    Returns a dictionary mapping each DN to an instance of ``model`` or
+    ``None`` if the entry does not exist.
+
+    See ``help(ldap3_orm.bulk.get_many)`` for more details.
+
+    """
+    return bulk.get_many(conn, dns, model, **kwargs)
+
+
+@connection(conn)
+def slow_queries(conn, n=10):
+    """Reports the top ``n`` query shapes by total search time.
+
+    Returns a :py:class:`~ldap3_orm.querylog.QueryReport` of all searches
+    performed on the active
+    :py:class:`ldap3_orm.Connection <ldap3.core.connection.Connection>`
+    ``conn`` aggregated by their filter fingerprint and search scope.
+
+    """
+    return conn.querylog.top(n)
@@ -0,0 +1,106 @@
+# coding: utf-8
+
+from collections import namedtuple
+from itertools import islice
+from multiprocessing import Pool
+
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# number of rows built by a worker process at once
+BUILD_CHUNK_SIZE = 1000
+
+
+RowError = namedtuple("RowError", ["index", "row", "error"])
+RowError.__doc__ = """Report of a row which failed in :py:func:`build_many`.
+``index`` is the position of ``row`` in the input and ``error`` the
+exception raised on creating the entry."""
+
+
+def _build(model, rows, start=0):
+    """Creates instances of ``model`` from ``rows`` whose first index is
+    ``start`` and returns the list of entries and :py:class:`RowError`
+    tuples."""
+    entries = []
+    errors = []
+    for index, row in enumerate(rows, start):
+        try:
+            entries.append(model(**row))
+        except Exception as e:  # reported per row
+            errors.append(RowError(index, row, e))
+    return entries, errors
+
+
+def _build_chunk(args):
+    """Builds a chunk of rows in a worker process."""
+    return _build(*args)
+
+
+def _chunks(model, rows, chunk_size):
+    rows = iter(rows)
+    start = 0
+    chunk = list(islice(rows, chunk_size))
+    while chunk:
+        yield model, chunk, start
+        start += len(chunk)
+        chunk = list(islice(rows, chunk_size))
+
+
+def build_many(model, rows, workers=0, chunk_size=BUILD_CHUNK_SIZE):
+    """Creates instances of ``model``, an ORM model derived from
+    :py:class:`~ldap3_orm.entry.EntryBase`, from ``rows``, which are
+    dictionaries of keyword arguments, e.g. read using
+    :py:class:`csv.DictReader`::
+
+        >>> users, errors = User.build_many(csv.DictReader(f), workers=4)
+        >>> failed = add_many(users)
+
+    If ``workers`` is given, chunks of ``chunk_size`` rows are built in
+    parallel by ``workers`` processes, which evaluate the DN templates,
+    defaults and validators. The entries are pickled as their DN and values
+    and recreated in the calling process without evaluating them again.
+    ``model`` must be importable by the worker processes, i.e. defined on
+    module level.
+
+    Returns the list of entries in the order of ``rows`` and the list of
+    :py:class:`RowError` tuples of all rows which failed.
+
+    """
+    if not workers:
+        return _build(model, rows)
+    entries = []
+    errors = []
+    pool = Pool(workers)
+    try:
+        for chunk_entries, chunk_errors in pool.imap(
+                _build_chunk, _chunks(model, rows, chunk_size)):
+            entries += chunk_entries
+            errors += chunk_errors
+    finally:
+        pool.terminate()
+        pool.join()
+    return entries, errors
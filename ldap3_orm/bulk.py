@@ -0,0 +1,583 @@
+# coding: utf-8
+
+from collections import OrderedDict, deque
+from multiprocessing.pool import ThreadPool
+from string import hexdigits
+from timeit import default_timer
+
+from ldap3 import ALL_ATTRIBUTES, BASE, LEVEL, MODIFY_ADD, MODIFY_DELETE, \
+    NO_ATTRIBUTES, SUBTREE
+from ldap3.core.exceptions import LDAPNoSuchObjectResult, \
+    LDAPResponseTimeoutError
+from ldap3.core.results import RESULT_SUCCESS
+from ldap3.utils.conv import escape_filter_chars
+from ldap3.utils.dn import parse_dn
+from ldap3_orm.controls import TREE_DELETE_CONTROL, supported_controls
+from ldap3_orm.deadline import current, deadline, iter_within
+from ldap3_orm.limiter import OVERLOADED, AdaptiveLimiter
+from ldap3_orm.utils import model_attributes
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# maximum number of RDN assertions combined in a single filter
+CHUNK_SIZE = 500
+# maximum length of a combined filter, far below common server limits
+MAX_FILTER_LENGTH = 16384
+# page size used for reading all DNs of a subtree to be deleted
+DELETE_PAGE_SIZE = 1000
+# maximum number of concurrent delete requests on each level of a subtree
+DELETE_WORKERS = 8
+# maximum number of concurrent add requests on each level of a subtree
+ADD_WORKERS = 8
+# maximum number of concurrent modify requests of batched values
+MODIFY_WORKERS = 4
+# number of times a request refused by an overloaded server is retried
+RETRIES = 3
+# number of values requested per range of a multi-valued attribute
+RANGE_SIZE = 1500
+# maximum number of values added or deleted in a single modify request
+MODIFY_BATCH_SIZE = 1000
+
+
+def unescape_dn_value(value):
+    """Returns the unescaped attribute ``value`` of an RDN as defined in
+    RFC 4514."""
+    raw = bytearray()
+    pos = 0
+    while pos < len(value):
+        char = value[pos]
+        if char == '\\' and pos + 1 < len(value):
+            pair = value[pos + 1:pos + 3]
+            if len(pair) == 2 and all(c in hexdigits for c in pair):
+                raw.append(int(pair, 16))
+                pos += 3
+                continue
+            char = value[pos + 1]
+            pos += 1
+        raw += char.encode("utf-8")
+        pos += 1
+    return raw.decode("utf-8")
+
+
+def split_dn(dn):
+    """Splits ``dn`` into a list of ``(attribute, value)`` tuples of its
+    RDN with unescaped values and its parent DN."""
+    rdn = []
+    components = parse_dn(dn, strip=True)
+    for idx, (attr, value, separator) in enumerate(components):
+        rdn.append((attr, unescape_dn_value(value)))
+        if separator != '+':
+            parent = ','.join("{}={}".format(attr, value) for attr, value, _
+                              in components[idx + 1:])
+            return rdn, parent
+    return rdn, ''
+
+
+def dn_key(dn):
+    """Returns a normalized representation of ``dn`` which can be used to
+    compare DNs independent of case, spacing and escaping."""
+    return ','.join("{}={}".format(attr.lower(),
+                                   unescape_dn_value(value).lower())
+                    for attr, value, _ in parse_dn(dn, strip=True))
+
+
+def rdn_filter(rdn):
+    """Returns an LDAP filter matching the decomposed ``rdn``."""
+    assertions = ''.join("({}={})".format(attr, escape_filter_chars(value))
+                         for attr, value in rdn)
+    return "(&{})".format(assertions) if len(rdn) > 1 else assertions
+
+
+def chunks(filters, chunk_size, max_filter_length):
+    """Splits ``filters`` into lists of at most ``chunk_size`` filters which
+    can be combined into a single filter of at most ``max_filter_length``
+    characters."""
+    chunk = []
+    length = 3  # (|)
+    for filt in filters:
+        if chunk and (len(chunk) >= chunk_size or
+                      length + len(filt) > max_filter_length):
+            yield chunk
+            chunk = []
+            length = 3
+        chunk.append(filt)
+        length += len(filt)
+    if chunk:
+        yield chunk
+
+
+def _chunked_searches(dns, chunk_size, max_filter_length):
+    """Yields ``(search_base, search_filter)`` tuples of one-level searches
+    covering all ``dns`` grouped by their parent containers."""
+    containers = OrderedDict()
+    for dn in dns:
+        rdn, parent = split_dn(dn)
+        container = containers.setdefault(dn_key(parent) if parent else '',
+                                          (parent, OrderedDict()))
+        container[1][rdn_filter(rdn)] = None  # ordered set
+    for parent, filters in containers.values():
+        for chunk in chunks(filters, chunk_size, max_filter_length):
+            yield parent, ("(|{})".format(''.join(chunk)) if len(chunk) > 1
+                           else chunk[0])
+
+
+def _abandon(conn, msgids):
+    """Abandons the outstanding operations ``msgids`` after an operation
+    sent together with them exceeded its deadline."""
+    for msgid in msgids:
+        conn.abandon(msgid)
+
+
+def _responses(conn, searches, attributes, **kwargs):
+    """Performs all ``searches`` and yields the returned entries.
+
+    Searches are pipelined if ``conn`` uses an asynchronous strategy, i.e.
+    all requests are sent before waiting for the first response. All
+    outstanding searches are abandoned if a search exceeds its deadline.
+
+    """
+    if conn.strategy.sync:
+        for search_base, search_filter in searches:
+            try:
+                conn.search(search_base, search_filter, LEVEL,
+                            attributes=attributes, **kwargs)
+            except LDAPNoSuchObjectResult:  # parent container does not exist
+                continue
+            for response in conn.response or []:
+                yield response
+    else:
+        msgids = [conn.search(search_base, search_filter, LEVEL,
+                              attributes=attributes, **kwargs)
+                  for search_base, search_filter in searches]
+        for index, msgid in enumerate(msgids):
+            try:
+                responses = conn.get_response(msgid)[0]
+            except LDAPNoSuchObjectResult:  # parent container does not exist
+                continue
+            except LDAPResponseTimeoutError:
+                _abandon(conn, msgids[index + 1:])
+                raise
+            for response in responses or []:
+                yield response
+
+
+def get_many(conn, dns, model=None, attributes=None,
+             chunk_size=CHUNK_SIZE, max_filter_length=MAX_FILTER_LENGTH,
+             timeout=None, **kwargs):
+    """Reads the entries of all ``dns`` using a minimum number of searches.
+
+    The ``dns`` are grouped by their parent containers. Each group is read
+    using one-level searches combining up to ``chunk_size`` RDN assertions,
+    e.g. ``(|(uid=guest)(uid=admin))``, where each filter does not exceed
+    ``max_filter_length`` characters.
+
+    Returns a dictionary ordered like ``dns`` mapping each DN to its entry.
+    DNs which do not exist are reported explicitly and mapped to ``None``.
+    Entries are instances of ``model`` if given or the plain search responses
+    otherwise. Just the attributes defined on ``model`` are requested by
+    default, all attributes are requested if ``model`` is not given.
+
+    All searches are performed within ``timeout`` seconds in total, see
+    :py:func:`ldap3_orm.deadline.deadline`.
+
+    """
+    dns = list(dns)
+    if attributes is None:
+        attributes = model_attributes(model) if model else ALL_ATTRIBUTES
+    keys = OrderedDict((dn_key(dn), dn) for dn in dns)
+    results = OrderedDict((dn, None) for dn in dns)
+    searches = _chunked_searches(keys.values(), chunk_size, max_filter_length)
+    with deadline(timeout):
+        for response in _responses(conn, searches, attributes, **kwargs):
+            if response["type"] != "searchResEntry":
+                continue
+            dn = keys.get(dn_key(response["dn"]))
+            if dn is not None:
+                results[dn] = (model._from_response(response) if model else
+                               response)
+    for dn in dns:  # duplicates with different spelling share the same entry
+        results[dn] = results[keys[dn_key(dn)]]
+    return results
+
+
+def _success(conn, result):
+    """Returns ``True`` if the operation returning ``result`` succeeded on
+    ``conn`` using any client strategy."""
+    if conn.strategy.thread_safe:
+        return result[0]
+    if conn.strategy.sync:
+        return result
+    return conn.get_response(result)[1]["result"] == RESULT_SUCCESS
+
+
+def _read_entry(conn, dn, attributes):
+    """Returns the responses of reading ``attributes`` of ``dn`` with the
+    automatic range retrieval and empty attributes of ``conn`` disabled,
+    which are not applicable to explicitly requested ranges."""
+    options = conn.auto_range, conn.empty_attributes
+
+    def search():
+        conn.auto_range = conn.empty_attributes = False
+        try:
+            result = conn.search(dn, "(objectClass=*)", BASE,
+                                 attributes=attributes)
+            if conn.strategy.thread_safe:
+                return result[2]
+            if conn.strategy.sync:
+                return conn.response
+            return conn.get_response(result)[0]
+        finally:
+            conn.auto_range, conn.empty_attributes = options
+
+    if conn.strategy.sync:
+        with conn.connection_lock:
+            return search()
+    # the receiver thread of asynchronous strategies acquires the lock
+    return search()
+
+
+def _result_code(conn, result):
+    """Returns the result code of the operation returning ``result`` on
+    ``conn`` using a synchronous strategy."""
+    if conn.strategy.thread_safe:
+        return result[1]["result"]
+    return conn.result["result"]
+
+
+def _perform(conn, operation, args, limiter, retries):
+    """Performs ``operation`` on ``conn`` using a synchronous strategy
+    within the limit of ``limiter`` and returns ``True`` if it succeeded."""
+    for _ in range(retries + 1):
+        limiter.acquire()
+        start = default_timer()
+        code = None
+        try:
+            code = _result_code(conn, getattr(conn, operation)(*args))
+        finally:
+            if code is None:
+                limiter.cancel()
+            else:
+                limiter.release(default_timer() - start, code in OVERLOADED)
+        if code not in OVERLOADED:
+            return code == RESULT_SUCCESS
+    return False
+
+
+def _threaded(conn, requests, limiter, retries, stop_on_failure):
+    limit = current()  # deadlines are bound to the calling thread
+    failed = []
+
+    def perform(request):
+        if stop_on_failure and failed:
+            return False
+        with deadline(limit):
+            success = _perform(conn, request[0], request[1], limiter,
+                               retries)
+        if not success:
+            failed.append(request)
+        return success
+
+    pool = ThreadPool(min(limiter.max_limit, len(requests)))
+    try:
+        return pool.map(perform, requests)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _pipelined(conn, requests, limiter, retries, stop_on_failure):
+    results = [False] * len(requests)
+    pending = deque((index, 0) for index in range(len(requests)))
+    inflight = deque()  # (index, attempt, message id, start)
+    failed = False
+    try:
+        while pending or inflight:
+            # waits for a free slot if no own request is outstanding
+            while pending and not (stop_on_failure and failed) and \
+                    limiter.acquire(blocking=not inflight):
+                index, attempt = pending.popleft()
+                operation, args = requests[index]
+                try:
+                    msgid = getattr(conn, operation)(*args)
+                except Exception:
+                    limiter.cancel()
+                    raise
+                inflight.append((index, attempt, msgid, default_timer()))
+            if not inflight:
+                break
+            index, attempt, msgid, start = inflight.popleft()
+            code = None
+            try:
+                code = conn.get_response(msgid)[1]["result"]
+            finally:
+                if code is None:
+                    limiter.cancel()
+                else:
+                    limiter.release(default_timer() - start,
+                                    code in OVERLOADED)
+            if code in OVERLOADED and attempt < retries:
+                pending.append((index, attempt + 1))
+            else:
+                results[index] = code == RESULT_SUCCESS
+                failed = failed or not results[index]
+    finally:
+        for _, _, msgid, _ in inflight:
+            conn.abandon(msgid)
+            limiter.cancel()
+    return results
+
+
+def pipeline(conn, requests, limiter, retries=RETRIES,
+             stop_on_failure=False):
+    """Performs all ``requests``, a list of ``(operation, args)`` tuples,
+    e.g. ``("delete", (dn,))``, keeping the number of outstanding requests
+    within the limit of ``limiter``, which is an
+    :py:class:`~ldap3_orm.limiter.AdaptiveLimiter`.
+
+    Requests are pipelined if ``conn`` uses an asynchronous strategy and
+    sent from a pool of ``limiter.max_limit`` threads if ``conn`` uses a
+    thread safe strategy. Otherwise all requests are sent one after another.
+    Requests refused by an overloaded server are retried up to ``retries``
+    times. No further requests are sent after a request failed if
+    ``stop_on_failure`` is set. Outstanding requests are abandoned if a
+    request exceeds its deadline.
+
+    Returns a list of flags whether each request succeeded.
+
+    """
+    requests = list(requests)
+    if not requests:
+        return []
+    if conn.strategy.thread_safe:
+        return _threaded(conn, requests, limiter, retries, stop_on_failure)
+    if conn.strategy.sync:
+        results = []
+        for operation, args in requests:
+            if stop_on_failure and not all(results):
+                results.append(False)
+                continue
+            results.append(_perform(conn, operation, args, limiter,
+                                    retries))
+        return results
+    return _pipelined(conn, requests, limiter, retries, stop_on_failure)
+
+
+def iter_values(conn, dn, attr, range_size=RANGE_SIZE, timeout=None):
+    """Yields the values of the multi-valued attribute ``attr`` of ``dn``
+    without holding all of them in memory if the server supports range
+    retrieval.
+
+    The first request reads ``attr`` which returns all values if the server
+    does not support range retrieval or the first range of values, e.g.
+    ``member;range=0-1499``, otherwise. Further values are read in ranges
+    of ``range_size`` values following the range returned by the server,
+    which may return smaller ranges than requested. Nothing is yielded if
+    ``dn`` or ``attr`` do not exist.
+
+    All ranges are read within ``timeout`` seconds in total, see
+    :py:func:`ldap3_orm.deadline.iter_within`.
+
+    """
+    values = _iter_values(conn, dn, attr, range_size)
+    return values if timeout is None else iter_within(values, timeout)
+
+
+def _iter_values(conn, dn, attr, range_size):
+    attributes = [attr]
+    while True:
+        try:
+            responses = _read_entry(conn, dn, attributes)
+        except LDAPNoSuchObjectResult:
+            return
+        entries = [response for response in responses or []
+                   if response["type"] == "searchResEntry"]
+        high = None
+        for name, values in (entries[0]["attributes"].items()
+                             if entries else ()):
+            attr_type, _, returned_range = name.partition(";range=")
+            if attr_type.lower() != attr.lower():
+                continue
+            high = returned_range.partition('-')[2] or '*'
+            for value in values:
+                yield value
+        if high is None or high == '*':
+            return
+        low = int(high) + 1
+        attributes = ["{};range={}-{}".format(attr, low,
+                                              low + range_size - 1)]
+
+
+def modify_values(conn, dn, attr, add=(), delete=(),
+                  batch_size=MODIFY_BATCH_SIZE, timeout=None, limiter=None):
+    """Adds the values ``add`` to and deletes the values ``delete`` from the
+    multi-valued attribute ``attr`` of ``dn`` using modify requests of at
+    most ``batch_size`` values each. Values are added first, thus attributes
+    requiring a value, e.g. ``member`` of ``groupOfNames``, are never emptied
+    while all of their values are replaced.
+
+    The requests are sent concurrently using :py:func:`pipeline` within the
+    limit of ``limiter``, an :py:class:`~ldap3_orm.limiter.AdaptiveLimiter`
+    allowing up to :py:data:`MODIFY_WORKERS` outstanding requests by
+    default.
+
+    Returns ``True`` if all requests succeeded. No further requests are sent
+    after a request failed. All requests are performed within ``timeout``
+    seconds in total, see :py:func:`ldap3_orm.deadline.deadline`.
+
+    """
+    if limiter is None:
+        limiter = AdaptiveLimiter(max_limit=MODIFY_WORKERS)
+    with deadline(timeout):
+        for operation, values in ((MODIFY_ADD, add),
+                                  (MODIFY_DELETE, delete)):
+            values = list(values)
+            requests = [("modify", (dn, {attr: [(
+                operation, values[start:start + batch_size])]}))
+                for start in range(0, len(values), batch_size)]
+            if not all(pipeline(conn, requests, limiter,
+                                stop_on_failure=True)):
+                return False
+    return True
+
+
+def write_values(conn, dn, attr, values, key=None, range_size=RANGE_SIZE,
+                 batch_size=MODIFY_BATCH_SIZE, timeout=None, limiter=None):
+    """Replaces the values of the multi-valued attribute ``attr`` of ``dn``
+    by ``values`` sending just the differences.
+
+    The current values are read using :py:func:`iter_values` and compared
+    with ``values`` using ``key``, e.g. :py:func:`dn_key` for attributes
+    holding DNs. The values added and deleted are written using
+    :py:func:`modify_values` within the limit of ``limiter``, instead of
+    replacing all values in a single request. Returns ``True`` if all
+    requests succeeded. Reading and writing is performed within ``timeout``
+    seconds in total.
+
+    """
+    target = OrderedDict((key(value) if key else value, value)
+                         for value in values)
+    delete = []
+    with deadline(timeout):
+        for value in iter_values(conn, dn, attr, range_size):
+            if target.pop(key(value) if key else value, None) is None:
+                delete.append(value)
+        return modify_values(conn, dn, attr, list(target.values()), delete,
+                             batch_size, limiter=limiter)
+
+
+def depth(dn):
+    """Returns the number of RDNs of ``dn``."""
+    return sum(1 for _, _, separator in parse_dn(dn) if separator != '+')
+
+
+def _delete_level(conn, dns, limiter):
+    """Deletes all ``dns`` of the same level concurrently and returns the
+    DNs which could not be deleted."""
+    results = pipeline(conn, [("delete", (dn,)) for dn in dns], limiter)
+    return [dn for dn, success in zip(dns, results) if not success]
+
+
+def delete_tree(conn, dn, workers=DELETE_WORKERS,
+                page_size=DELETE_PAGE_SIZE, timeout=None, limiter=None):
+    """Deletes the entry ``dn`` including all of its subordinate entries.
+
+    The tree delete control is used if the server supports it, which deletes
+    the whole subtree using a single request. Otherwise all DNs of the subtree
+    are read using a paged search requesting no attributes and grouped by
+    their depth. The levels are deleted leaf-first, where the entries of each
+    level are deleted concurrently using :py:func:`pipeline` within the limit
+    of ``limiter``, an :py:class:`~ldap3_orm.limiter.AdaptiveLimiter`
+    allowing up to ``workers`` outstanding requests by default.
+
+    Returns ``True`` if all entries have been deleted. Deleting stops at the
+    first level which could not be deleted completely, since the entries of
+    all upper levels still have subordinates in this case.
+
+    All requests including the paged search are performed within ``timeout``
+    seconds in total, see :py:func:`ldap3_orm.deadline.deadline`. Entries
+    deleted before the deadline expired remain deleted.
+
+    """
+    if limiter is None:
+        limiter = AdaptiveLimiter(max_limit=workers)
+    with deadline(timeout):
+        return _delete_tree(conn, dn, limiter, page_size)
+
+
+def _delete_tree(conn, dn, limiter, page_size):
+    if TREE_DELETE_CONTROL in supported_controls(conn):
+        return _success(conn, conn.delete(
+            dn, controls=[(TREE_DELETE_CONTROL, True, None)]))
+    levels = {}
+    responses = conn.extend.standard.paged_search(
+        dn, "(objectClass=*)", SUBTREE, attributes=NO_ATTRIBUTES,
+        paged_size=page_size, generator=True)
+    for response in responses:
+        if response["type"] == "searchResEntry":
+            levels.setdefault(depth(response["dn"]), []).append(
+                response["dn"])
+    if not levels:
+        return False
+    for level in sorted(levels, reverse=True):
+        if _delete_level(conn, levels[level], limiter):
+            return False
+    return True
+
+
+def add_many(conn, entries, workers=ADD_WORKERS, timeout=None, limiter=None):
+    """Creates all ``entries``, which are instances of ORM models derived
+    from :py:class:`~ldap3_orm.entry.EntryBase`, in the LDAP.
+
+    The entries are grouped by the depth of their DNs and the levels are
+    added top-down, thus parents are created before their subordinates.
+    The entries of each level are added concurrently using
+    :py:func:`pipeline` within the limit of ``limiter``, an
+    :py:class:`~ldap3_orm.limiter.AdaptiveLimiter` allowing up to
+    ``workers`` outstanding requests by default. Pass a shared limiter in
+    order to keep the limit learned across several calls.
+
+    Returns the list of entries which could not be added. All requests are
+    performed within ``timeout`` seconds in total, see
+    :py:func:`ldap3_orm.deadline.deadline`.
+
+    """
+    if limiter is None:
+        limiter = AdaptiveLimiter(max_limit=workers)
+    levels = {}
+    for entry in entries:
+        levels.setdefault(depth(entry.entry_dn), []).append(entry)
+    failed = []
+    with deadline(timeout):
+        for level in sorted(levels):
+            entries = levels[level]
+            results = pipeline(conn, [
+                ("add", (entry.entry_dn, entry.object_classes,
+                         entry.entry_attributes_as_dict))
+                for entry in entries], limiter)
+            failed += [entry for entry, success in zip(entries, results)
+                       if not success]
+    return failed
@@ -0,0 +1,236 @@
+# coding: utf-8
+
+from __future__ import print_function
+
+import argparse
+import keyword
+import re
+import sys
+import textwrap
+from getpass import getpass
+
+from ldap3 import Connection, SCHEMA, Server
+from ldap3.protocol.rfc4512 import SchemaInfo
+from ldap3.utils.ciDict import CaseInsensitiveDict
+from ldap3_orm.pycompat import iteritems
+from ldap3_orm.utils import fmt_class_name
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+_HEADER = '''\
+# coding: utf-8
+"""ORM models generated by ldap3-orm-codegen {version}.
+
+Do not edit, regenerate this module from the schema instead.
+
+"""
+
+from ldap3_orm import AttrDef, EntryBase
+'''
+
+
+def identifier(name):
+    """Returns a valid python identifier for the ldap attribute ``name``."""
+    name = re.sub(r"\W", '_', name)
+    if not re.match(r"^[^\d\W]", name) or keyword.iskeyword(name):
+        name += '_'
+    return name
+
+
+def _object_classes(schema, object_classes):
+    """Returns the schema definitions of ``object_classes`` and all of their
+    superior object classes."""
+    definitions = CaseInsensitiveDict()
+    pending = list(object_classes)
+    while pending:
+        name = pending.pop(0)
+        if name in definitions:
+            continue
+        if name not in schema.object_classes:
+            raise KeyError("Object class '%s' is not defined in schema"
+                           % name)
+        definition = schema.object_classes[name]
+        definitions[name] = definition
+        pending += definition.superior or []
+    return list(definitions.values())
+
+
+def _attribute_types(schema, object_classes):
+    """Returns a dictionary mapping the names of all attribute types of
+    ``object_classes`` to their mandatory flag."""
+    attributes = CaseInsensitiveDict()
+    for definition in _object_classes(schema, object_classes):
+        for name in definition.must_contain or []:
+            attributes[name] = True
+        for name in definition.may_contain or []:
+            if name not in attributes:
+                attributes[name] = False
+    attributes.pop("objectClass", None)
+    return attributes
+
+
+def _attrdef(schema, name, mandatory):
+    attribute_type = schema.attribute_types.get(name)
+    args = [repr(str(attribute_type.name[0] if attribute_type else name))]
+    if attribute_type is not None and len(attribute_type.name) > 1:
+        args.append("alias={!r}".format([str(alias) for alias in
+                                         attribute_type.name[1:]]))
+    if not mandatory:
+        args.append("mandatory=False")
+    if attribute_type is not None and attribute_type.single_value:
+        args.append("single_value=True")
+    return args
+
+
+def _assignment(key, args):
+    line = "    {} = AttrDef({})".format(key, ", ".join(args))
+    if len(line) <= 79:
+        return line
+    # one argument per line aligned with the opening parenthesis
+    indent = ' ' * len("    {} = AttrDef(".format(key))
+    return "    {} = AttrDef({})".format(key, (",\n" + indent).join(args))
+
+
+def generate_model(schema, object_classes, dn, class_name=None):
+    """Returns the source code of an ORM model derived from
+    :py:class:`~ldap3_orm.entry.EntryBase` for ``object_classes`` including
+    all attributes of their superior object classes defined in ``schema``,
+    which is a :py:class:`~ldap3.protocol.rfc4512.SchemaInfo`.
+
+    The generated model is equivalent to the model created by
+    :py:func:`~ldap3_orm.entry.EntryType`, except that attributes whose
+    names are not valid python identifiers are renamed using
+    :py:func:`identifier`.
+
+    """
+    if not isinstance(object_classes, (list, tuple)):
+        object_classes = [object_classes]
+    lines = ["class {}(EntryBase):".format(
+        class_name or identifier(fmt_class_name(list(object_classes))))]
+    descriptions = [definition.description for definition in
+                    _object_classes(schema, object_classes[:1])[:1]
+                    if definition.description]
+    if descriptions:
+        lines.append('    """{}"""'.format(
+            descriptions[0].replace('\\', "\\\\").replace('"', '\\"')))
+        lines.append('')
+    lines.append("    dn = {!r}".format(str(dn)))
+    lines.append("    object_classes = {!r}".format(
+        [str(object_class) for object_class in object_classes]))
+    lines.append('')
+    attributes = _attribute_types(schema, object_classes)
+    # mandatory attributes first
+    for name, mandatory in sorted(iteritems(attributes),
+                                  key=lambda item: (not item[1],
+                                                    item[0].lower())):
+        attribute_type = schema.attribute_types.get(name)
+        if attribute_type is not None and attribute_type.description:
+            lines += textwrap.wrap(str(attribute_type.description), 79,
+                                   initial_indent="    # ",
+                                   subsequent_indent="    # ")
+        lines.append(_assignment(identifier(name),
+                                 _attrdef(schema, name, mandatory)))
+    return "\n".join(lines) + "\n"
+
+
+def generate_module(schema, models):
+    """Returns the source code of a python module defining ORM models for
+    all ``models``, which is a list of ``(object_classes, dn)`` tuples,
+    using :py:func:`generate_model`."""
+    return "\n\n".join([_HEADER.format(version=__version__)] + [
+        generate_model(schema, object_classes, dn)
+        for object_classes, dn in models])
+
+
+def _model(spec):
+    if '=' not in spec:
+        raise argparse.ArgumentTypeError(
+            "'%s' is not in the form OBJECTCLASS[,OBJECTCLASS...]=DN" % spec)
+    object_classes, dn = spec.split('=', 1)
+    return object_classes.split(','), dn
+
+
+def create_parser():
+    parser = argparse.ArgumentParser(
+        description="Generate ldap3-orm models from an LDAP schema",
+        epilog=textwrap.dedent('''\
+        The schema is either read from the LDAP server given by --url or
+        from a JSON file previously written by --dump-schema or
+        ldap3.Server.schema.to_file, e.g.
+
+            ldap3-orm-codegen --url ldaps://example.com \\
+                --dump-schema schema.json
+            ldap3-orm-codegen --schema schema.json -o models.py \\
+                --model "inetOrgPerson=uid={uid},ou=People,dc=example,dc=com"
+        '''),
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--url", help="url of the LDAP server")
+    source.add_argument("--schema", type=argparse.FileType('r'),
+                        help="JSON file containing the schema")
+    parser.add_argument("-u", "--username", help="DN used for binding")
+    parser.add_argument("-p", "--password", help="password used for binding")
+    parser.add_argument("--dump-schema", metavar="FILE",
+                        help="write the schema read from the server to FILE")
+    parser.add_argument("-m", "--model", type=_model, action="append",
+                        default=[], metavar="OBJECTCLASS[,...]=DN",
+                        help="object classes and DN template of a model, "
+                             "can be given multiple times")
+    parser.add_argument("-o", "--output", type=argparse.FileType('w'),
+                        default=sys.stdout,
+                        help="output file (default: stdout)")
+    return parser
+
+
+def read_schema(url, username=None, password=None):
+    """Returns the :py:class:`~ldap3.protocol.rfc4512.SchemaInfo` read from
+    the LDAP server ``url``."""
+    server = Server(url, get_info=SCHEMA)
+    conn = Connection(server, user=username, password=password,
+                      auto_bind=True)
+    conn.unbind()
+    return server.schema
+
+
+def main(argv):
+    ns = create_parser().parse_args(argv[1:])
+    if ns.schema:
+        schema = SchemaInfo.from_json(ns.schema.read())
+    else:
+        password = ns.password
+        if ns.username and password is None:
+            password = getpass("Password for '%s': " % ns.username)
+        schema = read_schema(ns.url, ns.username, password)
+        if ns.dump_schema:
+            schema.to_file(ns.dump_schema)
+    if not ns.model:
+        if not ns.dump_schema:
+            print("No models given, use --model.", file=sys.stderr)
+            return 1
+        return 0
+    ns.output.write(generate_module(schema, ns.model))
+    return 0
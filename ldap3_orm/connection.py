@@ -38,4 +38,7 @@ along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
 """
 
 
-conn = create_connection(config.url, config.connconfig)
+conn = create_connection(config.url, config.connconfig,
+                         write_url=config.write_url)
+if conn.indexed_attributes is None:
+    conn.indexed_attributes = config.userconfig.get("indexed_attributes")
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+from pyasn1.type.namedtype import NamedTypes, NamedType, OptionalNamedType, \
+    DefaultedNamedType
+from pyasn1.type.tag import Tag, tagClassContext, tagFormatConstructed, \
+    tagFormatSimple
+from pyasn1.type.univ import Boolean, Choice, Integer, OctetString, \
+    Sequence, SequenceOf
+from ldap3.protocol.controls import build_control
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+SORT_CONTROL = "1.2.840.113556.1.4.473"
+VLV_CONTROL = "2.16.840.1.113730.3.4.9"
+TREE_DELETE_CONTROL = "1.2.840.113556.1.4.805"
+PAGED_SEARCH_CONTROL = "1.2.840.113556.1.4.319"
+
+
+class SortKey(Sequence):
+    # SortKey ::= SEQUENCE {
+    #     attributeType   AttributeDescription,
+    #     orderingRule    [0] MatchingRuleId OPTIONAL,
+    #     reverseOrder    [1] BOOLEAN DEFAULT FALSE }
+    componentType = NamedTypes(
+        NamedType('attributeType', OctetString()),
+        OptionalNamedType('orderingRule', OctetString().subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 0))),
+        DefaultedNamedType('reverseOrder', Boolean(False).subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 1))),
+    )
+
+
+class SortKeyList(SequenceOf):
+    # SortKeyList ::= SEQUENCE OF SortKey
+    componentType = SortKey()
+
+
+class ByOffset(Sequence):
+    # byOffset [0] SEQUENCE {
+    #     offset          INTEGER (1 .. maxInt),
+    #     contentCount    INTEGER (0 .. maxInt) }
+    tagSet = Sequence.tagSet.tagImplicitly(
+        Tag(tagClassContext, tagFormatConstructed, 0))
+    componentType = NamedTypes(
+        NamedType('offset', Integer()),
+        NamedType('contentCount', Integer()),
+    )
+
+
+class Target(Choice):
+    # target CHOICE {
+    #     byOffset            [0] SEQUENCE { ... },
+    #     greaterThanOrEqual  [1] AssertionValue }
+    componentType = NamedTypes(
+        NamedType('byOffset', ByOffset()),
+        NamedType('greaterThanOrEqual', OctetString().subtype(
+            implicitTag=Tag(tagClassContext, tagFormatSimple, 1))),
+    )
+
+
+class VirtualListViewRequest(Sequence):
+    # VirtualListViewRequest ::= SEQUENCE {
+    #     beforeCount    INTEGER (0..maxInt),
+    #     afterCount     INTEGER (0..maxInt),
+    #     target         CHOICE { ... },
+    #     contextID      OCTET STRING OPTIONAL }
+    componentType = NamedTypes(
+        NamedType('beforeCount', Integer()),
+        NamedType('afterCount', Integer()),
+        NamedType('target', Target()),
+        OptionalNamedType('contextID', OctetString()),
+    )
+
+
+def sort_control(sort_keys, criticality=False):
+    """Returns a server side sort request control as defined in RFC 2891.
+
+    ``sort_keys`` is a sequence of ``(attribute, reverse)`` tuples.
+
+    """
+    control_value = SortKeyList()
+    for idx, (attribute, reverse) in enumerate(sort_keys):
+        sort_key = SortKey()
+        sort_key.setComponentByName('attributeType', attribute)
+        if reverse:
+            sort_key.setComponentByName('reverseOrder', True)
+        control_value.setComponentByPosition(idx, sort_key)
+    return build_control(SORT_CONTROL, criticality, control_value)
+
+
+def vlv_control(offset, count, content_count=0, context_id=None,
+                criticality=False):
+    """Returns a virtual list view request control as defined in
+    draft-ietf-ldapext-ldapv3-vlv requesting ``count`` entries starting
+    at the zero-based ``offset`` of the sorted result set."""
+    target = Target()
+    by_offset = target.getComponentByName('byOffset')
+    by_offset.setComponentByName('offset', offset + 1)
+    by_offset.setComponentByName('contentCount', content_count)
+    control_value = VirtualListViewRequest()
+    control_value.setComponentByName('beforeCount', 0)
+    control_value.setComponentByName('afterCount', max(count - 1, 0))
+    control_value.setComponentByName('target', target)
+    if context_id is not None:
+        control_value.setComponentByName('contextID', context_id)
+    return build_control(VLV_CONTROL, criticality, control_value)
+
+
+def supported_controls(conn):
+    """Returns the set of control OIDs advertised in the root DSE of the
+    server ``conn`` is connected to or an empty set if the server
+    information has not been read."""
+    info = conn.server.info
+    if info is None or not info.supported_controls:
+        return set()
+    return set(control[0] for control in info.supported_controls)
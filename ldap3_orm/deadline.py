@@ -0,0 +1,132 @@
+# coding: utf-8
+
+from contextlib import contextmanager
+from threading import local
+from timeit import default_timer
+
+from ldap3.core.exceptions import LDAPResponseTimeoutError
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+_local = local()
+
+
+class Deadline(object):
+    """Point in time ``timeout`` seconds from now after which operations
+    are abandoned."""
+
+    __slots__ = ("timeout", "expiry")
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.expiry = default_timer() + timeout
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self.timeout)
+
+    @property
+    def expired(self):
+        return self.expiry <= default_timer()
+
+    def error(self):
+        """Returns the exception raised by operations exceeding this
+        deadline."""
+        return LDAPResponseTimeoutError("deadline of %s seconds exceeded"
+                                        % self.timeout)
+
+    def remaining(self):
+        """Returns the remaining seconds or raises
+        :py:class:`~ldap3.core.exceptions.LDAPResponseTimeoutError` if this
+        deadline has expired."""
+        remaining = self.expiry - default_timer()
+        if remaining <= 0:
+            raise self.error()
+        return remaining
+
+    def time_limit(self):
+        """Returns the remaining time in whole seconds, which is used as
+        time limit of searches processed by the server."""
+        return max(1, int(self.remaining() + 0.999))
+
+
+def current():
+    """Returns the :py:class:`Deadline` of the current thread or ``None``."""
+    return getattr(_local, "deadline", None)
+
+
+@contextmanager
+def deadline(timeout):
+    """Limits all operations of the current thread within the ``with`` block
+    to ``timeout`` seconds in total, e.g.::
+
+        >>> with deadline(2.5):
+        ...     users = User.search().all()
+        ...     groups = Group.search().all()
+
+    ``timeout`` is either a number of seconds or a :py:class:`Deadline`,
+    which allows passing the remaining time of an operation on to the
+    operations it consists of. The earlier deadline applies if deadlines are
+    nested, ``None`` keeps the deadline of the enclosing block. The active
+    :py:class:`Deadline` or ``None`` is bound to the ``as`` target.
+
+    Operations of :py:class:`ldap3_orm.Connection
+    <ldap3_orm._connection.Connection>` which are started after the
+    deadline has expired or have not been answered in time raise
+    :py:class:`~ldap3.core.exceptions.LDAPResponseTimeoutError`.
+
+    """
+    outer = current()
+    inner = outer
+    if timeout is not None:
+        inner = timeout if isinstance(timeout, Deadline) else \
+            Deadline(timeout)
+        if outer is not None and outer.expiry < inner.expiry:
+            inner = outer
+    _local.deadline = inner
+    try:
+        yield inner
+    finally:
+        _local.deadline = outer
+
+
+def iter_within(iterable, timeout):
+    """Yields the items of ``iterable``, e.g. a generator of search
+    responses, retrieving all of them within ``timeout`` seconds.
+
+    The deadline starts on retrieving the first item and is active just
+    while items are retrieved, not while the caller processes them.
+
+    """
+    iterator = iter(iterable)
+    limit = timeout
+    while True:
+        with deadline(limit) as limit:
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
@@ -1,20 +1,30 @@
 # coding: utf-8
 
+import re
 import textwrap
+from datetime import datetime
+from itertools import islice
+from string import Formatter
 
-from ldap3 import Attribute
+from ldap3 import Attribute, SEQUENCE_TYPES
 from ldap3 import Entry as _Entry
+from ldap3.abstract import STATUS_READ as _STATUS_READ
 from ldap3.abstract import STATUS_WRITABLE as _STATUS_WRITEABLE
 from ldap3.abstract.entry import EntryState as _EntryState
 from ldap3.core.exceptions import LDAPCursorError
-from ldap3.utils.ciDict import CaseInsensitiveWithAliasDict
+from ldap3.utils.ciDict import CaseInsensitiveDict, \
+    CaseInsensitiveWithAliasDict
 from ldap3.utils.dn import safe_dn
 
-from ldap3_orm.attribute import AttrDef, OperatorAttrDef
+from ldap3_orm.attribute import AttrDef, OperatorAttrDef, ReferenceAttrDef
+from ldap3_orm.build import BUILD_CHUNK_SIZE, build_many
+from ldap3_orm.bulk import MODIFY_BATCH_SIZE, RANGE_SIZE, dn_key, \
+    get_many, iter_values, write_values
 from ldap3_orm.objectDef import ObjectDef
-from ldap3_orm.pycompat import add_metaclass, iteritems
+from ldap3_orm.pycompat import add_metaclass, iteritems, itervalues
 from ldap3_orm.parameter import Parameter, ParamDef
-from ldap3_orm.utils import fmt_class_name, tolist
+from ldap3_orm.query import Query
+from ldap3_orm.utils import attribute_name, fmt_class_name, tolist
 # pylint: disable=unused-import
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
@@ -42,11 +52,211 @@ along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
 """
 
 
+class _DummyCursor(object):  # needed for _EntryState
+
+    def __init__(self, object_def):
+        self.definition = object_def
+
+
+class _KeyTable(object):
+    """Case-folded key and alias tables of the ``attrdefs`` of an ORM model
+    created once per class in :py:class:`EntryMeta`."""
+
+    __slots__ = ("keymap", "aliases", "alias_keymap")
+
+    def __init__(self, attrdefs):
+        ci_key = CaseInsensitiveDict._ci_key
+        self.keymap = dict((ci_key(attrdef.key), attrdef.key)
+                           for attrdef in attrdefs)
+        self.aliases = {}
+        self.alias_keymap = {}
+        for attrdef in attrdefs:
+            for alias in attrdef.other_names or []:
+                ci_alias = ci_key(alias)
+                if ci_alias in self.keymap or ci_alias in self.aliases:
+                    continue
+                self.aliases[ci_alias] = ci_key(attrdef.key)
+                self.alias_keymap.setdefault(ci_key(attrdef.key),
+                                             []).append(ci_alias)
+
+
+class _SharedKeyDict(CaseInsensitiveWithAliasDict):
+    """:py:class:`~ldap3.utils.ciDict.CaseInsensitiveWithAliasDict` sharing
+    the key and alias tables of a :py:class:`_KeyTable` with all other
+    instances created from the same table. Thus each instance only stores
+    its values. The tables are copied on write if keys or aliases not
+    contained in the shared tables are added or keys are removed."""
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, table):
+        self._store = {}
+        self._case_insensitive_keymap = table.keymap
+        self._aliases = table.aliases
+        self._alias_keymap = table.alias_keymap
+        self._shared = True
+
+    def _unshare(self):
+        if self._shared:
+            self._case_insensitive_keymap = dict(
+                self._case_insensitive_keymap)
+            self._aliases = dict(self._aliases)
+            self._alias_keymap = dict((key, list(aliases)) for key, aliases
+                                      in iteritems(self._alias_keymap))
+            self._shared = False
+
+    def __setitem__(self, key, value):
+        if self._shared:
+            if isinstance(key, SEQUENCE_TYPES):
+                self._unshare()
+            else:
+                ci_key = self._ci_key(key)
+                if ci_key in self._case_insensitive_keymap:
+                    self._store[self._case_insensitive_keymap[ci_key]] = value
+                    return
+                if ci_key not in self._aliases:
+                    self._unshare()
+        CaseInsensitiveWithAliasDict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._unshare()
+        CaseInsensitiveWithAliasDict.__delitem__(self, key)
+
+    def set_alias(self, key, alias, ignore_duplicates=False):
+        if self._shared:
+            ci_key = self._ci_key(key)
+            aliases = alias if isinstance(alias, SEQUENCE_TYPES) else [alias]
+            if all(self._aliases.get(self._ci_key(name)) == ci_key
+                   for name in aliases):
+                return
+            self._unshare()
+        CaseInsensitiveWithAliasDict.set_alias(self, key, alias,
+                                               ignore_duplicates)
+
+    def remove_alias(self, alias):
+        self._unshare()
+        CaseInsensitiveWithAliasDict.remove_alias(self, alias)
+
+    def copy(self):
+        """Returns a shallow copy of this dictionary sharing the key and
+        alias tables, which are copied on write by either dictionary."""
+        other = self.__class__.__new__(self.__class__)
+        other.__dict__.update(self.__dict__)
+        other._store = dict(self._store)
+        self._shared = other._shared = True
+        return other
+
+
+def _value(value):
+    """Returns the single value or the list of values of an attribute
+    assigned ``value`` like :py:attr:`ldap3.Attribute.value
+    <ldap3.abstract.attribute.Attribute.value>`."""
+    values = tolist(value)
+    return values[0] if len(values) == 1 else values or None
+
+
+def _validate(attrdef, value):
+    """Raises :py:exc:`TypeError` if the validator of ``attrdef`` denies
+    ``value``."""
+    if not attrdef.validate(value):
+        raise TypeError("Validation failed for attribute '%s' "
+                        "and value '%s'" % (attrdef.key, value))
+
+
+class _RowBuilder(object):
+    """Creates instances of ``model`` from rows of values of ``columns``,
+    which are keyword arguments of ``model``. The attribute definitions,
+    defaults and the class attributes expanded in the DN template are
+    resolved once for all rows."""
+
+    def __init__(self, model, columns):
+        if model.dn is None:
+            raise NotImplementedError("%s must set the 'dn' attribute"
+                                      % model)
+        attrdefs = dict(model._attrdefs)
+        self.model = model
+        self.attrdefs = []
+        for column in columns:
+            if column not in attrdefs:
+                raise TypeError("%s got an unexpected column '%s'"
+                                % (model.__name__, column))
+            self.attrdefs.append(attrdefs.pop(column))
+        self.defaults = []
+        for key in list(attrdefs):
+            attrdef = attrdefs[key]
+            if attrdef.default != NotImplemented:
+                if attrdef.validate:
+                    _validate(attrdef, _value(attrdef.default))
+                self.defaults.append((attrdef, attrdef.default))
+                del attrdefs[key]
+            elif not attrdef.mandatory:
+                del attrdefs[key]
+        if attrdefs:
+            s = " '" if len(attrdefs) == 1 else "s '"
+            raise TypeError("%s missing the following column" %
+                            model.__name__ + s + ", ".join(attrdefs.keys()) +
+                            "'")
+        self.fmtdict = dict((k, getattr(model, k)) for k in dir(model))
+        self.definition = model._shared_object_def()
+
+    def validate(self, columns):
+        """Validates the lists of values of all ``columns`` column by
+        column."""
+        for attrdef, values in zip(self.attrdefs, columns):
+            if attrdef.validate:
+                for value in values:
+                    _validate(attrdef, _value(value))
+
+    def build(self, row):
+        """Returns an instance of the model from the validated ``row``."""
+        entry = self.model.__new__(self.model)
+        state = EntryState(None, _DummyCursor(self.definition), self.model)
+        entry.__dict__["_state"] = state
+        for attrdef, value in zip(self.attrdefs, row):
+            entry._create_attribute_or_parameter(attrdef, value,
+                                                 validate=False)
+        for attrdef, value in self.defaults:
+            entry._create_attribute_or_parameter(attrdef, value,
+                                                 validate=False)
+        fmtdict = dict(self.fmtdict)
+        fmtdict.update(state.attributes)
+        fmtdict.update(state.parameters)
+        state.dn = safe_dn(self.model.dn.format(**fmtdict))
+        state.set_status(_STATUS_WRITEABLE)
+        return entry
+
+    def build_columns(self, columns):
+        """Validates ``columns`` and yields the instances of all rows."""
+        self.validate(columns)
+        for row in zip(*columns):
+            yield self.build(row)
+
+    def build_records(self, records, batch_size):
+        """Yields the instances of all ``records`` transposed to columns in
+        batches of ``batch_size``."""
+        records = iter(records)
+        batch = list(islice(records, batch_size))
+        while batch:
+            for record in batch:
+                if len(record) != len(self.attrdefs):
+                    raise ValueError("record %r does not match the %d "
+                                     "columns" % (record, len(self.attrdefs)))
+            for entry in self.build_columns(list(zip(*batch))):
+                yield entry
+            batch = list(islice(records, batch_size))
+
+
 class EntryState(_EntryState):
 
-    def __init__(self, *args, **kwargs):
-        _EntryState.__init__(self, *args, **kwargs)
-        self.parameters = CaseInsensitiveWithAliasDict()
+    def __init__(self, dn, cursor, model=None):
+        _EntryState.__init__(self, dn, cursor)
+        if model is None:
+            self.parameters = CaseInsensitiveWithAliasDict()
+        else:
+            # pylint: disable=protected-access
+            self.attributes = _SharedKeyDict(model._attribute_keys)
+            self.raw_attributes = _SharedKeyDict(model._attribute_keys)
+            self.parameters = _SharedKeyDict(model._parameter_keys)
+        self.references = CaseInsensitiveDict()
 
     @property
     def defintion(self):
@@ -84,6 +294,15 @@ class EntryMeta(type):
         # update object_classes for current class
         newobjclss.update(set(cls.object_classes))
         cls.object_classes = newobjclss
+        # key and alias tables shared by all instances of this class
+        attrdefs = list(itervalues(newattrdefs))
+        cls._attribute_keys = _KeyTable([attrdef for attrdef in attrdefs
+                                         if not isinstance(attrdef,
+                                                           ParamDef)])
+        cls._parameter_keys = _KeyTable([attrdef for attrdef in attrdefs
+                                         if isinstance(attrdef, ParamDef)])
+        cls._definition = None
+        cls._dn_fields = None
 
     def __getattr__(cls, key):
         if "_attrdefs" in cls.__dict__:
@@ -173,6 +392,12 @@ class EntryBase(_Entry):
     attribute as argument. The *callable* must return a boolean allowing or
     denying the validation or raise an exception.
 
+    Entries can be pickled, e.g. in order to pass them to other processes or
+    to store them in caches. Just the class, the DN, the status and the values
+    of all attributes and parameters are pickled. Unpickling recreates the
+    entry without evaluating the DN template, defaults and validators. Thus
+    the class must be importable, i.e. defined on module level.
+
     *Attributes*
 
     .. attribute:: dn
@@ -250,15 +475,11 @@ class EntryBase(_Entry):
     object_classes = set()
 
     def __init__(self, **kwargs):
-        class _DummyCursor(object):  # needed for _EntryState
-            def __init__(self, object_def):
-                self.definition = object_def
-
         if self.dn is None:
             raise NotImplementedError("%s must set the 'dn' attribute"
                                       % self.__class__)
-        cursor = _DummyCursor(ObjectDef(self.object_classes))
-        self.__dict__["_state"] = EntryState(None, cursor)
+        cursor = _DummyCursor(self._shared_object_def())
+        self.__dict__["_state"] = EntryState(None, cursor, self.__class__)
         # initialize attributes from kwargs
         attrdefs = dict(self._attrdefs)
         for k, v in iteritems(kwargs):
@@ -274,8 +495,9 @@ class EntryBase(_Entry):
                 attrdef = attrdefs.pop(key)
                 self._create_attribute_or_parameter(attrdef, attrdef.default)
             elif not attrdefs[key].mandatory:
-                # delete non mandatory attrdef and add to definition
-                self._state.definition += attrdefs.pop(key)
+                # delete non mandatory attrdef, the shared definition
+                # already contains all attributes
+                del attrdefs[key]
         # all remaining attributes are mandatory, do not provide a reasonable
         # default value (NotImplemented) and should have been set earlier
         if attrdefs:
@@ -299,37 +521,339 @@ class EntryBase(_Entry):
         # restore self._state
         self.__dict__["_state"] = state
 
-    def _create(self, attrdef, value, cls, state_parameters_or_attributes):
+    @classmethod
+    def search(cls, search_filter=None, **kwargs):
+        """Returns a :py:class:`~ldap3_orm.query.Query` for entries of this
+        class matching ``search_filter``.
+
+        Only ldap attributes defined on this class are requested by default.
+        See :py:class:`~ldap3_orm.query.Query` for further arguments.
+
+        """
+        return Query(cls, search_filter, **kwargs)
+
+    @classmethod
+    def _object_def(cls):
+        """Returns an :py:class:`~ldap3_orm.ObjectDef` containing the
+        object classes and all ldap attributes of this class."""
+        object_def = ObjectDef(list(cls.object_classes))
+        for attrdef in itervalues(cls._attrdefs):
+            if not isinstance(attrdef, ParamDef):
+                object_def += attrdef
+        return object_def
+
+    @classmethod
+    def _shared_object_def(cls):
+        """Returns the :py:meth:`_object_def` of this class which is created
+        once and shared by all instances."""
+        if cls._definition is None:
+            cls._definition = cls._object_def()
+        return cls._definition
+
+    @classmethod
+    def _dn_field_names(cls):
+        """Returns the set of names expanded in the DN template of this class
+        which is parsed once."""
+        if cls._dn_fields is None:
+            cls._dn_fields = frozenset(
+                re.split(r"[.\[]", field, 1)[0] for _, field, _, _ in
+                Formatter().parse(cls.dn) if field)
+        return cls._dn_fields
+
+    @classmethod
+    def _from_response(cls, response):
+        """Creates an instance of this class from a ``searchResEntry``
+        ``response`` without evaluating the DN template, defaults and
+        validators."""
+        entry = cls.__new__(cls)
+        state = EntryState(response["dn"],
+                           _DummyCursor(cls._shared_object_def()), cls)
+        entry.__dict__["_state"] = state
+        values = CaseInsensitiveDict(response["attributes"])
+        for attrdef in itervalues(cls._attrdefs):
+            if isinstance(attrdef, ParamDef):
+                continue
+            if attrdef.name in values:
+                attribute = Attribute(attrdef, entry, None)
+                attribute.__dict__["values"] = tolist(values[attrdef.name])
+                state.attributes[attribute.key] = attribute
+        state.raw_attributes = response["raw_attributes"]
+        state.response = response
+        state.read_time = datetime.now()
+        state.set_status(_STATUS_READ)
+        return entry
+
+    @classmethod
+    def _from_values(cls, dn, values, status=_STATUS_WRITEABLE):
+        """Creates an instance of this class with ``status`` from its ``dn``
+        and the dictionary ``values`` returned by :py:meth:`_values` without
+        evaluating the DN template, defaults and validators."""
+        entry = cls.__new__(cls)
+        state = EntryState(dn, _DummyCursor(cls._shared_object_def()), cls)
+        entry.__dict__["_state"] = state
+        for key, value in iteritems(values):
+            entry._create_attribute_or_parameter(cls._attrdefs[key], value,
+                                                 validate=False)
+        state.set_status(status)
+        return entry
+
+    def _values(self):
+        """Returns a dictionary mapping the keyword arguments of all
+        attributes and parameters set on this entry to their values."""
+        values = {}
+        for key, attrdef in iteritems(self._attrdefs):
+            items = self._state.parameters if isinstance(attrdef, ParamDef) \
+                else self._state.attributes
+            if attrdef.key in items:
+                values[key] = items[attrdef.key].values
+        return values
+
+    def __reduce__(self):
+        """Pickles this entry as its class, DN, status and the values of its
+        attributes and parameters, which are restored using
+        :py:meth:`_from_values`. Entries read from a server are pickled with
+        the values and raw values of their attributes and restored using
+        :py:meth:`_from_response`. Pending changes, prefetched references and
+        the search response are not pickled."""
+        state = self._state
+        if state._initial_status == _STATUS_READ and state.raw_attributes:
+            attributes = dict((attrdef.name,
+                               state.attributes[attrdef.key].values)
+                              for attrdef in itervalues(self._attrdefs)
+                              if not isinstance(attrdef, ParamDef) and
+                              attrdef.key in state.attributes)
+            return _restore_read_entry, (self.__class__, self.entry_dn,
+                                         attributes,
+                                         dict(state.raw_attributes))
+        return _restore_entry, (self.__class__, self.entry_dn, self._values(),
+                                state._initial_status)
+
+    @classmethod
+    def build_many(cls, rows, workers=0, chunk_size=BUILD_CHUNK_SIZE):
+        """Creates instances of this class from ``rows``, which are
+        dictionaries of keyword arguments, using ``workers`` processes.
+        Returns the list of entries in the order of ``rows`` and a list of
+        :py:class:`~ldap3_orm.build.RowError` tuples of all rows which
+        failed, see :py:func:`~ldap3_orm.build.build_many`."""
+        return build_many(cls, rows, workers, chunk_size)
+
+    @classmethod
+    def from_records(cls, records, columns, batch_size=BUILD_CHUNK_SIZE):
+        """Yields instances of this class created from ``records``, which
+        are tuples of values in the order of ``columns``, the keyword
+        arguments of this class, e.g.::
+
+            >>> users = User.from_records(csv.reader(f),
+            ...                           ["username", "fullname",
+            ...                            "givenname", "surname"])
+            >>> failed = add_many(users)
+
+        Columns, defaults and the class attributes expanded in the DN
+        template are resolved once. The records are read in batches of
+        ``batch_size`` and validated column by column for each batch before
+        its entries are created.
+
+        """
+        return _RowBuilder(cls, columns).build_records(records, batch_size)
+
+    @classmethod
+    def from_columns(cls, columns):
+        """Yields instances of this class created from ``columns``, a
+        dictionary mapping keyword arguments of this class to lists of
+        values of the same length, e.g.::
+
+            >>> users = User.from_columns(dict(username=["guest", "admin"],
+            ...                                surname=["Guest", "Admin"],
+            ...                                ...))
+
+        Columns, defaults and the class attributes expanded in the DN
+        template are resolved once and all columns are validated column by
+        column before the first entry is yielded, see
+        :py:meth:`from_records`.
+
+        """
+        keys = list(columns)
+        values = [columns[key] for key in keys]
+        if len(set(len(column) for column in values)) > 1:
+            raise ValueError("columns %s differ in length"
+                             % ", ".join(keys))
+        return _RowBuilder(cls, keys).build_columns(values)
+
+    @classmethod
+    def from_prototype(cls, prototype, **changes):
+        """Returns a copy of ``prototype``, an instance of this class, with
+        the attributes and parameters given as keyword arguments replaced,
+        see :py:meth:`replace`."""
+        if not isinstance(prototype, cls):
+            raise TypeError("from_prototype() expected an instance of '%s',"
+                            " got '%s'" % (cls.__name__,
+                                           prototype.__class__.__name__))
+        return prototype.replace(**changes)
+
+    def replace(self, **changes):
+        """Returns a writable copy of this entry with the attributes and
+        parameters given as keyword arguments replaced, e.g. in order to
+        create many similar entries::
+
+            >>> template = Automount(key="/home", autofile="auto_nfs",
+            ...                      info="examplenfs.example.com:/home")
+            >>> maps = [template.replace(key=key, info=server + ':' + key)
+            ...         for key, server in exports]
+
+        Just the replaced values are validated. All other attributes and
+        parameters are shared with this entry, which is possible as they
+        are read only. The DN template is evaluated again only if it refers
+        to a replaced attribute or parameter, otherwise the DN of this entry
+        is kept.
+
+        """
+        cls = self.__class__
+        state = EntryState(None, _DummyCursor(cls._shared_object_def()), cls)
+        state.attributes = self._state.attributes.copy()
+        state.parameters = self._state.parameters.copy()
+        if isinstance(self._state.raw_attributes, _SharedKeyDict):
+            state.raw_attributes = self._state.raw_attributes.copy()
+        else:  # read entries hold the raw attributes of the response
+            for key, attribute in iteritems(state.attributes):
+                state.raw_attributes[key] = attribute.values
+        entry = cls.__new__(cls)
+        entry.__dict__["_state"] = state
+        changed = set()
+        for key, value in iteritems(changes):
+            if key not in cls._attrdefs:
+                raise TypeError("replace() got an unexpected keyword argument"
+                                " '%s'" % key)
+            attrdef = cls._attrdefs[key]
+            entry._create_attribute_or_parameter(attrdef, value)
+            changed.add(attrdef.key)
+        fields = cls._dn_field_names()
+        if changed & fields:
+            fmtdict = dict((field, getattr(cls, field)) for field in fields
+                           if hasattr(cls, field))
+            fmtdict.update(state.attributes)
+            fmtdict.update(state.parameters)
+            state.dn = safe_dn(cls.dn.format(**fmtdict))
+        else:
+            state.dn = self.entry_dn
+        state.set_status(_STATUS_WRITEABLE)
+        return entry
+
+    def entry_references(self, key, conn=None):
+        """Returns the list of entries referenced by the attribute ``key``
+        defined using :py:class:`~ldap3_orm.attribute.ReferenceAttrDef`.
+
+        Referenced entries are read once using
+        :py:func:`~ldap3_orm.bulk.get_many` on ``conn`` or the connection
+        singleton :py:data:`ldap3_orm.connection.conn` if they have not been
+        prefetched, see
+        :py:meth:`Query.prefetch() <ldap3_orm.query.Query.prefetch>`.
+        References to entries which do not exist are omitted.
+
+        """
+        name = attribute_name(self.__class__, key)
+        if name not in self._state.references:
+            attrdef = self._reference_attrdef(key)
+            if conn is None:
+                # pylint: disable=redefined-outer-name
+                from ldap3_orm.connection import conn
+            dns = self._state.attributes[name].values \
+                if name in self._state.attributes else []
+            entries = get_many(conn, dns, attrdef.model)
+            self._state.references[name] = [entry for entry in
+                                             entries.values() if entry]
+        return self._state.references[name]
+
+    def entry_iter_values(self, key, conn=None, range_size=RANGE_SIZE,
+                          timeout=None):
+        """Yields the values of the multi-valued attribute ``key``, which can
+        either be the name of a class attribute or an ldap attribute name,
+        read from the LDAP in ranges of ``range_size`` values using
+        :py:func:`~ldap3_orm.bulk.iter_values` on ``conn`` or the connection
+        singleton :py:data:`ldap3_orm.connection.conn` within ``timeout``
+        seconds in total, e.g.::
+
+            >>> for dn in group.entry_iter_values("member"):
+            ...     print(dn)
+
+        """
+        if conn is None:
+            # pylint: disable=redefined-outer-name
+            from ldap3_orm.connection import conn
+        return iter_values(conn, self.entry_dn,
+                           attribute_name(self.__class__, key), range_size,
+                           timeout)
+
+    def entry_write_values(self, key, values, conn=None, dn_values=False,
+                           range_size=RANGE_SIZE,
+                           batch_size=MODIFY_BATCH_SIZE, timeout=None):
+        """Replaces the values of the multi-valued attribute ``key`` in the
+        LDAP by ``values`` using :py:func:`~ldap3_orm.bulk.write_values` on
+        ``conn`` or the connection singleton
+        :py:data:`ldap3_orm.connection.conn`, which adds and deletes just
+        the differences in batches of at most ``batch_size`` values.
+
+        Values are compared as DNs if ``dn_values`` is set or ``key`` is
+        defined using :py:class:`~ldap3_orm.attribute.ReferenceAttrDef`.
+        Returns ``True`` if all modifications succeeded. Reading and writing
+        is performed within ``timeout`` seconds in total.
+
+        """
+        if conn is None:
+            # pylint: disable=redefined-outer-name
+            from ldap3_orm.connection import conn
+        name = attribute_name(self.__class__, key)
+        if not dn_values:
+            dn_values = any(isinstance(attrdef, ReferenceAttrDef) and
+                            attrdef.name.lower() == name.lower()
+                            for attrdef in itervalues(self._attrdefs))
+        return write_values(conn, self.entry_dn, name, values,
+                            dn_key if dn_values else None, range_size,
+                            batch_size, timeout)
+
+    @classmethod
+    def _reference_attrdef(cls, key):
+        """Returns the :py:class:`~ldap3_orm.attribute.ReferenceAttrDef`
+        for ``key`` which can either be the name of a class attribute or an
+        ldap attribute name."""
+        name = attribute_name(cls, key).lower()
+        for attrdef in itervalues(cls._attrdefs):
+            if isinstance(attrdef, ReferenceAttrDef) and \
+                    attrdef.name.lower() == name:
+                return attrdef
+        raise AttributeError("'%s' has no reference attribute '%s'"
+                             % (cls.__name__, key))
+
+    def _create(self, attrdef, value, cls, state_parameters_or_attributes,
+                validate=True):
         attribute = cls(attrdef, self, None)
         attribute.__dict__["values"] = tolist(value)
         # check for validator
-        if attrdef.validate:
+        if validate and attrdef.validate:
             # call validator with the value which should be assigned to the
             # attribute.
-            if not attrdef.validate(attribute.value):
-                raise TypeError("Validation failed for attribute '%s' "
-                                "and value '%s'" % (attribute.key,
-                                                    attribute.value))
+            _validate(attrdef, attribute.value)
         state_parameters_or_attributes[attribute.key] = attribute
-        state_parameters_or_attributes.set_alias(attribute.key,
-                                                 attrdef.other_names or [])
+        if attrdef.other_names:
+            state_parameters_or_attributes.set_alias(attribute.key,
+                                                     attrdef.other_names)
 
-    def _create_attribute(self, attrdef, value):
+    def _create_attribute(self, attrdef, value, validate=True):
         # add Attributes to the schema definition self._state.attributes
-        self._create(attrdef, value, Attribute, self._state.attributes)
+        self._create(attrdef, value, Attribute, self._state.attributes,
+                     validate)
         # add raw_attributes without processing
         self._state.raw_attributes[attrdef.key] = tolist(value)
-        self._state.definition += attrdef
 
-    def _create_parameter(self, attrdef, value):
+    def _create_parameter(self, attrdef, value, validate=True):
         # do not add Parameters to the schema
-        self._create(attrdef, value, Parameter, self._state.parameters)
+        self._create(attrdef, value, Parameter, self._state.parameters,
+                     validate)
 
-    def _create_attribute_or_parameter(self, attrdef, value):
+    def _create_attribute_or_parameter(self, attrdef, value, validate=True):
         if isinstance(attrdef, ParamDef):
-            self._create_parameter(attrdef, value)
+            self._create_parameter(attrdef, value, validate)
         else:  # AttrDef
-            self._create_attribute(attrdef, value)
+            self._create_attribute(attrdef, value, validate)
 
     def __getattr__(self, item):
         """Return the corresponding class attribute if the attribute on the
@@ -346,6 +870,20 @@ class EntryBase(_Entry):
             return attr
 
 
+def _restore_entry(cls, dn, values, status):
+    """Restores an entry pickled by :py:meth:`EntryBase.__reduce__`."""
+    return cls._from_values(dn, values, status)
+
+
+def _restore_read_entry(cls, dn, attributes, raw_attributes):
+    """Restores an entry read from a server pickled by
+    :py:meth:`EntryBase.__reduce__`."""
+    entry = cls._from_response(dict(dn=dn, attributes=attributes,
+                                    raw_attributes=raw_attributes))
+    entry._state.response = None
+    return entry
+
+
 def EntryType(dn, object_classes, schema=None, *args, **kwargs):
     """Factory for creating ORM models from given object classes.
 
@@ -0,0 +1,285 @@
+# coding: utf-8
+
+from ldap3.core.exceptions import LDAPException, LDAPInvalidFilterError
+from ldap3.operation.search import FilterNode, AND, OR, NOT, MATCH_APPROX, \
+    MATCH_GREATER_OR_EQUAL, MATCH_LESS_OR_EQUAL, MATCH_EXTENSIBLE, \
+    MATCH_PRESENT, MATCH_SUBSTRING, MATCH_EQUAL
+from ldap3.operation.search import parse_filter as _parse_filter
+from ldap3.utils.conv import to_unicode
+from ldap3_orm.bulk import unescape_dn_value
+from ldap3_orm.utils import compile_filter
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+PLACEHOLDER = "?"
+# fingerprint of all filters which cannot be parsed
+UNPARSEABLE = "<unparseable>"
+
+_OPERATORS = {
+    AND: '&',
+    OR: '|',
+    NOT: '!',
+}
+
+_MATCHES = {
+    MATCH_APPROX: "~=",
+    MATCH_GREATER_OR_EQUAL: ">=",
+    MATCH_LESS_OR_EQUAL: "<=",
+    MATCH_EQUAL: '=',
+}
+
+
+def parse_filter(search_filter):
+    """Returns the :py:class:`~ldap3.operation.search.FilterNode` tree for
+    ``search_filter`` which can either be an LDAP filter string as defined in
+    RFC 4515 or an ORM Filter Expression.
+
+    Assertion values are kept in their escaped representation.
+
+    """
+    root = _parse_filter(compile_filter(search_filter), None, False, False,
+                         None, False)
+    return root.elements[0]
+
+
+def assertion_value(value):
+    """Returns the unescaped string of the escaped assertion ``value`` of a
+    :py:class:`~ldap3.operation.search.FilterNode`."""
+    return unescape_dn_value(to_unicode(value))
+
+
+def _value(value, placeholder):
+    if placeholder is not None:
+        return placeholder
+    return to_unicode(value)
+
+
+def serialize(node, placeholder=None):
+    """Returns the RFC 4515 string representation of a
+    :py:class:`~ldap3.operation.search.FilterNode` tree.
+
+    If ``placeholder`` is given all assertion values will be replaced by
+    ``placeholder``.
+
+    """
+    if node.tag in _OPERATORS:
+        return "({}{})".format(_OPERATORS[node.tag],
+                               ''.join(serialize(element, placeholder)
+                                       for element in node.elements))
+    assertion = node.assertion
+    if node.tag == MATCH_PRESENT:
+        return "({}=*)".format(assertion["attr"])
+    if node.tag == MATCH_SUBSTRING:
+        parts = [_value(assertion["initial"], placeholder)
+                 if assertion.get("initial") else '']
+        parts += [_value(value, placeholder)
+                  for value in assertion.get("any", [])]
+        parts.append(_value(assertion["final"], placeholder)
+                     if assertion.get("final") else '')
+        return "({}={})".format(assertion["attr"], '*'.join(parts))
+    if node.tag == MATCH_EXTENSIBLE:
+        attr = assertion["attr"] or ''
+        if assertion["dnAttributes"]:
+            attr += ":dn"
+        if assertion["matchingRule"]:
+            attr += ':' + assertion["matchingRule"]
+        return "({}:={})".format(attr, _value(assertion["value"],
+                                              placeholder))
+    return "({}{}{})".format(assertion["attr"], _MATCHES[node.tag],
+                             _value(assertion["value"], placeholder))
+
+
+def fingerprint(search_filter):
+    """Returns the normalized shape of ``search_filter``.
+
+    All assertion values are replaced by :py:data:`PLACEHOLDER`, attribute
+    names are lower cased and the operands of ``&`` and ``|`` are sorted.
+    Thus all filters differing just in their values or in the order of
+    their operands share the same fingerprint, e.g.::
+
+        >>> fingerprint((User.username == "guest") &
+        ...             User.surname.startswith("U"))
+        '(&(sn=?*)(uid=?))'
+
+    All filters which cannot be parsed share the fingerprint
+    :py:data:`UNPARSEABLE`, as their values cannot be told apart.
+
+    """
+    try:
+        node = parse_filter(search_filter)
+    except LDAPInvalidFilterError:
+        return UNPARSEABLE
+    return _normalize(node, PLACEHOLDER)
+
+
+def _normalize(node, placeholder=None):
+    if node.tag in _OPERATORS:
+        elements = [_normalize(element, placeholder)
+                    for element in node.elements]
+        if node.tag != NOT:
+            elements.sort()
+        return "({}{})".format(_OPERATORS[node.tag], ''.join(elements))
+    if node.assertion.get("attr"):
+        node = FilterNode(node.tag, dict(node.assertion,
+                                         attr=node.assertion["attr"].lower()))
+    return serialize(node, placeholder)
+
+
+TRUE = "(objectClass=*)"
+FALSE = "(!(objectClass=*))"
+
+
+def _attr(node):
+    if node is True or node is False or node.tag in _OPERATORS:
+        return None
+    return (node.assertion.get("attr") or '').lower() or None
+
+
+def _simplify(node):
+    """Returns the simplified ``node`` or one of the constants ``True`` and
+    ``False``."""
+    if node.tag == NOT:
+        element = _simplify(node.elements[0])
+        if element is True or element is False:
+            return not element
+        if element.tag == NOT:  # double negation
+            return element.elements[0]
+        new = FilterNode(NOT)
+        new.append(element)
+        return new
+    if node.tag in (AND, OR):
+        # absorbing and neutral constants for AND and OR respectively
+        absorbing = node.tag == OR
+        elements = []
+        keys = set()
+        pending = list(node.elements)
+        while pending:
+            element = _simplify(pending.pop(0))
+            if element is absorbing:
+                return absorbing
+            if element is (not absorbing):
+                continue
+            if element.tag == node.tag:  # flatten nested operator
+                pending[:0] = element.elements
+                continue
+            key = _normalize(element)
+            if key in keys:
+                continue
+            keys.add(key)
+            elements.append(element)
+        # contradictions (&(x)(!(x))), tautologies (|(x)(!(x))) are kept
+        # since they evaluate to Undefined for unknown attributes, which
+        # differs from FALSE and TRUE when negated
+        if not elements:
+            return not absorbing
+        if len(elements) == 1:
+            return elements[0]
+        new = FilterNode(node.tag)
+        for element in elements:
+            new.append(element)
+        return new
+    if node.tag == MATCH_PRESENT and _attr(node) == "objectclass":
+        return True
+    return node
+
+
+def _reorder(node, indexed):
+    if node.tag == AND:
+        for element in node.elements:
+            _reorder(element, indexed)
+        # stable sort: indexed assertions first, boolean operators last
+        node.elements.sort(key=lambda element: 0 if _attr(element) in indexed
+                           else 2 if element.tag in _OPERATORS else 1)
+    elif node.tag in _OPERATORS:
+        for element in node.elements:
+            _reorder(element, indexed)
+
+
+def optimize(search_filter, indexed_attributes=None):
+    """Returns an optimized, semantically equivalent LDAP filter string for
+    ``search_filter`` which can either be an LDAP filter string as defined in
+    RFC 4515 or an ORM Filter Expression.
+
+    Nested ``&`` and ``|`` operators are flattened, duplicate operands and
+    double negations are removed. Constant operands, i.e. ``(objectClass=*)``,
+    are evaluated, which results in :py:data:`TRUE` or :py:data:`FALSE` if
+    the whole filter is constant. Contradictions like ``(&(x)(!(x)))`` are
+    kept, as they evaluate to Undefined rather than FALSE for unknown
+    attributes.
+
+    If ``indexed_attributes`` is given the operands of ``&`` operators are
+    reordered so that assertions on indexed attributes are evaluated first,
+    e.g.::
+
+        >>> optimize("(&(mail=*)(&(uid=guest)(uid=guest)))", ["uid"])
+        '(&(uid=guest)(mail=*))'
+
+    Filters which cannot be parsed are returned unmodified.
+
+    """
+    try:
+        node = _simplify(parse_filter(search_filter))
+    except LDAPInvalidFilterError:
+        return compile_filter(search_filter)
+    if node is True:
+        return TRUE
+    if node is False:
+        return FALSE
+    if indexed_attributes:
+        _reorder(node, set(attr.lower() for attr in indexed_attributes))
+    return serialize(node)
+
+
+def server_indexed_attributes(conn):
+    """Returns the indexed attributes configured on the server of ``conn``.
+
+    Index configurations of OpenLDAP (``olcDbIndex`` in ``cn=config``) and
+    389 Directory Server (``nsIndex`` entries) are supported. The bound user
+    must be allowed to read the corresponding configuration entries. An empty
+    list is returned if no index configuration could be read.
+
+    """
+    indexed = set()
+    try:
+        if conn.search("cn=config", "(olcDbIndex=*)",
+                       attributes=["olcDbIndex"]):
+            for response in conn.response:
+                for value in response["attributes"].get("olcDbIndex", []):
+                    # e.g. "uid,cn eq,sub" or "default pres,eq"
+                    attrs = value.split()[0] if value.split() else ''
+                    indexed.update(attr for attr in attrs.split(',')
+                                   if attr and attr != "default")
+    except LDAPException:
+        pass
+    try:
+        if conn.search("cn=ldbm database,cn=plugins,cn=config",
+                       "(objectClass=nsIndex)", attributes=["cn"]):
+            for response in conn.response:
+                indexed.update(response["attributes"].get("cn", []))
+    except LDAPException:
+        pass
+    return sorted(indexed)
@@ -0,0 +1,285 @@
+# coding: utf-8
+
+from collections import deque, namedtuple
+from threading import Lock
+from timeit import default_timer
+
+from ldap3 import SUBTREE
+from ldap3.core.exceptions import LDAPResponseTimeoutError
+from ldap3.core.results import RESULT_COMPARE_TRUE, RESULT_SUCCESS
+from ldap3_orm.deadline import current, deadline
+from ldap3_orm.routing import _ConnectionProxy, _paged_cookie
+from ldap3_orm.utils import compile_filter
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# percentile of recent response times after which a search is hedged
+PERCENTILE = 95
+# maximum ratio of hedged searches to all searches
+BUDGET = 0.05
+# maximum number of hedges which can be sent in a burst
+BURST = 10
+# number of recent response times the percentile is computed from
+WINDOW = 1000
+# number of response times observed before searches are hedged
+MIN_SAMPLES = 20
+# seconds between checking both searches for a response
+POLL_INTERVAL = 0.001
+
+
+HedgeStats = namedtuple("HedgeStats", ["searches", "hedged", "won", "denied",
+                                       "delay"])
+HedgeStats.__doc__ = """Metrics of a :py:class:`HedgedConnection`.
+``searches`` is the number of searches, ``hedged`` the number of hedges sent,
+``won`` the number of hedges answered first and ``denied`` the number of
+hedges not sent because the budget has been exhausted. ``delay`` is the
+current delay in seconds after which searches are hedged or ``None`` if not
+enough response times have been observed yet."""
+
+
+class _SyncStrategy(object):
+    """Strategy of a :py:class:`HedgedConnection` which returns the results
+    of all operations synchronously."""
+
+    sync = True
+    thread_safe = False
+
+    def __init__(self, strategy):
+        self._strategy = strategy
+
+    def __getattr__(self, item):
+        return getattr(self._strategy, item)
+
+
+class HedgedConnection(_ConnectionProxy):
+    """Sends searches to one of ``connections`` to different servers, e.g.
+    replicas, and hedges them by sending the same search to a second
+    server if no response has arrived after the ``percentile`` of recent
+    response times. The first response wins and the search of the loser is
+    abandoned.
+
+    At most a ratio of ``budget`` of all searches is hedged, allowing
+    bursts of ``burst`` hedges, which caps the extra load on the servers.
+    Searches are sent to the connections in turn and hedged using the next
+    connection. Further pages of paged searches are sent to the connection
+    which answered the first page and never hedged, as servers only accept
+    the cookies they issued. Metrics are returned by :py:meth:`stats`.
+
+    ``connections`` must use an asynchronous client strategy, e.g.
+    ``ASYNC``. The results of all operations are returned synchronously like
+    using the ``SYNC`` strategy. Operations other than searches are sent to
+    the first connection. The attributes ``response``, ``result`` and
+    ``entries`` are taken from the connection used by the last operation of
+    the current thread.
+
+    Instances are created by
+    :py:func:`~ldap3_orm._connection.create_connection` if ``url`` is a
+    list of urls and ``connconfig["hedge"]`` holds the keyword arguments of
+    this class, e.g.::
+
+        connconfig = dict(
+            hedge = dict(percentile=90, budget=0.1),
+        )
+
+    """
+
+    def __init__(self, connections, percentile=PERCENTILE, budget=BUDGET,
+                 burst=BURST, window=WINDOW, min_samples=MIN_SAMPLES):
+        _ConnectionProxy.__init__(self, connections)
+        for conn in self.connections:
+            if conn.strategy.sync:
+                raise ValueError("%r does not use an asynchronous strategy"
+                                 % conn)
+            if hasattr(conn, "querylog"):
+                conn.querylog = self.connections[0].querylog
+        self._strategy = _SyncStrategy(self.connections[0].strategy)
+        self._percentile = percentile
+        self._budget = budget
+        self._burst = burst
+        self._min_samples = min_samples
+        self._elapsed = deque(maxlen=window)
+        self._tokens = float(burst)
+        self._next = 0
+        self._searches = self._hedged = self._won = self._denied = 0
+        self._lock = Lock()
+
+    @property
+    def strategy(self):
+        return self._strategy
+
+    @property
+    def entries(self):
+        return self._last.entries
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__,
+                                 list(self.connections))
+
+    def _delay(self):
+        if len(self._elapsed) < self._min_samples:
+            return None
+        elapsed = sorted(self._elapsed)
+        return elapsed[min(len(elapsed) - 1,
+                           int(len(elapsed) * self._percentile / 100.))]
+
+    def stats(self):
+        """Returns the :py:class:`HedgeStats` of this connection."""
+        with self._lock:
+            return HedgeStats(self._searches, self._hedged, self._won,
+                              self._denied, self._delay())
+
+    def _schedule(self):
+        """Returns the connection to send the next search to, the connection
+        to hedge it with and the delay of the hedge."""
+        with self._lock:
+            self._searches += 1
+            self._tokens = min(self._tokens + self._budget, self._burst)
+            first = self.connections[self._next % len(self.connections)]
+            second = self.connections[(self._next + 1) %
+                                      len(self.connections)]
+            self._next += 1
+            return first, second, self._delay()
+
+    def _allow_hedge(self):
+        with self._lock:
+            if self._tokens < 1:
+                self._denied += 1
+                return False
+            self._tokens -= 1
+            self._hedged += 1
+            return True
+
+    def _race(self, searches):
+        """Waits for the first response of ``searches``, a list of
+        ``(connection, message id)`` tuples, abandons all other searches and
+        returns the index of the winner and its response."""
+        winner = None
+        limit = current()
+        try:
+            while winner is None:
+                for index, (conn, msgid) in enumerate(searches):
+                    try:
+                        response = conn.get_response(msgid,
+                                                     timeout=POLL_INTERVAL)
+                    except LDAPResponseTimeoutError:
+                        if limit is not None and limit.expired:
+                            raise limit.error()
+                        continue
+                    winner = index
+                    return index, response
+        finally:
+            for index, (conn, msgid) in enumerate(searches):
+                if index != winner:
+                    conn.abandon(msgid)
+
+    def search(self, search_base, search_filter, search_scope=SUBTREE,
+               *args, **kwargs):
+        with deadline(kwargs.pop("timeout", None)) as limit:
+            return self._search(limit, search_base, search_filter,
+                                search_scope, *args, **kwargs)
+
+    def _search(self, limit, search_base, search_filter, search_scope,
+                *args, **kwargs):
+        query = compile_filter(search_filter)
+        cookie = _paged_cookie((search_filter, search_scope) + args, kwargs)
+        if cookie:
+            # further pages are requested from the server which issued the
+            # cookie and never hedged
+            first = second = self._paged_connection(cookie)
+            delay = None
+        else:
+            first, second, delay = self._schedule()
+        start = default_timer()
+        msgid = first.search(search_base, query, search_scope, *args,
+                             **kwargs)
+        conn, hedged = first, False
+        response = None
+        if delay is not None and first is not second:
+            try:
+                response, result = first.get_response(msgid, timeout=delay)
+            except LDAPResponseTimeoutError:
+                if limit is not None and limit.expired:
+                    raise
+                hedged = self._allow_hedge()
+        if hedged:
+            hedge = second.search(search_base, query, search_scope, *args,
+                                  **kwargs)
+            winner, (response, result) = self._race([(first, msgid),
+                                                     (second, hedge)])
+            conn = (first, second)[winner]
+            if winner:
+                with self._lock:
+                    self._won += 1
+        elif response is None:
+            response, result = first.get_response(msgid)
+        elapsed = default_timer() - start
+        with self._lock:
+            if not hedged:  # hedged response times are biased
+                self._elapsed.append(elapsed)
+        self._local.connection = conn
+        self._record_page(conn, result)
+        conn.response, conn.result = response, result
+        if hasattr(conn, "querylog"):
+            attributes = kwargs.get("attributes",
+                                    args[1] if len(args) > 1 else None)
+            conn.querylog.record(
+                search_base, query, search_scope, attributes,
+                sum(1 for item in response or []
+                    if item["type"] == "searchResEntry"), elapsed)
+        return result["result"] == RESULT_SUCCESS and bool(response)
+
+    def _operation(self, operation, *args, **kwargs):
+        conn = self.connections[0]
+        self._local.connection = conn
+        response, result = conn.get_response(
+            getattr(conn, operation)(*args, **kwargs))
+        conn.response, conn.result = response, result
+        return result
+
+    def add(self, *args, **kwargs):
+        return self._operation("add", *args, **kwargs)["result"] == \
+            RESULT_SUCCESS
+
+    def delete(self, *args, **kwargs):
+        return self._operation("delete", *args, **kwargs)["result"] == \
+            RESULT_SUCCESS
+
+    def modify(self, *args, **kwargs):
+        return self._operation("modify", *args, **kwargs)["result"] == \
+            RESULT_SUCCESS
+
+    def modify_dn(self, *args, **kwargs):
+        return self._operation("modify_dn", *args, **kwargs)["result"] == \
+            RESULT_SUCCESS
+
+    def compare(self, *args, **kwargs):
+        return self._operation("compare", *args, **kwargs)["result"] == \
+            RESULT_COMPARE_TRUE
+
+    def extended(self, *args, **kwargs):
+        return self._operation("extended", *args, **kwargs)["result"] == \
+            RESULT_SUCCESS
@@ -0,0 +1,166 @@
+# coding: utf-8
+
+from collections import namedtuple
+from threading import Condition
+
+from ldap3.core.results import RESULT_BUSY, RESULT_UNAVAILABLE, \
+    RESULT_UNWILLING_TO_PERFORM
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# number of outstanding requests allowed initially
+INITIAL_LIMIT = 4
+# minimum number of outstanding requests
+MIN_LIMIT = 1
+# maximum number of outstanding requests
+MAX_LIMIT = 64
+# factor the limit is multiplied with on congestion
+BACKOFF = 0.7
+# response times exceeding the baseline by this factor indicate congestion
+TOLERANCE = 2.0
+# relative growth of the baseline per response, which follows servers
+# becoming permanently slower
+BASELINE_DRIFT = 0.001
+
+# result codes of servers refusing operations due to their load
+OVERLOADED = (RESULT_BUSY, RESULT_UNAVAILABLE, RESULT_UNWILLING_TO_PERFORM)
+
+
+LimiterStats = namedtuple("LimiterStats", ["limit", "inflight", "baseline",
+                                           "completed", "overloaded",
+                                           "decreased"])
+LimiterStats.__doc__ = """Metrics of an :py:class:`AdaptiveLimiter`.
+``limit`` is the current number of outstanding requests allowed and
+``inflight`` the number of outstanding requests. ``baseline`` is the
+response time in seconds of an unloaded server or ``None`` if no response
+has been observed yet. ``completed`` is the number of responses,
+``overloaded`` the number of responses indicating an overloaded server and
+``decreased`` the number of times the limit has been decreased."""
+
+
+class AdaptiveLimiter(object):
+    """Limits the number of outstanding requests sent to a server adapting
+    the limit to the load of the server using additive increase and
+    multiplicative decrease (AIMD).
+
+    Each request reserves a slot using :py:meth:`acquire` and reports its
+    response time and whether the server refused it due to its load, i.e.
+    the result codes ``busy``, ``unavailable`` and ``unwillingToPerform``,
+    using :py:meth:`release`. The limit grows by one request per window of
+    responses answered within ``tolerance`` times the ``baseline`` response
+    time of the server. It is multiplied by ``backoff`` at most once per
+    window if responses are slower or refused, which keeps the number of
+    outstanding requests near the point where response times start to grow
+    with the load of the server. The baseline is the fastest response time
+    observed, growing slowly in order to follow servers which became slower
+    permanently.
+
+    Limiters are thread safe and can be shared by several bulk operations,
+    e.g. :py:func:`~ldap3_orm.bulk.add_many`, in order to keep the limit
+    learned.
+
+    """
+
+    def __init__(self, initial_limit=INITIAL_LIMIT, min_limit=MIN_LIMIT,
+                 max_limit=MAX_LIMIT, backoff=BACKOFF, tolerance=TOLERANCE):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._inflight = 0
+        self._baseline = None
+        self._since_decrease = 0
+        self._completed = self._overloaded = self._decreased = 0
+        self._condition = Condition()
+
+    @property
+    def limit(self):
+        """Number of outstanding requests currently allowed."""
+        return int(self._limit)
+
+    @property
+    def inflight(self):
+        """Number of outstanding requests."""
+        return self._inflight
+
+    def __repr__(self):
+        return "{}(limit={}, inflight={})".format(self.__class__.__name__,
+                                                  self.limit, self.inflight)
+
+    def stats(self):
+        """Returns the :py:class:`LimiterStats` of this limiter."""
+        with self._condition:
+            return LimiterStats(self.limit, self._inflight, self._baseline,
+                                self._completed, self._overloaded,
+                                self._decreased)
+
+    def acquire(self, blocking=True):
+        """Reserves a slot for a request. Waits for a free slot if
+        ``blocking`` is set, otherwise ``False`` is returned if all slots
+        are taken."""
+        with self._condition:
+            while self._inflight >= int(self._limit):
+                if not blocking:
+                    return False
+                self._condition.wait()
+            self._inflight += 1
+            return True
+
+    def cancel(self):
+        """Frees the slot of a request which has not been answered, e.g.
+        because it has been abandoned, without adapting the limit."""
+        with self._condition:
+            self._inflight -= 1
+            self._condition.notify_all()
+
+    def release(self, elapsed, overloaded=False):
+        """Frees the slot of a request answered after ``elapsed`` seconds
+        and adapts the limit. ``overloaded`` is set if the server refused
+        the request due to its load."""
+        with self._condition:
+            self._inflight -= 1
+            self._completed += 1
+            self._since_decrease += 1
+            if self._baseline is None or elapsed < self._baseline:
+                self._baseline = elapsed
+            else:
+                self._baseline *= 1 + BASELINE_DRIFT
+            if overloaded:
+                self._overloaded += 1
+            if overloaded or elapsed > self.tolerance * self._baseline:
+                # decrease once per window, the other responses of the
+                # window have been sent before
+                if self._since_decrease >= int(self._limit):
+                    self._limit = max(self.min_limit,
+                                      self._limit * self.backoff)
+                    self._since_decrease = 0
+                    self._decreased += 1
+            else:
+                self._limit = min(self.max_limit,
+                                  self._limit + 1. / self._limit)
+            self._condition.notify_all()
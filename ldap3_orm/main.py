@@ -104,8 +104,12 @@ def _create_parsers():
     )
     # all arguments defined in its long form here should have a corresponding
     # class attribute in `ldap3_orm._config.config`.
-    parser.add_argument("--url",
-                        help="ldap server url in the scheme://hostname:port")
+    parser.add_argument("--url", nargs='+',
+                        help="ldap server url in the scheme://hostname:port, "
+                             "several urls are used as server pool")
+    parser.add_argument("--write_url",
+                        help="url of the writable primary server if --url "
+                             "refers to read-only replicas")
     parser.add_argument("--username",
                         help="the account of the user to log in for simple "
                              "bind"),
@@ -216,7 +220,8 @@ def main(argv):
             from ldap3_orm.basic import search
         # add basic convenience functions to local namespace
         # pylint: disable=unused-import
-        from ldap3_orm.basic import add, delete
+        from ldap3_orm.basic import add, add_many, delete, delete_tree, \
+            slow_queries
     else:
         print("Connection object 'conn' has not been created.", file=sys.stderr)
         print("- Insufficient connection parameters -", file=sys.stderr)
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+from datetime import datetime
+
+from ldap3.protocol.formatters.formatters import format_time
+from ldap3_orm.bulk import dn_key
+from ldap3_orm.pycompat import string_types
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+def text(value):
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return value if isinstance(value, string_types) else str(value)
+
+
+def case_ignore(value):
+    return ' '.join(text(value).split()).lower()
+
+
+def case_exact(value):
+    return ' '.join(text(value).split())
+
+
+def numeric_string(value):
+    return ''.join(text(value).split())
+
+
+def telephone_number(value):
+    return ''.join(text(value).split()).replace('-', '').lower()
+
+
+def integer(value):
+    return value if isinstance(value, int) else int(text(value))
+
+
+def boolean(value):
+    if isinstance(value, bool):
+        return value
+    return text(value).strip().upper() == "TRUE"
+
+
+def generalized_time(value):
+    if isinstance(value, datetime):
+        return value
+    value = text(value)
+    parsed = format_time(value.encode("utf-8"))
+    return parsed if isinstance(parsed, datetime) else value
+
+
+def octet_string(value):
+    return value if isinstance(value, bytes) else text(value).encode("utf-8")
+
+
+def distinguished_name(value):
+    return dn_key(text(value))
+
+
+# normalization of values for equality, ordering and substring matching rules
+MATCHING_RULES = {
+    "caseignorematch": case_ignore,
+    "caseignoreia5match": case_ignore,
+    "caseignoreorderingmatch": case_ignore,
+    "caseignoresubstringsmatch": case_ignore,
+    "caseignoreia5substringsmatch": case_ignore,
+    "caseignorelistmatch": case_ignore,
+    "caseexactmatch": case_exact,
+    "caseexactia5match": case_exact,
+    "caseexactorderingmatch": case_exact,
+    "caseexactsubstringsmatch": case_exact,
+    "caseexactia5substringsmatch": case_exact,
+    "numericstringmatch": numeric_string,
+    "numericstringorderingmatch": numeric_string,
+    "numericstringsubstringsmatch": numeric_string,
+    "telephonenumbermatch": telephone_number,
+    "telephonenumbersubstringsmatch": telephone_number,
+    "integermatch": integer,
+    "integerorderingmatch": integer,
+    "booleanmatch": boolean,
+    "generalizedtimematch": generalized_time,
+    "generalizedtimeorderingmatch": generalized_time,
+    "octetstringmatch": octet_string,
+    "octetstringorderingmatch": octet_string,
+    "distinguishednamematch": distinguished_name,
+}
+
+# normalization of values of attributes without a known matching rule
+DEFAULT_RULE = case_ignore
+
+
+class MatchingRules(object):
+    """Attribute names and matching rules taken from ``schema``, which is a
+    :py:class:`~ldap3.protocol.rfc4512.SchemaInfo` or ``None``. The
+    :py:data:`DEFAULT_RULE` is used for all attributes if ``schema`` is
+    ``None``."""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+    def _attribute_type(self, attr):
+        if self.schema is None:
+            return None
+        return self.schema.attribute_types.get(attr)
+
+    def names(self, attr):
+        """Returns all names of ``attr`` defined in the schema including
+        ``attr`` and their lower case spellings."""
+        names = [attr, attr.lower()]
+        attribute_type = self._attribute_type(attr)
+        if attribute_type is not None:
+            for name in attribute_type.name:
+                names += [name, name.lower()]
+        return tuple(sorted(set(names), key=names.index))
+
+    def rule(self, attr, kind):
+        """Returns the normalization of the ``kind`` matching rule, i.e.
+        ``equality``, ``ordering`` or ``substring``, of ``attr`` following
+        the superior attribute types."""
+        attribute_type = self._attribute_type(attr)
+        seen = set()
+        while attribute_type is not None and attribute_type.oid not in seen:
+            seen.add(attribute_type.oid)
+            rules = getattr(attribute_type, kind) or \
+                (attribute_type.equality if kind == "ordering" else None)
+            if rules:
+                return MATCHING_RULES.get(rules[0].lower(), DEFAULT_RULE)
+            attribute_type = self._attribute_type(
+                attribute_type.superior[0]) if attribute_type.superior \
+                else None
+        return DEFAULT_RULE
@@ -0,0 +1,279 @@
+# coding: utf-8
+
+from ldap3 import SUBTREE
+from ldap3.utils.ciDict import CaseInsensitiveDict
+from ldap3.utils.conv import escape_filter_chars
+from ldap3_orm.bulk import CHUNK_SIZE, MAX_FILTER_LENGTH, chunks, dn_key, \
+    get_many
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+GROUP_FILTER = "(|(objectClass=groupOfNames)(objectClass=groupOfUniqueNames))"
+MEMBER_ATTRIBUTES = ("member", "uniqueMember")
+# page size used for reading all groups of a subtree
+PAGE_SIZE = 500
+
+
+def _values(response, attributes):
+    values = CaseInsensitiveDict(response["attributes"])
+    for attr in attributes:
+        for value in values.get(attr) or []:
+            yield value
+
+
+class MembershipIndex(object):
+    """Transitive closure of all group memberships of a subtree created by
+    :py:meth:`MembershipResolver.closure`.
+
+    All DNs passed to and returned from this index are compared independent
+    of case, spacing and escaping.
+
+    """
+
+    def __init__(self, members, names):
+        # members: dn_key of each group -> frozenset of dn_keys of all direct
+        # and nested members, names: dn_key -> DN
+        self._members = members
+        self._names = names
+        self._groups = {}
+        for group, group_members in members.items():
+            for member in group_members:
+                self._groups.setdefault(member, set()).add(group)
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, group):
+        return dn_key(group) in self._members
+
+    def members(self, group):
+        """Returns the set of DNs of all direct and nested members of
+        ``group`` including nested groups."""
+        return set(self._names[key] for key in
+                   self._members.get(dn_key(group), ()))
+
+    def groups(self, member):
+        """Returns the set of DNs of all groups ``member`` belongs to either
+        directly or through nested groups."""
+        return set(self._names[key] for key in
+                   self._groups.get(dn_key(member), ()))
+
+    def is_member(self, member, group):
+        return dn_key(member) in self._members.get(dn_key(group), ())
+
+
+class MembershipResolver(object):
+    """Resolves nested group memberships breadth-first.
+
+    Each level of nesting is resolved using batched searches, i.e. the groups
+    of all DNs of a level are searched at once combining the DNs in
+    ``(|(member=...)(member=...))`` filters. Direct memberships are memoized
+    and shared across all lookups of this resolver, thus each DN is looked up
+    only once. Cycles in nested groups are detected and resolved.
+
+    Groups are searched in ``search_base`` using ``group_filter`` and the
+    ``member_attributes`` holding the DNs of their members.
+
+    *Example*::
+
+        >>> resolver = MembershipResolver(conn, "ou=Groups,dc=example,dc=com")
+        >>> resolver.groups("uid=guest,ou=People,dc=example,dc=com")
+        {'cn=staff,ou=Groups,dc=example,dc=com',
+         'cn=everyone,ou=Groups,dc=example,dc=com'}
+
+    """
+
+    def __init__(self, conn, search_base, group_filter=GROUP_FILTER,
+                 member_attributes=MEMBER_ATTRIBUTES, chunk_size=CHUNK_SIZE,
+                 max_filter_length=MAX_FILTER_LENGTH):
+        self.conn = conn
+        self.search_base = search_base
+        self.group_filter = group_filter
+        self.member_attributes = member_attributes
+        self.chunk_size = chunk_size
+        self.max_filter_length = max_filter_length
+        self._parents = {}  # dn_key -> set of dn_keys of direct groups
+        self._children = {}  # dn_key -> set of dn_keys of direct members
+        self._names = {}  # dn_key -> DN
+
+    def _key(self, dn):
+        key = dn_key(dn)
+        self._names.setdefault(key, dn)
+        return key
+
+    def _search(self, search_filter, attributes):
+        self.conn.search(self.search_base, search_filter, SUBTREE,
+                         attributes=attributes)
+        return [response for response in self.conn.response or []
+                if response["type"] == "searchResEntry"]
+
+    def _lookup_parents(self, keys):
+        """Memoizes the direct groups of all DNs in ``keys`` using batched
+        searches."""
+        assertions = ["({}={})".format(attr, escape_filter_chars(
+            self._names[key])) for key in keys
+            for attr in self.member_attributes]
+        lookup = set(keys)
+        for key in keys:
+            self._parents[key] = set()
+        for chunk in chunks(assertions, self.chunk_size,
+                            self.max_filter_length):
+            search_filter = "(&{}(|{}))".format(self.group_filter,
+                                                ''.join(chunk))
+            for response in self._search(search_filter,
+                                         list(self.member_attributes)):
+                group = self._key(response["dn"])
+                members = set(self._key(dn) for dn in
+                              _values(response, self.member_attributes))
+                self._children[group] = members
+                for member in members & lookup:
+                    self._parents[member].add(group)
+
+    def _lookup_children(self, keys):
+        """Memoizes the direct members of all groups in ``keys`` using
+        :py:func:`~ldap3_orm.bulk.get_many`."""
+        entries = get_many(self.conn, [self._names[key] for key in keys],
+                           attributes=list(self.member_attributes),
+                           chunk_size=self.chunk_size,
+                           max_filter_length=self.max_filter_length)
+        for dn, response in entries.items():
+            self._children[dn_key(dn)] = set(
+                self._key(member) for member in
+                _values(response, self.member_attributes)) \
+                if response else set()
+
+    def _expand(self, dn, memo, lookup):
+        start = self._key(dn)
+        visited = set([start])
+        level = [start]
+        while level:  # breadth-first, one batched lookup per level
+            unknown = [key for key in level if key not in memo]
+            if unknown:
+                lookup(unknown)
+            level = list(set(key for current in level for key in memo[current]
+                             if key not in visited))
+            visited.update(level)  # detects cycles
+        visited.discard(start)
+        return set(self._names[key] for key in visited)
+
+    def groups(self, dn):
+        """Returns the DNs of all groups ``dn`` belongs to either directly or
+        through nested groups."""
+        return self._expand(dn, self._parents, self._lookup_parents)
+
+    def members(self, group):
+        """Returns the DNs of all direct and nested members of ``group``
+        including nested groups."""
+        return self._expand(group, self._children, self._lookup_children)
+
+    def closure(self, search_base=None):
+        """Returns a :py:class:`MembershipIndex` holding the transitive
+        closure of all groups in ``search_base`` or the search base of this
+        resolver.
+
+        All groups are read in a single paged search. The closure is computed
+        in memory for each strongly connected component of the membership
+        graph, thus groups nested in cycles share the same members.
+
+        """
+        graph = {}
+        responses = self.conn.extend.standard.paged_search(
+            search_base or self.search_base, self.group_filter, SUBTREE,
+            attributes=list(self.member_attributes), paged_size=PAGE_SIZE,
+            generator=True)
+        for response in responses:
+            if response["type"] != "searchResEntry":
+                continue
+            graph[self._key(response["dn"])] = set(
+                self._key(dn) for dn in
+                _values(response, self.member_attributes))
+        self._children.update(graph)
+        return MembershipIndex(_transitive_closure(graph), dict(self._names))
+
+
+def _transitive_closure(graph):
+    """Returns the transitive closure of ``graph`` mapping each node to the
+    set of its successors using Tarjan's strongly connected components
+    algorithm. Components are emitted in reverse topological order which
+    allows reusing the closure of all successor components."""
+    index = {}
+    lowlink = {}
+    component_of = {}
+    closures = []  # closure of each component
+    stack = []
+    on_stack = set()
+    counter = [0]
+
+    def strongconnect(root):
+        work = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = counter[0]
+        counter[0] += 1
+        stack.append(root)
+        on_stack.add(root)
+        while work:
+            node, successors = work[-1]
+            for successor in successors:
+                if successor not in index:
+                    index[successor] = lowlink[successor] = counter[0]
+                    counter[0] += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor,
+                                 iter(graph.get(successor, ()))))
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[successor])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        members.append(member)
+                        if member == node:
+                            break
+                    closure = set()
+                    for member in members:
+                        for successor in graph.get(member, ()):
+                            closure.add(successor)
+                            if successor in component_of and \
+                                    component_of[successor] != len(closures):
+                                closure.update(
+                                    closures[component_of[successor]])
+                        component_of[member] = len(closures)
+                    closures.append(frozenset(closure))
+
+    for node in graph:
+        if node not in index:
+            strongconnect(node)
+    # groups nested in cycles are not reported as members of themselves
+    return dict((node, closures[component_of[node]] - frozenset([node]))
+                for node in graph)
@@ -0,0 +1,220 @@
+# coding: utf-8
+
+from collections import namedtuple
+from random import random, sample
+from threading import Lock
+from timeit import default_timer
+
+from ldap3 import RANDOM, ServerPool
+from ldap3.core.exceptions import LDAPServerPoolExhaustedError
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# weight of the latest response time in the moving average
+ALPHA = 0.3
+# servers slower than the fastest server by this factor are ejected
+EJECT_FACTOR = 3.0
+# number of response times observed before a server can be ejected as slow
+MIN_SAMPLES = 10
+# number of consecutive failures ejecting a server
+MAX_FAILURES = 3
+# seconds until an ejected server is checked for reinstatement
+EJECT_TIME = 30.0
+
+
+MemberStatus = namedtuple("MemberStatus", ["server", "latency", "samples",
+                                           "failures", "ejected"])
+
+
+class _Member(object):
+
+    __slots__ = ("server", "latency", "samples", "failures", "ejected_until")
+
+    def __init__(self, server):
+        self.server = server
+        self.reset()
+
+    def reset(self):
+        self.latency = None  # exponentially weighted moving average
+        self.samples = 0
+        self.failures = 0
+        self.ejected_until = None
+
+
+def _weighted_choice(members):
+    """Returns one of ``members`` chosen randomly with a probability
+    proportional to the inverse of its average response time."""
+    weights = [1. / max(member.latency, 1e-6) for member in members]
+    threshold = random() * sum(weights)
+    for member, weight in zip(members, weights):
+        threshold -= weight
+        if threshold < 0:
+            return member
+    return members[-1]
+
+
+class LatencyServerPool(ServerPool):
+    """:py:class:`ldap3.ServerPool <ldap3.core.pooling.ServerPool>` selecting
+    servers by their exponentially weighted moving average (EWMA) of
+    observed response times.
+
+    Response times are reported using :py:meth:`observe`, which is done by
+    :py:class:`ldap3_orm.Connection <ldap3_orm._connection.Connection>` for
+    all synchronous searches. Servers are selected randomly with a
+    probability proportional to the inverse of their average, which spreads
+    the connections of all clients over the servers by their speed. Servers
+    which have not been measured yet are preferred.
+
+    Servers whose average is ``eject_factor`` times slower than the fastest
+    server after ``min_samples`` observations and servers failing
+    ``max_failures`` times in a row are ejected. After ``eject_time``
+    seconds ejected servers are health checked using
+    :py:meth:`ldap3.Server.check_availability
+    <ldap3.core.server.Server.check_availability>` when selecting a server
+    and reinstated without any observations on success. The last available
+    server is never ejected.
+
+    """
+
+    def __init__(self, servers=None, alpha=ALPHA, eject_factor=EJECT_FACTOR,
+                 min_samples=MIN_SAMPLES, max_failures=MAX_FAILURES,
+                 eject_time=EJECT_TIME):
+        ServerPool.__init__(self, servers, RANDOM)
+        self.alpha = alpha
+        self.eject_factor = eject_factor
+        self.min_samples = min_samples
+        self.max_failures = max_failures
+        self.eject_time = eject_time
+        self._members = []
+        self._lock = Lock()
+
+    def _member(self, server):
+        for member in self._members:
+            if member.server is server:
+                return member
+        member = _Member(server)
+        self._members.append(member)
+        return member
+
+    def _available(self, now):
+        """Returns the members of all servers which are not ejected."""
+        return [member for member in map(self._member, self.servers)
+                if member.ejected_until is None or
+                member.ejected_until <= now]
+
+    def _eject(self, member):
+        now = default_timer()
+        if any(other is not member for other in self._available(now)):
+            member.ejected_until = now + self.eject_time
+
+    def observe(self, server, elapsed):
+        """Records the response time ``elapsed`` in seconds of ``server``."""
+        with self._lock:
+            member = self._member(server)
+            member.latency = elapsed if member.latency is None else \
+                self.alpha * elapsed + (1 - self.alpha) * member.latency
+            member.samples += 1
+            member.failures = 0
+            if member.samples < self.min_samples:
+                return
+            fastest = min([other.latency for other in
+                           self._available(default_timer())
+                           if other.samples >= self.min_samples] or
+                          [member.latency])
+            if member.latency > self.eject_factor * fastest:
+                self._eject(member)
+
+    def failure(self, server):
+        """Records a failed operation or connection attempt of ``server``."""
+        with self._lock:
+            member = self._member(server)
+            member.failures += 1
+            if member.failures >= self.max_failures:
+                self._eject(member)
+
+    def ejected(self, server):
+        """Returns ``True`` if ``server`` is currently ejected."""
+        with self._lock:
+            ejected_until = self._member(server).ejected_until
+            return ejected_until is not None and \
+                ejected_until > default_timer()
+
+    def status(self):
+        """Returns a list of :py:class:`MemberStatus` tuples of all
+        servers."""
+        with self._lock:
+            now = default_timer()
+            return [MemberStatus(member.server, member.latency,
+                                 member.samples, member.failures,
+                                 member.ejected_until is not None and
+                                 member.ejected_until > now)
+                    for member in map(self._member, self.servers)]
+
+    def _health_check(self, member):
+        """Health checks the ejected ``member`` without holding the lock and
+        reinstates it on success."""
+        available = member.server.check_availability()
+        with self._lock:
+            if available:
+                member.reset()
+            else:
+                member.ejected_until = default_timer() + self.eject_time
+        return available
+
+    def get_server(self, connection):
+        # restartable strategies request a new server after a failure
+        if getattr(connection.strategy, "_restarting", False) and \
+                connection.server is not None:
+            self.failure(connection.server)
+        with self._lock:
+            now = default_timer()
+            members = self._available(now)
+            expired = [member for member in members
+                       if member.ejected_until is not None]
+            # other connections skip the members while being health checked
+            for member in expired:
+                member.ejected_until = now + self.eject_time
+        # health checks may block until a timeout, thus are performed
+        # without holding the lock
+        for member in expired:
+            self._health_check(member)
+        with self._lock:
+            candidates = [member for member in members
+                          if member.ejected_until is None]
+            if not candidates:
+                raise LDAPServerPoolExhaustedError(
+                    "no active server available in server pool")
+            unmeasured = [member for member in candidates
+                          if member.latency is None]
+            if unmeasured:
+                member = sample(unmeasured, 1)[0]
+            else:
+                member = _weighted_choice(candidates)
+        state = self.pool_states.get(connection)
+        if state is not None:
+            state.last_used_server = self.servers.index(member.server)
+        return member.server
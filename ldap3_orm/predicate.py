@@ -0,0 +1,345 @@
+# coding: utf-8
+
+import re
+from collections import OrderedDict
+
+from ldap3.core.exceptions import LDAPInvalidDnError, LDAPInvalidFilterError
+from ldap3.operation.search import AND, OR, NOT, MATCH_APPROX, \
+    MATCH_GREATER_OR_EQUAL, MATCH_EXTENSIBLE, MATCH_PRESENT, \
+    MATCH_SUBSTRING, MATCH_EQUAL
+from ldap3_orm.filter import assertion_value, parse_filter
+from ldap3_orm.matching import MatchingRules, case_exact, case_ignore, \
+    numeric_string, telephone_number, text
+from ldap3_orm.pycompat import string_types
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+def _present(value):
+    return value is not None and value != [] and value != ''
+
+
+def _items(value):
+    if value.__class__ is list:
+        return value
+    return () if value is None else (value,)
+
+
+def _compare(value, normalize, test):
+    for item in _items(value):
+        try:
+            if test(normalize(item)):
+                return True
+        # undefined for this value
+        except (TypeError, ValueError, LDAPInvalidDnError):
+            continue
+    return False
+
+
+# the most common matching rule is inlined comparing the whitespace
+# separated words of the lower case values for equality, which is equivalent
+# to comparing the normalized values without joining the words again, and
+# using regular expressions matching any whitespace between the words of the
+# assertion for substrings
+
+def _case_ignore_equal(value, words):
+    for item in value if value.__class__ is list else _items(value):
+        if (item if item.__class__ is str else text(item)).lower().split() \
+                == words:
+            return True
+    return False
+
+
+def _case_ignore_pattern(initial, middle, final):
+    """Returns a regular expression matching values whose normalization
+    starts with ``initial``, contains the list of substrings ``middle`` and
+    ends with ``final``."""
+    def words(part):
+        return r"\s+".join(re.escape(word) for word in part.split(' '))
+
+    pattern = r"\s*" + words(initial) + \
+        ''.join(".*?" + words(part) for part in middle)
+    if final:
+        pattern += ".*?" + words(final)
+        pattern += r"\s*\Z"
+    return re.compile(pattern, re.IGNORECASE | re.UNICODE | re.DOTALL).match
+
+
+def _case_ignore_match(value, match):
+    for item in value if value.__class__ is list else _items(value):
+        if match(item if item.__class__ is str else text(item)):
+            return True
+    return False
+
+
+def _case_ignore_compare(value, test):
+    for item in value if value.__class__ is list else _items(value):
+        if item.__class__ is str or isinstance(item, string_types):
+            if test(' '.join(item.lower().split())):
+                return True
+        elif _compare(item, case_ignore, test):
+            return True
+    return False
+
+
+def _substring(initial, middle, final):
+    if not middle and not final:
+        return lambda value: value.startswith(initial)
+    if not middle and not initial:
+        return lambda value: value.endswith(final)
+
+    def match(value):
+        if not value.startswith(initial):
+            return False
+        pos = len(initial)
+        for part in middle:
+            pos = value.find(part, pos)
+            if pos < 0:
+                return False
+            pos += len(part)
+        return len(value) - pos >= len(final) and value.endswith(final)
+    return match
+
+
+def _constant(namespace, obj):
+    """Adds ``obj`` to ``namespace`` and returns its name."""
+    name = "_{}".format(len(namespace))
+    namespace[name] = obj
+    return name
+
+
+# values consisting of a single string are matched inline
+_SINGLE = "{0}.__class__ is list and len({0}) == 1 and " \
+    "{0}[0].__class__ is str"
+
+
+def _assertion(node, schema, value, lookup, namespace):
+    """Returns a Python expression evaluating the assertion ``node`` on the
+    attribute value of the local variable ``value`` or the value returned by
+    the expression ``lookup`` if ``value`` is missing. Constants are added to
+    ``namespace``."""
+    attr = node.assertion["attr"]
+
+    def constant(obj):
+        return _constant(namespace, obj)
+
+    if node.tag == MATCH_PRESENT:
+        return "_present({})".format(lookup)
+    if node.tag == MATCH_SUBSTRING:
+        normalize = schema.rule(attr, "substring")
+        if normalize not in (case_exact, numeric_string, telephone_number):
+            normalize = case_ignore
+        assertion = node.assertion
+        initial = normalize(assertion_value(assertion["initial"])) \
+            if assertion.get("initial") else ''
+        middle = [normalize(assertion_value(part))
+                  for part in assertion.get("any") or []]
+        final = normalize(assertion_value(assertion["final"])) \
+            if assertion.get("final") else ''
+        if normalize is case_ignore:
+            match = constant(_case_ignore_pattern(initial, middle, final))
+            return "({1}({0}[0]) is not None if {2} else " \
+                "_case_ignore_match({3}, {1}))".format(
+                    value, match, _SINGLE.format(value), lookup)
+        test = _substring(initial, middle, final)
+    elif node.tag in (MATCH_EQUAL, MATCH_APPROX):
+        normalize = schema.rule(attr, "equality")
+        assertion = normalize(assertion_value(node.assertion["value"]))
+        if normalize is case_ignore:
+            return "({0}[0].lower().split() == {1} if {2} else " \
+                "_case_ignore_equal({3}, {1}))".format(
+                    value, constant(assertion.split()), _SINGLE.format(value),
+                    lookup)
+        test = assertion.__eq__
+    else:
+        normalize = schema.rule(attr, "ordering")
+        assertion = normalize(assertion_value(node.assertion["value"]))
+        test = (lambda other: other >= assertion) \
+            if node.tag == MATCH_GREATER_OR_EQUAL else \
+            (lambda other: other <= assertion)
+    if normalize is case_ignore:
+        return "_case_ignore_compare({}, {})".format(lookup, constant(test))
+    return "_compare({}, {}, {})".format(lookup, constant(normalize),
+                                         constant(test))
+
+
+def _cost(node):
+    """Returns the estimated relative cost of evaluating ``node``."""
+    if node.tag in (AND, OR):
+        return sum(_cost(element) for element in node.elements)
+    if node.tag == NOT:
+        return _cost(node.elements[0])
+    if node.tag == MATCH_PRESENT:
+        return 1
+    if node.tag in (MATCH_EQUAL, MATCH_APPROX, MATCH_SUBSTRING):
+        return 2
+    return 3
+
+
+def _compile(node, schema, namespace, lookups):
+    """Returns a Python expression evaluating ``node`` on the dictionary of
+    attributes ``a``. The names of all attributes are added to ``lookups``
+    mapping them to the local variable holding the value found by these
+    names. Constants are added to ``namespace``."""
+    if node.tag in (AND, OR):
+        operator = " and " if node.tag == AND else " or "
+        # cheap elements first as the evaluation stops at the first false
+        # element of AND and true element of OR
+        return '(' + operator.join(_compile(element, schema, namespace,
+                                            lookups)
+                                   for element in sorted(node.elements,
+                                                         key=_cost)) + ')'
+    if node.tag == NOT:
+        return "(not {})".format(_compile(node.elements[0], schema,
+                                          namespace, lookups))
+    if node.tag == MATCH_EXTENSIBLE:
+        raise LDAPInvalidFilterError("Extensible matches are not supported: "
+                                     "%s" % node.assertion)
+    if node.tag == MATCH_PRESENT and \
+            node.assertion["attr"].lower() == "objectclass":
+        return "True"
+    names = schema.names(node.assertion["attr"])
+    if names not in lookups:
+        lookups[names] = "v{}".format(len(lookups))
+    value = lookups[names]
+    # the case-folded keys are only compared if none of the names is found
+    # and some of the keys are not known to be the keys of other attributes
+    misses = _constant(namespace, set())
+    lookup = "({} or (None if {}.issuperset(a) else " \
+        "_lookup(a, {}, {}, {})))".format(
+            value, misses, _constant(namespace, frozenset(
+                str(name).lower() for name in names)),
+            _constant(namespace, []), misses)
+    return _assertion(node, schema, value, lookup, namespace)
+
+
+def _lookup(attributes, names, spellings, misses):
+    """Returns the value of the attribute of ``attributes`` whose case-folded
+    key is one of ``names``, as attribute descriptions are case insensitive.
+    The ``spellings`` of the keys found are looked up first and the keys not
+    matching are added to ``misses``."""
+    for key in spellings:
+        value = attributes.get(key)
+        if value is not None:
+            return value
+    for key in attributes:
+        if key.lower() in names:
+            if key not in spellings:
+                spellings.append(key)
+            return attributes[key]
+        misses.add(key)
+    return None
+
+
+class _EntryValues(object):
+    """Mapping of the names of the attributes of an entry to their values
+    looked up in the attributes of the entry without copying them."""
+
+    __slots__ = ("attributes",)
+
+    def __init__(self, entry):
+        self.attributes = entry._state.attributes
+
+    def __iter__(self):
+        return iter(self.attributes)
+
+    def __getitem__(self, key):
+        return self.attributes[key].values
+
+    def get(self, key):
+        attribute = self.attributes.get(key)
+        return None if attribute is None else attribute.values
+
+
+def _attributes(entry):
+    if isinstance(entry, dict):
+        # search responses hold the attributes in a separate dictionary
+        return entry["attributes"] if "raw_attributes" in entry else entry
+    return _EntryValues(entry)
+
+
+def compile_predicate(search_filter, schema=None):
+    """Compiles ``search_filter``, which can either be an LDAP filter string
+    as defined in RFC 4515 or an ORM Filter Expression, into a predicate
+    evaluating the filter in-process without a server round trip, e.g.::
+
+        >>> predicate = compile_predicate(User.surname == "User",
+        ...                               conn.server.schema)
+        >>> [user for user in cached_users if predicate(user)]
+
+    The predicate accepts :py:class:`~ldap3_orm.entry.EntryBase` instances,
+    ``searchResEntry`` responses and dictionaries mapping ldap attribute
+    names to values or lists of values.
+
+    Values are compared using the equality, ordering and substring matching
+    rules of the attribute types in ``schema``, which is a
+    :py:class:`~ldap3.protocol.rfc4512.SchemaInfo`, following superior
+    attribute types. Attributes are looked up by all of their names defined
+    in ``schema`` ignoring case. Case ignore matching is used for attributes
+    without matching rules and if ``schema`` is not given. Approximate
+    matches are evaluated as equality matches, extensible matches are not
+    supported and raise
+    :py:exc:`~ldap3.core.exceptions.LDAPInvalidFilterError`.
+
+    As defined in RFC 4511 assertions on missing attributes or values which
+    cannot be normalized, e.g. a non-numeric value of an integer attribute,
+    evaluate to ``False``, thus ``(!(x=y))`` matches them.
+
+    The filter is compiled into a single Python function. Each assertion
+    still costs up to a microsecond per entry in CPython, thus filtering
+    millions of entries takes seconds and a server side search, which can
+    use indices, should be preferred for large result sets.
+
+    """
+    namespace = dict(_attributes=_attributes, _lookup=_lookup,
+                     _present=_present, _compare=_compare,
+                     _case_ignore_equal=_case_ignore_equal,
+                     _case_ignore_match=_case_ignore_match,
+                     _case_ignore_compare=_case_ignore_compare)
+    lookups = OrderedDict()
+    expression = _compile(parse_filter(search_filter), MatchingRules(schema),
+                          namespace, lookups)
+    # evaluate the whole filter in a single function, the values of all
+    # attributes are looked up by their names once
+    source = '\n    '.join(
+        ["def predicate(entry):",
+         "a = entry if entry.__class__ is dict and "
+         "'raw_attributes' not in entry else _attributes(entry)"] +
+        ["{} = {}".format(value, " or ".join("a.get({!r})".format(str(name))
+                                            for name in names))
+         for names, value in lookups.items()] +
+        ["return {}".format(expression)]) + '\n'
+    exec(compile(source, "<predicate>", "exec"), namespace)
+    return namespace["predicate"]
+
+
+def select(search_filter, entries, schema=None):
+    """Yields all ``entries`` matching ``search_filter`` which is compiled
+    once using :py:func:`compile_predicate`."""
+    predicate = compile_predicate(search_filter, schema)
+    for entry in entries:
+        if predicate(entry):
+            yield entry
@@ -3,10 +3,13 @@
 import io
 from six import PY2
 # pylint: disable=unused-import
-from six import add_metaclass, callable, iteritems, reraise, string_types
+from six import add_metaclass, callable, iteritems, itervalues, reraise, \
+    string_types
 # pylint: disable=unused-import
 from six.moves import input
 # pylint: disable=unused-import
+from six.moves.queue import Empty, Full, Queue
+# pylint: disable=unused-import
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
 from ldap3_orm._version import __version__, __revision__
@@ -0,0 +1,349 @@
+# coding: utf-8
+
+import heapq
+from itertools import islice
+
+from ldap3 import SUBTREE
+from ldap3.utils.ciDict import CaseInsensitiveDict
+from ldap3_orm._config import config
+from ldap3_orm.attribute import generative
+from ldap3_orm.bulk import get_many
+from ldap3_orm.controls import SORT_CONTROL, VLV_CONTROL, sort_control, \
+    supported_controls, vlv_control
+from ldap3_orm.deadline import iter_within
+from ldap3_orm.utils import attribute_name, compile_filter, model_attributes
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# page size used for streaming results sorted on the client
+SORT_PAGE_SIZE = 500
+# number of entries whose references are resolved together on prefetching
+PREFETCH_SIZE = 1000
+
+
+class _SortKey(object):
+    """Sort key of a search response supporting mixed sort directions.
+
+    Missing attribute values are sorted after all other values as defined
+    in RFC 2891.
+
+    """
+
+    __slots__ = ("values", "reverse")
+
+    def __init__(self, response, order):
+        attributes = CaseInsensitiveDict(response["attributes"])
+        self.values = []
+        self.reverse = []
+        for attr, reverse in order:
+            value = attributes.get(attr)
+            if isinstance(value, list):
+                value = value[0] if value else None
+            if hasattr(value, "lower"):
+                value = value.lower()
+            self.values.append(value)
+            self.reverse.append(reverse)
+
+    def __lt__(self, other):
+        for this, that, reverse in zip(self.values, other.values,
+                                       self.reverse):
+            if this == that:
+                continue
+            if this is None:
+                return False
+            if that is None:
+                return True
+            return this > that if reverse else this < that
+        return False
+
+
+class Query(object):
+    """Search for entries of an ORM model derived from
+    :py:class:`~ldap3_orm.entry.EntryBase`.
+
+    Queries are usually created using
+    :py:meth:`EntryBase.search() <ldap3_orm.entry.EntryBase.search>` and
+    executed lazily on iteration. Only the ldap attributes defined on the
+    model are requested from the server. This projection can be changed per
+    query using the generative methods :py:meth:`only` and :py:meth:`defer`,
+    e.g.::
+
+        >>> User.search(User.surname == "User").defer("password").all()
+        [DN: uid=guest,ou=People,dc=example,dc=com - STATUS: Read
+             cn: Guest User
+             givenName: Guest
+             mail: guest.user@example.com
+             sn: User
+             uid: guest]
+
+    The search is restricted to entries of the ``object_classes`` of the
+    model. If ``search_base`` is not given the ``base_dn`` class attribute
+    of the model or the configured ``base_dn`` is used. If ``conn`` is not
+    given the connection singleton :py:data:`ldap3_orm.connection.conn` is
+    used.
+
+    Results can be sorted and sliced using :py:meth:`order_by`,
+    :py:meth:`offset` and :py:meth:`limit`, e.g.::
+
+        >>> User.search().order_by("surname", "-givenname") \\
+        ...     .offset(50).limit(25)
+
+    The server side sort control (RFC 2891) and the virtual list view control
+    are used if the server supports them. Thus just the requested page is
+    transferred. Otherwise all entries are streamed using a paged search and
+    the page is selected on the client keeping just ``offset + limit`` entries
+    in memory.
+
+    All further keyword arguments are passed to
+    :py:func:`ldap3_orm.Connection.search
+    <ldap3.core.connection.Connection.search>`. If ``paged_size`` is given
+    the search is performed as a paged search and entries are created while
+    pages are retrieved.
+
+    If ``timeout`` is given all searches of the query, i.e. all pages and
+    the prefetched references, are performed within ``timeout`` seconds in
+    total starting with the first entry retrieved, see
+    :py:func:`ldap3_orm.deadline.iter_within`. Time spent processing the
+    entries does not count.
+
+    """
+
+    def __init__(self, model, search_filter=None, search_base=None,
+                 search_scope=SUBTREE, conn=None, timeout=None, **kwargs):
+        self.model = model
+        self.search_filter = search_filter
+        self.search_base = search_base
+        self.search_scope = search_scope
+        self.conn = conn
+        self.timeout = timeout
+        self.kwargs = kwargs
+        self._only = None
+        self._defer = ()
+        self._order_by = ()
+        self._offset = 0
+        self._limit = None
+        self._prefetch = ()
+
+    @generative
+    def only(self, *names):
+        """Request only the given attributes."""
+        self._only = names
+
+    @generative
+    def defer(self, *names):
+        """Do not request the given attributes."""
+        self._defer += names
+
+    @generative
+    def order_by(self, *names):
+        """Sort entries by the given attributes. Names prefixed with ``-``
+        are sorted in descending order."""
+        self._order_by = names
+
+    @generative
+    def offset(self, offset):
+        """Skip the first ``offset`` entries."""
+        self._offset = offset
+
+    @generative
+    def limit(self, limit):
+        """Return at most ``limit`` entries."""
+        self._limit = limit
+
+    @generative
+    def prefetch(self, *names):
+        """Resolve the entries referenced by the given attributes defined
+        using :py:class:`~ldap3_orm.attribute.ReferenceAttrDef` in batches.
+
+        Referenced DNs are collected for up to :py:data:`PREFETCH_SIZE`
+        entries and read using :py:func:`~ldap3_orm.bulk.get_many`. Each DN
+        is read just once per query. Resolved entries are available using
+        :py:meth:`~ldap3_orm.entry.EntryBase.entry_references`, e.g.::
+
+            >>> for group in Group.search().prefetch("member"):
+            ...     print(group.cn, [user.uid for user in
+            ...                      group.entry_references("member")])
+
+        """
+        self._prefetch += names
+
+    @property
+    def order(self):
+        """List of ``(attribute, reverse)`` tuples used for sorting."""
+        return [(attribute_name(self.model, name.lstrip('-')),
+                 name.startswith('-')) for name in self._order_by]
+
+    @property
+    def attributes(self):
+        """List of ldap attributes requested from the server."""
+        if self._only is None:
+            attributes = model_attributes(self.model)
+        else:
+            attributes = [attribute_name(self.model, name)
+                          for name in self._only]
+        deferred = set(attribute_name(self.model, name).lower()
+                       for name in self._defer)
+        return [attr for attr in attributes if attr.lower() not in deferred]
+
+    @property
+    def query_filter(self):
+        """The compiled LDAP filter including the object classes of the
+        model."""
+        components = ["(objectClass={})".format(object_class) for
+                      object_class in sorted(self.model.object_classes)]
+        if self.search_filter is not None:
+            components.append(compile_filter(self.search_filter))
+        if not components:
+            return "(objectClass=*)"
+        if len(components) == 1:
+            return components[0]
+        return "(&{})".format(''.join(components))
+
+    @property
+    def base(self):
+        if self.search_base is not None:
+            return self.search_base
+        return getattr(self.model, "base_dn", None) or config.base_dn
+
+    @property
+    def connection(self):
+        if self.conn is None:
+            # pylint: disable=redefined-outer-name
+            from ldap3_orm.connection import conn
+            return conn
+        return self.conn
+
+    def _search(self, attributes, controls=None, paged_size=None,
+                size_limit=None):
+        conn = self.connection
+        kwargs = dict(self.kwargs)
+        if controls:
+            kwargs["controls"] = list(kwargs.get("controls") or []) + controls
+        configured_paged_size = kwargs.pop("paged_size", None)
+        if paged_size is None:
+            paged_size = configured_paged_size
+        if size_limit and not paged_size:
+            # the server stops after the entries which are not skipped
+            kwargs["size_limit"] = min(kwargs.get("size_limit") or size_limit,
+                                       size_limit)
+        if paged_size:
+            responses = conn.extend.standard.paged_search(
+                self.base, self.query_filter, self.search_scope,
+                attributes=attributes, paged_size=paged_size, generator=True,
+                **kwargs)
+        else:
+            result = conn.search(self.base, self.query_filter,
+                                 self.search_scope, attributes=attributes,
+                                 **kwargs)
+            if conn.strategy.sync:
+                responses = conn.response or []
+            else:
+                responses = conn.get_response(result)[0]
+        return (response for response in responses
+                if response["type"] == "searchResEntry")
+
+    def _responses(self):
+        stop = None if self._limit is None else self._offset + self._limit
+        order = self.order
+        if not order:
+            return islice(self._search(self.attributes, size_limit=stop),
+                          self._offset, stop)
+        supported = supported_controls(self.connection)
+        if SORT_CONTROL in supported:
+            controls = [sort_control(order)]
+            if VLV_CONTROL in supported and self._limit is not None:
+                controls.append(vlv_control(self._offset, self._limit))
+                # virtual list views cannot be combined with paged searches
+                return islice(self._search(self.attributes, controls,
+                                           paged_size=0), 0, self._limit)
+            return islice(self._search(self.attributes, controls,
+                                       size_limit=stop), self._offset, stop)
+        # sort on the client streaming all entries
+        attributes = self.attributes
+        lowered = set(attr.lower() for attr in attributes)
+        attributes += [attr for attr, _ in order
+                       if attr.lower() not in lowered]
+        responses = self._search(attributes, paged_size=self.kwargs.get(
+            "paged_size") or SORT_PAGE_SIZE)
+        key = lambda response: _SortKey(response, order)
+        if stop is None:
+            return sorted(responses, key=key)[self._offset:]
+        return heapq.nsmallest(stop, responses, key=key)[self._offset:]
+
+    def _resolve(self, entries, cache):
+        for name in self._prefetch:
+            attrdef = self.model._reference_attrdef(name)
+            dns = set()
+            for entry in entries:
+                if attrdef.name in entry._state.attributes:
+                    dns.update(entry._state.attributes[attrdef.name].values)
+            missing = [dn for dn in dns if (attrdef.name, dn) not in cache]
+            for dn, referenced in get_many(self.connection, missing,
+                                           attrdef.model).items():
+                cache[(attrdef.name, dn)] = referenced
+            for entry in entries:
+                values = entry._state.attributes[attrdef.name].values \
+                    if attrdef.name in entry._state.attributes else []
+                entry._state.references[attrdef.name] = [
+                    cache[(attrdef.name, dn)] for dn in values
+                    if cache[(attrdef.name, dn)] is not None]
+        return entries
+
+    def __iter__(self):
+        if self.timeout is None:
+            return self._entries()
+        return iter_within(self._entries(), self.timeout)
+
+    def _entries(self):
+        entries = (self.model._from_response(response)
+                   for response in self._responses())
+        if not self._prefetch:
+            for entry in entries:
+                yield entry
+            return
+        cache = {}
+        while True:
+            chunk = list(islice(entries, PREFETCH_SIZE))
+            if not chunk:
+                return
+            for entry in self._resolve(chunk, cache):
+                yield entry
+
+    def all(self):
+        """Execute the query and return a list of all entries."""
+        return list(self)
+
+    def first(self):
+        """Execute the query and return the first entry or ``None``."""
+        for entry in self:
+            return entry
+        return None
+
+    def _clone(self):
+        o = self.__class__.__new__(self.__class__)
+        o.__dict__ = self.__dict__.copy()
+        return o
@@ -0,0 +1,101 @@
+# coding: utf-8
+
+import logging
+from collections import namedtuple
+from threading import Lock
+
+from ldap3_orm.filter import fingerprint
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+log = logging.getLogger(__name__)
+
+
+QueryShape = namedtuple("QueryShape", ["fingerprint", "scope", "count",
+                                       "total", "max", "entries"])
+
+
+class QueryReport(list):
+    """List of :py:class:`QueryShape` items rendered as a table."""
+
+    def __str__(self):
+        lines = ["{:>10} {:>6} {:>10} {:>8}  {:<8} {}".format(
+            "total [s]", "count", "max [s]", "entries", "scope", "filter")]
+        for shape in self:
+            lines.append("{:10.3f} {:6d} {:10.3f} {:8d}  {:<8} {}".format(
+                shape.total, shape.count, shape.max, shape.entries,
+                shape.scope, shape.fingerprint))
+        return '\n'.join(lines)
+
+    __repr__ = __str__
+
+
+class QueryLog(object):
+    """Collects the elapsed time of search operations aggregated by their
+    query shape, i.e. the :py:func:`~ldap3_orm.filter.fingerprint` of the
+    search filter and the search scope.
+
+    Searches taking at least ``threshold`` seconds are logged on the
+    ``ldap3_orm.querylog`` logger with level ``WARNING`` including the
+    fingerprint, search base, scope, requested attributes, number of
+    returned entries and the elapsed time. Logging slow searches is disabled
+    if ``threshold`` is ``None``.
+
+    """
+
+    def __init__(self, threshold=None):
+        self.threshold = threshold
+        self._shapes = {}
+        self._lock = Lock()
+
+    def record(self, search_base, search_filter, search_scope, attributes,
+               entries, elapsed):
+        shape = fingerprint(search_filter)
+        key = (shape, search_scope)
+        with self._lock:
+            count, total, maximum, nentries = self._shapes.get(key,
+                                                               (0, 0., 0., 0))
+            self._shapes[key] = (count + 1, total + elapsed,
+                                 max(maximum, elapsed), nentries + entries)
+        if self.threshold is not None and elapsed >= self.threshold:
+            log.warning("slow search (%.3fs): filter: %s - base: %s - "
+                        "scope: %s - attributes: %s - entries: %d",
+                        elapsed, shape, search_base, search_scope,
+                        attributes, entries)
+
+    def top(self, n=10):
+        """Returns a :py:class:`QueryReport` of the top ``n`` query shapes
+        ordered by the total time spent."""
+        with self._lock:
+            shapes = [QueryShape(key[0], key[1], *value)
+                      for key, value in self._shapes.items()]
+        shapes.sort(key=lambda shape: shape.total, reverse=True)
+        return QueryReport(shapes[:n])
+
+    def reset(self):
+        with self._lock:
+            self._shapes.clear()
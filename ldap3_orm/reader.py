@@ -1,6 +1,7 @@
 # coding: utf-8
 
 from ldap3 import Reader as _Reader
+from ldap3_orm.entry import EntryMeta
 from ldap3_orm.utils import compile_filter
 # pylint: disable=unused-import
 # pylint: disable=protected-access
@@ -29,6 +30,20 @@ along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
 
 
 class Reader(_Reader):
+    """Extends :py:class:`ldap3.Reader <ldap3.abstract.cursor.Reader>` to
+    support ORM Filter Expressions and ORM models.
+
+    If ``object_def`` is an ORM model derived from
+    :py:class:`~ldap3_orm.entry.EntryBase` its object classes and attribute
+    definitions are used and just the ldap attributes defined on the model are
+    requested by default.
+
+    """
+
+    def __init__(self, connection, object_def, *args, **kwargs):
+        if isinstance(object_def, EntryMeta):
+            object_def = object_def._object_def()
+        _Reader.__init__(self, connection, object_def, *args, **kwargs)
 
     def _create_query_filter(self):
         self._query = compile_filter(self.query)
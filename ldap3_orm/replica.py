@@ -0,0 +1,279 @@
+# coding: utf-8
+
+import re
+import sqlite3
+
+from ldap3 import ALL_ATTRIBUTES, SUBTREE
+from ldap3.core.exceptions import LDAPInvalidFilterError
+from ldap3.operation.search import AND, OR, NOT, MATCH_APPROX, \
+    MATCH_GREATER_OR_EQUAL, MATCH_EXTENSIBLE, MATCH_PRESENT, \
+    MATCH_SUBSTRING, MATCH_EQUAL
+from ldap3_orm.bulk import dn_key
+from ldap3_orm.filter import assertion_value, parse_filter
+from ldap3_orm.matching import MatchingRules, integer
+from ldap3_orm.utils import model_attributes
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# page size used for reading the subtree to be replicated
+PAGE_SIZE = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    dn TEXT NOT NULL,
+    dn_key TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS attribute_values (
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    attr TEXT NOT NULL,
+    value,
+    norm TEXT,
+    num INTEGER
+);
+CREATE INDEX IF NOT EXISTS attribute_values_entry
+    ON attribute_values (entry_id, attr);
+"""
+
+_INTEGER = re.compile(r"^[-+]?\d+$")
+
+# driven by the partial index on ``attr`` if the attribute is indexed
+_SUBQUERY = "e.id IN (SELECT v.entry_id FROM attribute_values v " \
+          "WHERE v.attr = ?{})"
+
+
+def _like(value):
+    return value.replace('\\', "\\\\").replace('%', "\\%").replace('_', "\\_")
+
+
+def to_sql(search_filter, schema=None):
+    """Translates ``search_filter``, which can either be an LDAP filter
+    string as defined in RFC 4515 or an ORM Filter Expression, into an SQL
+    expression on the ``entries e`` table of a :py:class:`Replica`.
+
+    Values of attributes whose ordering matching rule in ``schema``, a
+    :py:class:`~ldap3.protocol.rfc4512.SchemaInfo`, is ``integerMatch`` or
+    ``integerOrderingMatch`` are ordered numerically, all other values are
+    ordered case insensitive. Thus all values are ordered as strings if
+    ``schema`` is ``None``, e.g. ``(uidNumber>=10)`` matches ``9``.
+
+    Returns a tuple ``(sql, parameters)``. Extensible matches are not
+    supported and raise
+    :py:exc:`~ldap3.core.exceptions.LDAPInvalidFilterError`.
+
+    """
+    return _to_sql(parse_filter(search_filter), MatchingRules(schema))
+
+
+def _to_sql(node, schema):
+    if node.tag in (AND, OR):
+        parts = [_to_sql(element, schema) for element in node.elements]
+        operator = " AND " if node.tag == AND else " OR "
+        return ('(' + operator.join(sql for sql, _ in parts) + ')',
+                [param for _, params in parts for param in params])
+    if node.tag == NOT:
+        sql, params = _to_sql(node.elements[0], schema)
+        return "NOT " + sql, params
+    if node.tag == MATCH_EXTENSIBLE:
+        raise LDAPInvalidFilterError("Extensible matches are not supported: "
+                                     "%s" % node.assertion)
+    attr = node.assertion["attr"].lower()
+    if node.tag == MATCH_PRESENT:
+        if attr == "objectclass":
+            return "1", []
+        return _SUBQUERY.format(''), [attr]
+    if node.tag == MATCH_SUBSTRING:
+        assertion = node.assertion
+        pattern = _like(assertion_value(assertion["initial"]).lower()) \
+            if assertion.get("initial") else ''
+        for value in assertion.get("any") or []:
+            pattern += '%' + _like(assertion_value(value).lower())
+        pattern += '%'
+        if assertion.get("final"):
+            pattern += _like(assertion_value(assertion["final"]).lower())
+        return _SUBQUERY.format(" AND v.norm LIKE ? ESCAPE '\\'"), \
+            [attr, pattern]
+    value = assertion_value(node.assertion["value"])
+    if node.tag in (MATCH_EQUAL, MATCH_APPROX):
+        return _SUBQUERY.format(" AND v.norm = ?"), [attr, value.lower()]
+    operator = ">=" if node.tag == MATCH_GREATER_OR_EQUAL else "<="
+    if schema.rule(node.assertion["attr"], "ordering") is integer and \
+            _INTEGER.match(value):
+        return _SUBQUERY.format(" AND v.num {} ?".format(operator)), \
+            [attr, int(value)]
+    return _SUBQUERY.format(" AND v.norm {} ?".format(operator)), \
+        [attr, value.lower()]
+
+
+class Replica(object):
+    """Local snapshot of LDAP entries stored in the SQLite database ``path``.
+
+    Entries are stored in a normalized schema of an ``entries`` table and an
+    ``attribute_values`` table holding one row per attribute value. Values
+    are compared case insensitive. Integers are ordered numerically if the
+    ordering matching rule of their attribute in ``schema`` is an integer
+    rule, see :py:func:`to_sql`. Partial indexes are created for all
+    ``indexed_attributes``, e.g.::
+
+        >>> replica = Replica("people.db", indexed_attributes=["uid", "sn"],
+        ...                   schema=conn.server.schema)
+        >>> replica.sync(conn, "ou=People,dc=example,dc=com")
+        >>> replica.search(User.surname == "User", model=User)
+        [DN: uid=guest,ou=People,dc=example,dc=com - STATUS: Read
+             cn: Guest User
+             givenName: Guest
+             mail: guest.user@example.com
+             sn: User
+             uid: guest]
+
+    """
+
+    def __init__(self, path, indexed_attributes=(), schema=None):
+        self.path = path
+        self.schema = schema
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA foreign_keys = ON")
+        self.db.executescript(_SCHEMA)
+        for attr in indexed_attributes:
+            self.create_index(attr)
+
+    def close(self):
+        self.db.close()
+
+    def create_index(self, attr):
+        """Creates an index on the values of the ldap attribute ``attr``."""
+        attr = attr.lower()
+        if not re.match(r"^[a-z0-9-]+$", attr):
+            raise ValueError("Invalid attribute name '%s'" % attr)
+        name = "attribute_values_" + attr.replace('-', '_')
+        with self.db:
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS {0} ON attribute_values "
+                "(attr, norm, entry_id) WHERE attr = '{1}'".format(name, attr))
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS {0}_num ON attribute_values "
+                "(attr, num, entry_id) WHERE attr = '{1}'".format(name, attr))
+
+    def _base_condition(self, search_base):
+        if not search_base:
+            return "1", []
+        key = dn_key(search_base)
+        return "(e.dn_key = ? OR e.dn_key LIKE ? ESCAPE '\\')", \
+            [key, '%,' + _like(key)]
+
+    def sync(self, conn, search_base, search_filter="(objectClass=*)",
+             attributes=ALL_ATTRIBUTES, page_size=PAGE_SIZE):
+        """Replaces all entries in ``search_base`` of this replica with the
+        entries matching ``search_filter`` read from ``conn`` using a paged
+        search. Returns the number of entries stored.
+
+        The snapshot is replaced in a single transaction, thus readers of
+        the database file either see the previous or the new snapshot.
+
+        """
+        responses = conn.extend.standard.paged_search(
+            search_base, search_filter, SUBTREE, attributes=attributes,
+            paged_size=page_size, generator=True)
+        condition, params = self._base_condition(search_base)
+        count = 0
+        with self.db:
+            self.db.execute("DELETE FROM entries WHERE id IN (SELECT e.id "
+                            "FROM entries e WHERE %s)" % condition, params)
+            for response in responses:
+                if response["type"] != "searchResEntry":
+                    continue
+                self.add(response)
+                count += 1
+        return count
+
+    def add(self, response):
+        """Stores the ``searchResEntry`` ``response`` replacing an existing
+        entry with the same DN."""
+        self.db.execute("DELETE FROM entries WHERE dn_key = ?",
+                        [dn_key(response["dn"])])
+        entry_id = self.db.execute(
+            "INSERT INTO entries (dn, dn_key) VALUES (?, ?)",
+            [response["dn"], dn_key(response["dn"])]).lastrowid
+        rows = []
+        for attr, values in response["raw_attributes"].items():
+            for raw in values:
+                try:
+                    value = raw.decode("utf-8")
+                except UnicodeDecodeError:  # binary values are not compared
+                    rows.append((entry_id, attr.lower(), raw, None, None))
+                    continue
+                rows.append((entry_id, attr.lower(), value, value.lower(),
+                             int(value) if _INTEGER.match(value) else None))
+        self.db.executemany("INSERT INTO attribute_values VALUES "
+                            "(?, ?, ?, ?, ?)", rows)
+
+    def search(self, search_filter=None, search_base=None, model=None,
+               attributes=None):
+        """Returns all entries in ``search_base`` of this replica matching
+        ``search_filter`` which is translated using :py:func:`to_sql`.
+
+        Entries are instances of ``model`` if given or dictionaries like
+        ``searchResEntry`` responses otherwise. Just the attributes defined
+        on ``model`` are read by default, all attributes are read if
+        ``model`` is not given. Entries are restricted to the object classes
+        of ``model``.
+
+        """
+        conditions, params = [], []
+        for condition, condition_params in [self._base_condition(
+                search_base)] + [to_sql("(objectClass={})".format(oc)) for
+                                 oc in getattr(model, "object_classes", ())]:
+            conditions.append(condition)
+            params += condition_params
+        if search_filter is not None:
+            condition, condition_params = to_sql(search_filter, self.schema)
+            conditions.append(condition)
+            params += condition_params
+        if attributes is None and model is not None:
+            attributes = model_attributes(model)
+        sql = "SELECT e.id, e.dn, v.attr, v.value FROM entries e " \
+              "LEFT JOIN attribute_values v ON v.entry_id = e.id"
+        if attributes is not None:
+            lowered = [attr.lower() for attr in attributes]
+            sql += " AND v.attr IN ({})".format(', '.join('?' * len(lowered)))
+            params = lowered + params
+        sql += " WHERE {} ORDER BY e.id".format(" AND ".join(conditions))
+        responses = []
+        current = None
+        for entry_id, dn, attr, value in self.db.execute(sql, params):
+            if current is None or current[0] != entry_id:
+                current = (entry_id, dict(type="searchResEntry", dn=dn,
+                                          attributes={}, raw_attributes={}))
+                responses.append(current[1])
+            if attr is None:
+                continue
+            current[1]["attributes"].setdefault(attr, []).append(value)
+            current[1]["raw_attributes"].setdefault(attr, []).append(
+                value.encode("utf-8") if hasattr(value, "encode") else value)
+        if model is None:
+            return responses
+        return [model._from_response(response) for response in responses]
@@ -0,0 +1,319 @@
+# coding: utf-8
+
+from collections import OrderedDict
+from threading import Lock, local
+from timeit import default_timer
+
+from ldap3.extend import ExtendedOperationsRoot
+from ldap3_orm.bulk import dn_key, split_dn
+from ldap3_orm.controls import PAGED_SEARCH_CONTROL
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# seconds after a write in which reads touching the written DNs are sent to
+# the primary
+READ_YOUR_WRITES = 5.0
+# maximum number of paged searches whose connection is remembered
+MAX_PAGED_SEARCHES = 1000
+
+# position of paged_cookie in the arguments of Connection.search following
+# the search base
+_PAGED_COOKIE = 11
+
+
+def _paged_cookie(args, kwargs):
+    """Returns the paged search cookie passed to
+    :py:meth:`ldap3.Connection.search
+    <ldap3.core.connection.Connection.search>` with ``args`` following the
+    search base and ``kwargs``."""
+    if "paged_cookie" in kwargs:
+        return kwargs["paged_cookie"]
+    return args[_PAGED_COOKIE] if len(args) > _PAGED_COOKIE else None
+
+
+def _result_cookie(result):
+    """Returns the cookie of the paged search control of ``result`` or
+    ``None`` if the search has been completed."""
+    try:
+        return result["controls"][PAGED_SEARCH_CONTROL]["value"]["cookie"] \
+            or None
+    except (KeyError, TypeError):
+        return None
+
+
+def _touches(key, written):
+    """Returns ``True`` if the normalized DNs ``key`` and ``written`` are
+    equal or one is an ancestor of the other."""
+    if not key or not written:
+        return True  # the root DSE contains everything
+    return key == written or key.endswith(',' + written) or \
+        written.endswith(',' + key)
+
+
+class _ConnectionProxy(object):
+    """Base class of objects passing operations to ``connections``.
+
+    The attributes ``response`` and ``result`` are taken from the connection
+    used by the last operation of the current thread. Assigning attributes
+    assigns them on all connections, all further attributes are taken from
+    the first connection.
+
+    """
+
+    def __init__(self, connections):
+        self._connections = tuple(connections)
+        self._local = local()
+        self._pages = OrderedDict()  # paged search cookie -> connection
+        self._pages_lock = Lock()
+        self.extend = ExtendedOperationsRoot(self)
+
+    @property
+    def connections(self):
+        return self._connections
+
+    @property
+    def _last(self):
+        return getattr(self._local, "connection", self._connections[0])
+
+    def __getattr__(self, item):
+        if item.startswith("__"):
+            raise AttributeError(item)
+        return getattr(self._connections[0], item)
+
+    def __setattr__(self, key, value):
+        if key.startswith('_') or hasattr(type(self), key) or \
+                key == "extend":
+            object.__setattr__(self, key, value)
+        else:
+            for conn in self.connections:
+                setattr(conn, key, value)
+
+    @property
+    def response(self):
+        return self._last.response
+
+    @response.setter
+    def response(self, value):
+        self._last.response = value
+
+    @property
+    def result(self):
+        return self._last.result
+
+    @result.setter
+    def result(self, value):
+        self._last.result = value
+
+    def _record_page(self, conn, result):
+        """Remembers ``conn`` answering a page of a paged search whose next
+        page is requested using the cookie of ``result``."""
+        cookie = _result_cookie(result)
+        if cookie is None:
+            return
+        with self._pages_lock:
+            self._pages[cookie] = conn
+            while len(self._pages) > MAX_PAGED_SEARCHES:
+                self._pages.popitem(last=False)
+
+    def _paged_connection(self, cookie):
+        """Returns the connection which issued the paged search ``cookie``.
+        Servers only accept the cookies they issued, thus all pages of a
+        paged search must be requested on the same connection."""
+        with self._pages_lock:
+            return self._pages.pop(cookie, None) or self._last
+
+    def __enter__(self):
+        for conn in self.connections:
+            conn.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for conn in reversed(self.connections):
+            conn.__exit__(exc_type, exc_val, exc_tb)
+        return False
+
+    def bind(self, *args, **kwargs):
+        return all([conn.bind(*args, **kwargs) for conn in self.connections])
+
+    def unbind(self, *args, **kwargs):
+        return all([conn.unbind(*args, **kwargs)
+                    for conn in self.connections])
+
+
+class RoutingConnection(_ConnectionProxy):
+    """Routes the operations of a single connection-like object to the
+    writable ``primary`` connection or the ``replica`` connection, e.g. using
+    a :py:class:`~ldap3_orm.pool.LatencyServerPool` of all replicas.
+
+    Searches and compare operations are sent to ``replica``. Add, delete,
+    modify, modify DN and extended operations are sent to ``primary``. For
+    ``read_your_writes`` seconds after a write, reads whose search base or
+    DN is equal to, an ancestor of or a descendant of a written DN are sent
+    to ``primary`` in order to read the written data before it has been
+    replicated. Routing by DN is disabled if ``read_your_writes`` is ``0``.
+    Further pages of paged searches are requested from the connection which
+    answered the first page, as servers only accept the cookies they issued.
+
+    The attributes ``response``, ``result`` and ``entries`` are taken from
+    the connection used by the last operation of the current thread.
+    Assigning attributes, e.g. ``auto_range``, assigns them on both
+    connections, all further attributes are taken from ``primary``. Both
+    connections must use the same client strategy and share the
+    :py:attr:`~ldap3_orm.Connection.querylog` of ``primary``.
+
+    Instances are created by
+    :py:func:`~ldap3_orm._connection.create_connection` if ``write_url``
+    is given, e.g. configured in :py:attr:`ldap3_orm.config.config.write_url`,
+    and passed to all functions decorated by
+    :py:func:`~ldap3_orm._connection.connection` unchanged.
+
+    """
+
+    def __init__(self, primary, replica, read_your_writes=READ_YOUR_WRITES):
+        _ConnectionProxy.__init__(self, [primary, replica])
+        self._primary = primary
+        self._replica = replica
+        self._read_your_writes = read_your_writes
+        self._written = {}  # dn_key -> time of expiry
+        self._sent = {}  # message id -> (connection, message id of conn)
+        self._message_id = 0
+        self._lock = Lock()
+        if hasattr(primary, "querylog"):
+            replica.querylog = primary.querylog
+
+    @property
+    def primary(self):
+        return self._primary
+
+    @property
+    def replica(self):
+        return self._replica
+
+    def __repr__(self):
+        return "{}(primary={!r}, replica={!r})".format(
+            self.__class__.__name__, self._primary, self._replica)
+
+    @property
+    def entries(self):
+        return self._last.entries
+
+    def _written_recently(self, dn=None):
+        """Returns ``True`` if ``dn`` or any DN if ``dn`` is ``None`` has
+        been touched by a write within the read-your-writes window."""
+        if not self._read_your_writes:
+            return False
+        now = default_timer()
+        with self._lock:
+            for key, expiry in list(self._written.items()):
+                if expiry <= now:
+                    del self._written[key]
+            if dn is None:
+                return bool(self._written)
+            key = dn_key(dn)
+            return any(_touches(key, written) for written in self._written)
+
+    def _record_write(self, *dns):
+        if not self._read_your_writes:
+            return
+        expiry = default_timer() + self._read_your_writes
+        with self._lock:
+            for dn in dns:
+                self._written[dn_key(dn)] = expiry
+
+    def _send(self, conn, operation, *args, **kwargs):
+        self._local.connection = conn
+        result = getattr(conn, operation)(*args, **kwargs)
+        if not conn.strategy.sync:
+            # the message ids of both connections overlap, thus message ids
+            # of this connection are returned instead
+            with self._lock:
+                self._message_id += 1
+                self._sent[self._message_id] = conn, result
+                return self._message_id
+        if operation == "search":
+            self._record_page(conn, result[1] if conn.strategy.thread_safe
+                              else conn.result)
+        return result
+
+    def _read(self, operation, dn, *args, **kwargs):
+        conn = self._primary if self._written_recently(dn) else self._replica
+        return self._send(conn, operation, dn, *args, **kwargs)
+
+    def _write(self, operation, dns, *args, **kwargs):
+        self._record_write(*dns)
+        return self._send(self._primary, operation, *args, **kwargs)
+
+    def search(self, search_base, *args, **kwargs):
+        cookie = _paged_cookie(args, kwargs)
+        if cookie:
+            # further pages are requested from the server which issued the
+            # cookie even if the search base has been written meanwhile
+            return self._send(self._paged_connection(cookie), "search",
+                              search_base, *args, **kwargs)
+        return self._read("search", search_base, *args, **kwargs)
+
+    def compare(self, dn, *args, **kwargs):
+        return self._read("compare", dn, *args, **kwargs)
+
+    def add(self, dn, *args, **kwargs):
+        return self._write("add", [dn], dn, *args, **kwargs)
+
+    def delete(self, dn, *args, **kwargs):
+        return self._write("delete", [dn], dn, *args, **kwargs)
+
+    def modify(self, dn, *args, **kwargs):
+        return self._write("modify", [dn], dn, *args, **kwargs)
+
+    def modify_dn(self, dn, relative_dn, delete_old_dn=True,
+                  new_superior=None, *args, **kwargs):
+        parent = new_superior if new_superior is not None else split_dn(dn)[1]
+        return self._write("modify_dn", [dn, ','.join(
+            part for part in (relative_dn, parent) if part)], dn,
+            relative_dn, delete_old_dn, new_superior, *args, **kwargs)
+
+    def extended(self, *args, **kwargs):
+        # extended operations may modify any entry, e.g. passwords
+        self._record_write('')
+        return self._send(self._primary, "extended", *args, **kwargs)
+
+    def _message(self, message_id):
+        """Returns the connection and its message id of ``message_id``."""
+        with self._lock:
+            return self._sent.get(message_id, (self._last, message_id))
+
+    def get_response(self, message_id, *args, **kwargs):
+        conn, conn_message_id = self._message(message_id)
+        self._local.connection = conn
+        response = conn.get_response(conn_message_id, *args, **kwargs)
+        with self._lock:
+            self._sent.pop(message_id, None)
+        self._record_page(conn, response[1])
+        return response
+
+    def abandon(self, message_id, *args, **kwargs):
+        conn, conn_message_id = self._message(message_id)
+        return conn.abandon(conn_message_id, *args, **kwargs)
@@ -0,0 +1,372 @@
+# coding: utf-8
+
+import threading
+from collections import namedtuple
+from itertools import islice
+from multiprocessing import Pool
+
+from ldap3 import BASE, LEVEL, NO_ATTRIBUTES, SUBTREE
+from ldap3.core.exceptions import LDAPSizeLimitExceededResult
+from ldap3.core.results import RESULT_SIZE_LIMIT_EXCEEDED
+from ldap3.utils.conv import escape_filter_chars
+from ldap3_orm.bulk import dn_key
+from ldap3_orm.pycompat import PY2, Full, Queue
+from ldap3_orm.utils import compile_filter, model_attributes
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# characters appended to the prefix of a partition on splitting it
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+# maximum number of entries of a partition read using a single search
+MAX_PARTITION_SIZE = 10000
+# maximum length of the prefixes of partitions
+MAX_PREFIX_LENGTH = 4
+# maximum number of child containers a partition is split into
+MAX_CONTAINERS = 1000
+# page size used for partitions which cannot be split any further
+SCAN_PAGE_SIZE = 1000
+
+
+class Partition(namedtuple("Partition", ["search_base", "search_scope",
+                                         "attr", "prefix", "excluded",
+                                         "container"])):
+    """Disjoint part of a search.
+
+    Prefix partitions restrict the search to entries whose values of
+    ``attr`` start with ``prefix`` but with none of the ``excluded``
+    prefixes. Container partitions, which have ``container`` set, are
+    searches of the subtree of ``search_base``.
+
+    """
+
+    __slots__ = ()
+
+    def query(self, search_filter):
+        """Returns the filter of this partition restricting
+        ``search_filter``."""
+        components = [compile_filter(search_filter)] \
+            if search_filter is not None else []
+        if self.attr is not None:
+            if self.prefix:
+                components.append("({}={}*)".format(
+                    self.attr, escape_filter_chars(self.prefix)))
+            components += ["(!({}={}*))".format(
+                self.attr, escape_filter_chars(prefix))
+                for prefix in self.excluded]
+        if not components:
+            return "(objectClass=*)"
+        if len(components) == 1:
+            return components[0]
+        return "(&{})".format(''.join(components))
+
+
+def prefix_partitions(attr, search_base, search_scope=SUBTREE,
+                      alphabet=ALPHABET):
+    """Returns partitions of a search of ``search_base`` by the first
+    character of the values of ``attr``, usually the naming attribute of the
+    entries, e.g. ``(uid=a*)``, ``(uid=b*)``, ..., and a partition of all
+    other entries including those without ``attr``, e.g.
+    ``(&(!(uid=a*))(!(uid=b*))...)``.
+
+    Partitions are disjoint if ``attr`` is single-valued and cover all
+    entries. Matching is case insensitive for most naming attributes, thus
+    ``alphabet`` contains lower case letters and digits by default.
+
+    """
+    return [Partition(search_base, search_scope, attr, char, (), False)
+            for char in alphabet] + \
+        [Partition(search_base, search_scope, attr, '', tuple(alphabet),
+                   False)]
+
+
+def container_partitions(conn, search_base):
+    """Returns partitions of a subtree search of ``search_base`` by its
+    child containers, i.e. the base entry itself and the subtree of each
+    child. A single partition is returned if ``search_base`` has more than
+    :py:data:`MAX_CONTAINERS` children."""
+    partition = Partition(search_base, SUBTREE, None, '', (), True)
+    return split(conn, partition) or [partition]
+
+
+def split(conn, partition, alphabet=ALPHABET):
+    """Splits ``partition`` into disjoint partitions covering the same
+    entries or returns ``None`` if it cannot be split any further.
+
+    Prefix partitions are split by appending each character of ``alphabet``
+    to their prefix up to a prefix length of :py:data:`MAX_PREFIX_LENGTH`.
+    Container partitions are split by the child containers of their
+    search base read using ``conn``.
+
+    """
+    if partition.container:
+        if partition.search_scope != SUBTREE:
+            return None
+        try:
+            responses, exceeded = _search(
+                conn, partition.search_base, "(objectClass=*)", LEVEL,
+                NO_ATTRIBUTES, MAX_CONTAINERS)
+        except LDAPSizeLimitExceededResult:
+            return None
+        # some servers return the base entry of one level searches, too
+        key = dn_key(partition.search_base)
+        children = [response["dn"] for response in responses
+                    if dn_key(response["dn"]) != key]
+        if exceeded or not children:
+            return None
+        return [partition._replace(search_scope=BASE)] + [
+            partition._replace(search_base=dn) for dn in children]
+    if partition.attr is None or partition.excluded or \
+            len(partition.prefix) >= MAX_PREFIX_LENGTH:
+        return None
+    prefixes = tuple(partition.prefix + char for char in alphabet)
+    return [partition._replace(prefix=prefix) for prefix in prefixes] + \
+        [partition._replace(excluded=prefixes)]
+
+
+def _search(conn, search_base, search_filter, search_scope, attributes,
+            size_limit):
+    """Returns the entries found by a search limited to ``size_limit``
+    entries and whether the limit has been exceeded."""
+    result = conn.search(search_base, search_filter, search_scope,
+                         attributes=attributes, size_limit=size_limit)
+    if conn.strategy.thread_safe:
+        responses, result = result[2], result[1]
+    elif conn.strategy.sync:
+        responses, result = conn.response, conn.result
+    else:
+        responses, result = conn.get_response(result)
+    entries = [response for response in responses or []
+               if response["type"] == "searchResEntry"]
+    # some servers truncate results silently
+    return entries, (result["result"] == RESULT_SIZE_LIMIT_EXCEEDED or
+                     len(entries) >= size_limit)
+
+
+def scan_partition(conn, partition, search_filter=None, attributes=None,
+                   max_partition_size=MAX_PARTITION_SIZE,
+                   page_size=SCAN_PAGE_SIZE, alphabet=ALPHABET):
+    """Scans ``partition`` using ``conn`` and returns an iterable of the
+    entries found and a list of partitions the remaining entries have been
+    split into.
+
+    The partition is read using a single search limited to
+    ``max_partition_size`` entries. If the limit is exceeded the partition
+    is skewed and split using :py:func:`split` without returning any
+    entries, or read using a paged search of ``page_size`` entries if it
+    cannot be split.
+
+    """
+    query = partition.query(search_filter)
+    try:
+        entries, exceeded = _search(conn, partition.search_base, query,
+                                    partition.search_scope, attributes,
+                                    max_partition_size)
+    except LDAPSizeLimitExceededResult:
+        entries, exceeded = [], True
+    if not exceeded:
+        return entries, []
+    partitions = split(conn, partition, alphabet)
+    if partitions:
+        return [], partitions
+    responses = conn.extend.standard.paged_search(
+        partition.search_base, query, partition.search_scope,
+        attributes=attributes, paged_size=page_size, generator=True)
+    return (response for response in responses
+            if response["type"] == "searchResEntry"), []
+
+
+_DONE = object()
+
+
+def _scan_threads(connections, partitions, scan):
+    """Scans ``partitions`` using one thread per connection and yields
+    lists of entries as they arrive."""
+    if not partitions:
+        return
+    tasks = Queue()
+    results = Queue(maxsize=4 * len(connections))
+    state = dict(pending=len(partitions), stopped=False)
+    lock = threading.Lock()
+    for partition in partitions:
+        tasks.put(partition)
+
+    def put(result):
+        """Waits for a free slot of the results unless stopped."""
+        while not state["stopped"]:
+            try:
+                results.put(result, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def worker(conn):
+        while True:
+            partition = tasks.get()
+            if partition is None or state["stopped"]:
+                return
+            try:
+                entries, more = scan(conn, partition)
+                with lock:
+                    state["pending"] += len(more)
+                for partition in more:
+                    tasks.put(partition)
+                entries = iter(entries)
+                chunk = list(islice(entries, SCAN_PAGE_SIZE))
+                while chunk and not state["stopped"]:
+                    put(chunk)
+                    chunk = list(islice(entries, SCAN_PAGE_SIZE))
+            except Exception as e:  # passed to the consuming thread
+                put(e)
+                return
+            with lock:
+                state["pending"] -= 1
+                done = state["pending"] == 0
+            if done:
+                for _ in connections:
+                    tasks.put(None)
+                put(_DONE)
+
+    threads = [threading.Thread(target=worker, args=(conn,),
+                                name="ldap3-orm-scan")
+               for conn in connections]
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    try:
+        while True:
+            chunk = results.get()
+            if chunk is _DONE:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            for entry in chunk:
+                yield entry
+    finally:
+        state["stopped"] = True
+        for _ in connections:
+            tasks.put(None)
+
+
+_process_conn = None
+
+
+def _init_process(connect):
+    global _process_conn  # pylint: disable=global-statement
+    _process_conn = connect()
+
+
+def _scan_process(partition, kwargs):
+    try:
+        entries, partitions = scan_partition(_process_conn, partition,
+                                             **kwargs)
+        return list(entries), partitions
+    except Exception as e:  # passed to the calling process
+        return e
+
+
+def _scan_processes(connect, processes, partitions, kwargs):
+    """Scans ``partitions`` using ``processes`` worker processes, each
+    using its own connection returned by ``connect``, and yields the
+    entries in the order the partitions are completed."""
+    pool = Pool(processes, _init_process, (connect,))
+    results = Queue()
+
+    # errors of the pool, e.g. results which cannot be pickled, complete a
+    # partition like errors of the scan
+    error_callback = {} if PY2 else dict(error_callback=results.put)
+
+    def submit(partition):
+        pool.apply_async(_scan_process, (partition, kwargs),
+                         callback=results.put, **error_callback)
+
+    try:
+        for partition in partitions:
+            submit(partition)
+        pending = len(partitions)
+        while pending:
+            result = results.get()
+            pending -= 1
+            if isinstance(result, Exception):
+                raise result
+            entries, more = result
+            for partition in more:
+                submit(partition)
+            pending += len(more)
+            for entry in entries:
+                yield entry
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def scan(connections, partitions, search_filter=None, attributes=None,
+         model=None, processes=0, max_partition_size=MAX_PARTITION_SIZE,
+         page_size=SCAN_PAGE_SIZE, alphabet=ALPHABET):
+    """Yields all entries matching ``search_filter`` in ``partitions``
+    created by :py:func:`prefix_partitions` or
+    :py:func:`container_partitions`, scanning the partitions in parallel,
+    e.g.::
+
+        >>> conns = [create_connection(config.url, config.connconfig)
+        ...          for _ in range(8)]
+        >>> for user in scan(conns, prefix_partitions("uid", base_dn),
+        ...                  User.surname == "User", model=User):
+        ...     print(user.username)
+
+    ``connections`` is a list of connections, which are used by one thread
+    each. Connections using a thread safe strategy can be listed several
+    times. If ``processes`` is given, ``connections`` is a callable
+    returning a new connection instead, e.g. ``functools.partial`` of
+    :py:func:`~ldap3_orm._connection.create_connection`, which is called
+    once in each of ``processes`` worker processes. The responses are
+    decoded in the worker processes in parallel and passed to the calling
+    process.
+
+    Each partition is read using :py:func:`scan_partition`, thus skewed
+    partitions exceeding ``max_partition_size`` entries are split and
+    scanned again. Entries are yielded as they arrive, unordered. Entries
+    are instances of ``model`` if given or the plain search responses
+    otherwise. Just the attributes defined on ``model`` are requested by
+    default, all attributes are requested if ``model`` is not given.
+
+    """
+    if attributes is None and model is not None:
+        attributes = model_attributes(model)
+    kwargs = dict(search_filter=search_filter, attributes=attributes,
+                  max_partition_size=max_partition_size,
+                  page_size=page_size, alphabet=alphabet)
+    partitions = list(partitions)
+    if processes:
+        entries = _scan_processes(connections, processes, partitions,
+                                  kwargs)
+    else:
+        entries = _scan_threads(
+            list(connections), partitions,
+            lambda conn, partition: scan_partition(conn, partition,
+                                                   **kwargs))
+    for entry in entries:
+        yield model._from_response(entry) if model else entry
@@ -0,0 +1,164 @@
+# coding: utf-8
+
+from ldap3 import NO_ATTRIBUTES
+from ldap3.utils.ciDict import CaseInsensitiveDict
+from ldap3.utils.conv import escape_filter_chars, to_unicode
+from ldap3_orm.bulk import dn_key
+from ldap3_orm.query import Query
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+MODIFY_TIMESTAMP = "modifyTimestamp"
+ENTRY_CSN = "entryCSN"
+# page size used for reading changes and reconciling deleted entries
+PAGE_SIZE = 1000
+
+
+class IncrementalSync(object):
+    """Reads just the entries of an ORM model derived from
+    :py:class:`~ldap3_orm.entry.EntryBase` which have been added or modified
+    since the last synchronization.
+
+    A high-water mark, i.e. the greatest value of the operational
+    ``attribute`` seen, is kept per search base and filter in ``state``.
+    ``attribute`` can either be :py:data:`MODIFY_TIMESTAMP` or
+    :py:data:`ENTRY_CSN` which provides sub-second precision on OpenLDAP.
+    ``state`` can be any mutable mapping with string keys whose values are
+    assigned as a whole, e.g. a :py:mod:`shelve` or a dictionary which is
+    serialized as JSON, which allows resuming the synchronization across
+    processes::
+
+        >>> state = shelve.open("users.sync")
+        >>> sync = IncrementalSync(User, User.surname == "User", state=state)
+        >>> for user in sync.changes():
+        ...     mirror.update(user)
+        >>> for dn in sync.deleted():
+        ...     mirror.remove(dn)
+
+    Deleted entries cannot be detected by searching for changes. Thus
+    :py:meth:`deleted` reconciles the DNs known from previous
+    synchronizations with all DNs currently matching the search requesting
+    no attributes, which should be run periodically.
+
+    ``search_filter``, ``search_base``, ``search_scope`` and ``conn`` are
+    used as in :py:class:`~ldap3_orm.query.Query`.
+
+    """
+
+    def __init__(self, model, search_filter=None, search_base=None,
+                 search_scope=None, conn=None, attribute=MODIFY_TIMESTAMP,
+                 state=None, page_size=PAGE_SIZE):
+        kwargs = {} if search_scope is None else dict(
+            search_scope=search_scope)
+        self.query = Query(model, search_filter, search_base, conn=conn,
+                           **kwargs)
+        self.attribute = attribute
+        self.state = {} if state is None else state
+        self.page_size = page_size
+
+    @property
+    def key(self):
+        """Key of the high-water mark of this search in ``state``."""
+        return "{}|{}|{}|{}".format(self.attribute, dn_key(self.query.base),
+                                    self.query.search_scope,
+                                    self.query.query_filter)
+
+    @property
+    def mark(self):
+        """The current high-water mark or ``None`` if no entries have been
+        synchronized yet."""
+        return self._state()["mark"]
+
+    def _state(self):
+        return self.state.get(self.key) or dict(mark=None, seen=[], dns=[])
+
+    def _search(self, search_filter, attributes):
+        responses = self.query.connection.extend.standard.paged_search(
+            self.query.base, search_filter, self.query.search_scope,
+            attributes=attributes, paged_size=self.page_size, generator=True)
+        return (response for response in responses
+                if response["type"] == "searchResEntry")
+
+    def changes(self):
+        """Yields all entries added or modified since the last call.
+
+        Entries are instances of the model holding the attributes defined on
+        the model. All entries are returned on the first call. The
+        high-water mark is stored after all entries have been consumed, thus
+        changes are returned again if the iteration is aborted.
+
+        Since timestamps are compared using ``>=`` entries modified at the
+        high-water mark are searched again, but not returned twice.
+
+        """
+        state = self._state()
+        mark = state["mark"]
+        seen = set(state["seen"])
+        search_filter = self.query.query_filter
+        if mark is not None:
+            search_filter = "(&{}({}>={}))".format(
+                search_filter, self.attribute, escape_filter_chars(mark))
+        dns = dict((dn_key(dn), dn) for dn in state["dns"])
+        new_mark = mark
+        new_seen = set(seen)
+        for response in self._search(search_filter, self.query.attributes +
+                                     [self.attribute]):
+            key = dn_key(response["dn"])
+            values = CaseInsensitiveDict(response["raw_attributes"]).get(
+                self.attribute)
+            # raw values of generalized time and CSN attributes are ordered
+            value = to_unicode(values[0]) if values else None
+            if value is not None:
+                if value == mark and key in seen:
+                    continue
+                if new_mark is None or value > new_mark:
+                    new_mark = value
+                    new_seen = set([key])
+                elif value == new_mark:
+                    new_seen.add(key)
+            dns[key] = response["dn"]
+            yield self.query.model._from_response(response)
+        self.state[self.key] = dict(mark=new_mark, seen=sorted(new_seen),
+                                    dns=sorted(dns.values()))
+
+    def deleted(self):
+        """Returns the DNs of all entries synchronized before which do not
+        exist or no longer match the search.
+
+        All DNs matching the search are read using a paged search requesting
+        no attributes. The returned DNs are removed from ``state``.
+
+        """
+        state = self._state()
+        current = set(dn_key(response["dn"]) for response in
+                      self._search(self.query.query_filter, NO_ATTRIBUTES))
+        deleted = [dn for dn in state["dns"] if dn_key(dn) not in current]
+        if deleted:
+            self.state[self.key] = dict(
+                state, dns=[dn for dn in state["dns"]
+                            if dn_key(dn) in current])
+        return deleted
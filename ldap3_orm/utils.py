@@ -3,7 +3,8 @@
 import io
 from ldap3 import SEQUENCE_TYPES
 from ldap3_orm.attribute import OperatorAttrDef
-from ldap3_orm.pycompat import file_types
+from ldap3_orm.parameter import ParamDef
+from ldap3_orm.pycompat import file_types, itervalues
 # pylint: disable=unused-import
 # pylint: disable=protected-access
 # noinspection PyProtectedMember
@@ -56,6 +57,20 @@ def compile_filter(search_filter):
     return search_filter
 
 
+def model_attributes(model):
+    """Returns the names of all ldap attributes defined on ``model``
+    excluding parameters defined by :py:class:`~ldap3_orm.ParamDef`."""
+    return [attrdef.name for attrdef in itervalues(model._attrdefs)
+            if not isinstance(attrdef, ParamDef)]
+
+
+def attribute_name(model, name):
+    """Returns the ldap attribute name for ``name`` which can either be the
+    name of a class attribute on ``model`` or an ldap attribute name."""
+    attrdef = model._attrdefs.get(name)
+    return attrdef.name if attrdef is not None else name
+
+
 def tolist(itm):
     return itm if isinstance(itm, SEQUENCE_TYPES) else [itm]
 
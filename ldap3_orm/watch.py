@@ -0,0 +1,241 @@
+# coding: utf-8
+
+from collections import namedtuple
+from threading import Thread
+from time import sleep
+
+from ldap3 import ALL_ATTRIBUTES, ASYNC_STREAM, SUBTREE
+from ldap3.core.exceptions import LDAPException
+from ldap3_orm._config import config
+from ldap3_orm.pycompat import Empty, Queue
+from ldap3_orm.utils import compile_filter, model_attributes
+# pylint: disable=unused-import
+# pylint: disable=protected-access
+# noinspection PyProtectedMember
+from ldap3_orm._version import __version__, __revision__
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+ADD = "add"
+DELETE = "delete"
+MODIFY = "modify"
+MODDN = "moddn"
+# entries returned on (re-)subscription if ``changes_only`` is disabled
+PRESENT = "present"
+
+_CHANGE_TYPES = {
+    "add": ADD,
+    "delete": DELETE,
+    "modify": MODIFY,
+    "modify dn": MODDN,
+}
+
+# maximum number of buffered events
+MAXSIZE = 1000
+# interval in seconds used for checking the connection while no events arrive
+POLL_INTERVAL = 1.0
+# delays in seconds between attempts to resubscribe after a disconnect
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 60.0
+
+
+ChangeEvent = namedtuple("ChangeEvent", ["type", "dn", "entry", "previous_dn"])
+ChangeEvent.__doc__ = """A change of the entry ``dn`` reported by
+:py:class:`Watch`. ``type`` is one of :py:data:`ADD`, :py:data:`DELETE`,
+:py:data:`MODIFY`, :py:data:`MODDN` or :py:data:`PRESENT`. ``entry`` is an
+instance of the watched model or the plain search response if no model is
+given. ``previous_dn`` is set for :py:data:`MODDN` events only."""
+
+
+class Watch(object):
+    """Subscribes to changes of entries in ``search_base`` matching
+    ``search_filter`` using a persistent search.
+
+    Change notifications are delivered as :py:class:`ChangeEvent` tuples by
+    iterating this object, e.g.::
+
+        >>> for event in Watch("ou=People,dc=example,dc=com", model=User):
+        ...     cache.pop(event.dn, None)
+
+    or onto an :py:class:`asyncio.Queue` using :py:meth:`to_asyncio`.
+
+    ``conn`` must use the ``ASYNC_STREAM`` client strategy. If not given a
+    new connection is created from the configuration. Events are buffered in
+    a queue of at most ``maxsize`` events. If the buffer is full the thread
+    receiving from the server is blocked, which applies backpressure to the
+    server instead of dropping events.
+
+    If the connection is lost it is reopened and the persistent search is
+    resubscribed automatically with an exponential backoff between
+    ``reconnect_delay`` and ``max_reconnect_delay`` seconds. Changes made
+    while disconnected are not reported unless ``changes_only`` is disabled,
+    which reports all matching entries as :py:data:`PRESENT` on each
+    subscription.
+
+    """
+
+    def __init__(self, search_base, search_filter=None, model=None,
+                 search_scope=SUBTREE, conn=None, attributes=None,
+                 changes_only=True, maxsize=MAXSIZE,
+                 poll_interval=POLL_INTERVAL, reconnect_delay=RECONNECT_DELAY,
+                 max_reconnect_delay=MAX_RECONNECT_DELAY):
+        self.search_base = search_base
+        self.model = model
+        components = ["(objectClass={})".format(object_class) for
+                      object_class in sorted(getattr(model, "object_classes",
+                                                     None) or [])]
+        if search_filter is not None:
+            components.append(compile_filter(search_filter))
+        self.search_filter = "(&{})".format(''.join(components)) \
+            if len(components) > 1 else \
+            components[0] if components else "(objectClass=*)"
+        self.search_scope = search_scope
+        if attributes is None:
+            attributes = model_attributes(model) if model else ALL_ATTRIBUTES
+        self.attributes = attributes
+        self.changes_only = changes_only
+        self.queue = Queue(maxsize)
+        self.poll_interval = poll_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.conn = conn
+        self._search = None
+        self._stopped = False
+
+    @property
+    def connection(self):
+        if self.conn is None:
+            # pylint: disable=redefined-outer-name
+            from ldap3_orm.connection import create_connection
+            # persistent searches require a single streaming connection,
+            # which is neither hedged nor routed
+            connconfig = dict((key, value) for key, value in
+                              (config.connconfig or {}).items()
+                              if key not in ("hedge", "write_url"))
+            self.conn = create_connection(config.url, dict(
+                connconfig, client_strategy=ASYNC_STREAM))
+        return self.conn
+
+    def _event(self, change):
+        change_type = _CHANGE_TYPES.get(change.get("changeType"), PRESENT)
+        entry = self.model._from_response(change) if self.model else change
+        previous_dn = change.get("previousDN")
+        return ChangeEvent(change_type, change["dn"], entry,
+                           str(previous_dn) if previous_dn is not None
+                           else None)
+
+    def _callback(self, change):
+        if change.get("type") == "searchResEntry":
+            # blocks the receiving thread while the buffer is full
+            self.queue.put(self._event(change))
+
+    def start(self):
+        """Subscribes to changes if not already subscribed."""
+        if self._search is None:
+            self._search = self.connection.extend.standard.persistent_search(
+                self.search_base, self.search_filter, self.search_scope,
+                attributes=self.attributes, changes_only=self.changes_only,
+                callback=self._callback)
+
+    def stop(self):
+        """Cancels the subscription and closes the connection."""
+        self._stopped = True
+        self._unsubscribe()
+
+    def _unsubscribe(self):
+        search = self._search
+        self._search = None
+        if search is None:
+            return
+        try:
+            search.stop(unbind=False)
+        except LDAPException:
+            pass
+        try:
+            self.connection.unbind()
+        except LDAPException:
+            pass
+
+    @property
+    def subscribed(self):
+        """``True`` if the persistent search is active and the connection is
+        still receiving."""
+        conn = self.connection
+        receiver = getattr(conn.strategy, "receiver", None)
+        return self._search is not None and not conn.closed and \
+            receiver is not None and receiver.is_alive()
+
+    def _resubscribe(self):
+        self._unsubscribe()
+        delay = self.reconnect_delay
+        while not self._stopped:
+            try:
+                self.start()
+                return
+            except LDAPException:
+                self._search = None
+                sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+    def __iter__(self):
+        self._stopped = False
+        self.start()
+        try:
+            while not self._stopped:
+                try:
+                    event = self.queue.get(timeout=self.poll_interval)
+                except Empty:
+                    if not self._stopped and not self.subscribed:
+                        self._resubscribe()
+                    continue
+                yield event
+        finally:
+            self.stop()
+
+    def to_asyncio(self, queue, loop):
+        """Delivers all events onto the :py:class:`asyncio.Queue` ``queue``
+        of the event ``loop`` from a daemon thread, which is returned.
+
+        Delivery waits while ``queue`` is full, which applies backpressure as
+        described above. Call :py:meth:`stop` in order to cancel the
+        subscription.
+
+        """
+        import asyncio
+
+        def deliver():
+            for event in self:
+                asyncio.run_coroutine_threadsafe(queue.put(event),
+                                                 loop).result()
+
+        thread = Thread(target=deliver, name="ldap3-orm-watch")
+        thread.daemon = True
+        thread.start()
+        return thread
+
+
+def watch(search_base, search_filter=None, model=None, **kwargs):
+    """Returns a :py:class:`Watch` subscribing to changes of entries in
+    ``search_base`` matching ``search_filter``, see :py:class:`Watch` for
+    all further keyword arguments."""
+    return Watch(search_base, search_filter, model, **kwargs)
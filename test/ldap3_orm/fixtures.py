@@ -0,0 +1,57 @@
+# coding: utf-8
+
+from ldap3 import OFFLINE_SLAPD_2_4, Server
+
+from ldap3_orm import AttrDef, Connection, EntryBase
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+BASE_DN = "ou=People,dc=example,dc=com"
+USERS = 30
+
+
+class User(EntryBase):
+    dn = "uid={uid},{base_dn}"
+    base_dn = BASE_DN
+    object_classes = ["top", "inetOrgPerson"]
+    username = AttrDef("uid")
+    surname = AttrDef("sn")
+
+
+def directory(name, client_strategy, users=USERS):
+    """Returns an unbound connection using ``client_strategy`` to the mock
+    server ``name`` holding ``users`` entries below :py:data:`BASE_DN`."""
+    conn = Connection(Server(name, get_info=OFFLINE_SLAPD_2_4),
+                      user="cn=admin,dc=example,dc=com", password="secret",
+                      client_strategy=client_strategy)
+    conn.strategy.add_entry("cn=admin,dc=example,dc=com",
+                            {"userPassword": "secret", "sn": "admin"})
+    conn.strategy.add_entry(BASE_DN, {"objectClass": ["top",
+                                                      "organizationalUnit"],
+                                      "ou": "People"})
+    for i in range(users):
+        conn.strategy.add_entry("uid=u%02d,%s" % (i, BASE_DN), {
+            "objectClass": ["top", "inetOrgPerson"], "uid": "u%02d" % i,
+            "cn": "User %d" % i, "sn": "User" if i % 2 else "Other"})
+    return conn
@@ -0,0 +1,140 @@
+# coding: utf-8
+
+import socket
+import threading
+import unittest
+from timeit import default_timer
+
+from ldap3 import NONE, RESTARTABLE, SYNC, Server
+from ldap3.core.exceptions import LDAPResponseTimeoutError
+
+from ldap3_orm import Connection
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+# bindResponse with resultCode success following the message id
+BIND_RESPONSE = b"\x61\x07\x0a\x01\x00\x04\x00\x04\x00"
+
+
+def _length(data, pos):
+    """Returns the BER encoded length at ``pos`` of ``data`` and the position
+    following it."""
+    if data[pos] < 0x80:
+        return data[pos], pos + 1
+    size = data[pos] & 0x7f
+    length = 0
+    for byte in data[pos + 1:pos + 1 + size]:
+        length = length << 8 | byte
+    return length, pos + 1 + size
+
+
+class StalledServer(object):
+    """LDAP server accepting all binds which never answers any other
+    request."""
+
+    def __init__(self):
+        self.listener = socket.socket()
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen(5)
+        self.port = self.listener.getsockname()[1]
+        self.clients = []
+        thread = threading.Thread(target=self._serve)
+        thread.daemon = True
+        thread.start()
+
+    def close(self):
+        for sock in [self.listener] + self.clients:
+            sock.close()
+
+    def _serve(self):
+        while True:
+            try:
+                client = self.listener.accept()[0]
+            except (OSError, socket.error):
+                return
+            self.clients.append(client)
+            thread = threading.Thread(target=self._handle, args=(client,))
+            thread.daemon = True
+            thread.start()
+
+    def _handle(self, client):
+        buf = bytearray()
+        while True:
+            try:
+                data = client.recv(4096)
+            except (OSError, socket.error):
+                return
+            if not data:
+                return
+            buf += data
+            while len(buf) > 1:
+                length, pos = _length(buf, 1)
+                if len(buf) < pos + length:
+                    break
+                message, buf = buf[:pos + length], buf[pos + length:]
+                # message id and protocol operation of the LDAPMessage
+                end = pos + 2 + message[pos + 1]
+                if message[end] == 0x60:  # bindRequest
+                    body = bytes(message[pos:end]) + BIND_RESPONSE
+                    client.sendall(bytes(bytearray([0x30, len(body)])) +
+                                   body)
+
+
+class DeadlineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StalledServer()
+
+    def tearDown(self):
+        self.server.close()
+
+    def assert_times_out(self, client_strategy):
+        conn = Connection(Server("127.0.0.1", port=self.server.port,
+                                 get_info=NONE),
+                          client_strategy=client_strategy, auto_bind=True)
+        errors = []
+
+        def search():
+            try:
+                conn.search("dc=example,dc=com", "(uid=guest)", timeout=0.5)
+            except LDAPResponseTimeoutError as e:
+                errors.append(e)
+
+        start = default_timer()
+        thread = threading.Thread(target=search)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive(), "search has not timed out")
+        self.assertEqual(len(errors), 1)
+        self.assertLess(default_timer() - start, 2)
+
+    def test_sync(self):
+        self.assert_times_out(SYNC)
+
+    def test_restartable(self):
+        self.assert_times_out(RESTARTABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+# coding: utf-8
+
+import pickle
+import unittest
+
+from ldap3 import MOCK_SYNC
+
+from test.ldap3_orm.fixtures import BASE_DN, User, directory
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+class PickleTestCase(unittest.TestCase):
+
+    def roundtrip(self, entry):
+        return pickle.loads(pickle.dumps(entry, pickle.HIGHEST_PROTOCOL))
+
+    def test_new_entry(self):
+        user = User(username="guest", surname="User")
+        restored = self.roundtrip(user)
+        self.assertEqual(restored.entry_dn, user.entry_dn)
+        self.assertEqual(restored.entry_status, user.entry_status)
+        self.assertEqual(restored.entry_attributes_as_dict,
+                         user.entry_attributes_as_dict)
+
+    def test_read_entry(self):
+        conn = directory("server", MOCK_SYNC, users=1)
+        conn.bind()
+        user, = User.search(conn=conn).all()
+        for restored in (self.roundtrip(user),
+                         self.roundtrip(self.roundtrip(user))):
+            self.assertEqual(restored.entry_dn, user.entry_dn)
+            self.assertEqual(restored.entry_status, "Read")
+            self.assertEqual(restored.entry_attributes_as_dict,
+                             user.entry_attributes_as_dict)
+            self.assertEqual(restored.entry_raw_attributes["uid"],
+                             [b"u00"])
+
+
+class ReplaceTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.prototype = User(username="guest", surname="User")
+
+    def test_replace(self):
+        user = self.prototype.replace(surname="Other")
+        self.assertEqual(user.entry_dn, "uid=guest,%s" % BASE_DN)
+        self.assertEqual(user.entry_status, "Writable")
+        self.assertEqual(user.entry_attributes_as_dict,
+                         {"uid": ["guest"], "sn": ["Other"]})
+        self.assertEqual(self.prototype.entry_attributes_as_dict,
+                         {"uid": ["guest"], "sn": ["User"]})
+
+    def test_replace_dn(self):
+        user = self.prototype.replace(username="other")
+        self.assertEqual(user.entry_dn, "uid=other,%s" % BASE_DN)
+        self.assertEqual(user.entry_raw_attributes["uid"], ["other"])
+        self.assertEqual(user.entry_attributes_as_dict["sn"], ["User"])
+
+    def test_replace_read_entry(self):
+        conn = directory("server", MOCK_SYNC, users=1)
+        conn.bind()
+        user, = User.search(conn=conn).all()
+        clone = user.replace(username="other")
+        self.assertEqual(clone.entry_dn, "uid=other,%s" % BASE_DN)
+        self.assertEqual(clone.entry_status, "Writable")
+        self.assertEqual(clone.entry_raw_attributes["sn"], ["Other"])
+
+    def test_unexpected_keyword(self):
+        self.assertRaises(TypeError, self.prototype.replace, uid="other")
+
+    def test_from_prototype(self):
+        user = User.from_prototype(self.prototype, username="other")
+        self.assertIsInstance(user, User)
+        self.assertEqual(user.entry_dn, "uid=other,%s" % BASE_DN)
+        self.assertRaises(TypeError, User.from_prototype, object())
+
+
+if __name__ == "__main__":
+    unittest.main()
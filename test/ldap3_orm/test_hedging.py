@@ -0,0 +1,77 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3 import MOCK_ASYNC
+
+from ldap3_orm.hedging import HedgedConnection
+from test.ldap3_orm.fixtures import BASE_DN, USERS, User, directory
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+def replica(name):
+    conn = directory(name, MOCK_ASYNC)
+    conn.bind()
+    return conn
+
+
+class HedgedConnectionTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.conn = HedgedConnection([replica("replica1"),
+                                      replica("replica2")])
+
+    def test_paged_search(self):
+        responses = list(self.conn.extend.standard.paged_search(
+            BASE_DN, "(objectClass=inetOrgPerson)", paged_size=10,
+            generator=True))
+        self.assertEqual(len(responses), USERS)
+        self.assertEqual(self.conn.result["result"], 0)
+        self.assertEqual(self.conn.stats().searches, 1)
+
+    def test_paged_query(self):
+        users = User.search(conn=self.conn, paged_size=7).all()
+        self.assertEqual(sorted(user.entry_dn for user in users),
+                         ["uid=u%02d,%s" % (i, BASE_DN)
+                          for i in range(USERS)])
+
+    def test_searches_round_robin(self):
+        for _ in range(4):
+            self.assertTrue(self.conn.search(BASE_DN, "(uid=u01)"))
+            self.assertEqual(len(self.conn.response), 1)
+        self.assertEqual(self.conn.stats().searches, 4)
+
+    def test_entries(self):
+        self.assertTrue(self.conn.search(BASE_DN, "(uid=u0*)",
+                                         attributes=["uid"]))
+        self.assertEqual(sorted(entry.entry_dn
+                                for entry in self.conn.entries),
+                         ["uid=u%02d,%s" % (i, BASE_DN) for i in range(10)])
+        self.assertTrue(self.conn.search(BASE_DN, "(uid=u11)",
+                                         attributes=["uid"]))
+        self.assertEqual([entry.uid.value for entry in self.conn.entries],
+                         ["u11"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3_orm.limiter import AdaptiveLimiter
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+class AdaptiveLimiterTestCase(unittest.TestCase):
+
+    def respond(self, limiter, elapsed, overloaded=False, times=1):
+        for _ in range(times):
+            self.assertTrue(limiter.acquire(blocking=False))
+            limiter.release(elapsed, overloaded)
+
+    def test_acquire(self):
+        limiter = AdaptiveLimiter(initial_limit=2)
+        self.assertTrue(limiter.acquire(blocking=False))
+        self.assertTrue(limiter.acquire(blocking=False))
+        self.assertFalse(limiter.acquire(blocking=False))
+        self.assertEqual(limiter.inflight, 2)
+        limiter.cancel()
+        self.assertTrue(limiter.acquire(blocking=False))
+        self.assertEqual(limiter.stats().completed, 0)
+
+    def test_additive_increase(self):
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=6)
+        # grows by one per window of limit responses
+        self.respond(limiter, 0.01, times=5)
+        self.assertEqual(limiter.limit, 5)
+        self.respond(limiter, 0.01, times=100)
+        self.assertEqual(limiter.limit, 6)
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveLimiter(initial_limit=10, backoff=0.5)
+        self.respond(limiter, 0.01, times=10)
+        limit = limiter.limit
+        self.respond(limiter, 0.05)
+        self.assertEqual(limiter.limit, limit // 2)
+        # decreased once per window
+        self.respond(limiter, 0.05, times=limiter.limit - 1)
+        self.assertEqual(limiter.limit, limit // 2)
+        self.assertEqual(limiter.stats().decreased, 1)
+
+    def test_overloaded(self):
+        limiter = AdaptiveLimiter(initial_limit=4, min_limit=2, backoff=0.5)
+        self.respond(limiter, 0.01, overloaded=True, times=20)
+        stats = limiter.stats()
+        self.assertEqual(stats.limit, 2)
+        self.assertEqual(stats.overloaded, 20)
+        self.assertAlmostEqual(stats.baseline, 0.01, places=3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3 import Server
+from ldap3.core.exceptions import LDAPServerPoolExhaustedError
+
+from ldap3_orm.pool import LatencyServerPool
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+class _Connection(object):
+
+    strategy = None
+    server = None
+
+
+class LatencyServerPoolTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.fast, self.slow = Server("fast"), Server("slow")
+        self.pool = LatencyServerPool([self.fast, self.slow], min_samples=3,
+                                      max_failures=2, eject_time=60)
+        self.conn = _Connection()
+
+    def observe(self, server, elapsed, times):
+        for _ in range(times):
+            self.pool.observe(server, elapsed)
+
+    def test_unmeasured_servers_first(self):
+        self.pool.observe(self.fast, 0.01)
+        self.assertIs(self.pool.get_server(self.conn), self.slow)
+
+    def test_weighted_choice(self):
+        self.observe(self.fast, 0.01, 3)
+        self.observe(self.slow, 0.02, 3)
+        servers = [self.pool.get_server(self.conn) for _ in range(300)]
+        # selected with probabilities of 2/3 and 1/3
+        self.assertGreater(servers.count(self.fast), servers.count(self.slow))
+        self.assertGreater(servers.count(self.slow), 0)
+
+    def test_eject_slow(self):
+        self.observe(self.fast, 0.01, 3)
+        self.observe(self.slow, 0.1, 2)
+        self.assertFalse(self.pool.ejected(self.slow))
+        self.pool.observe(self.slow, 0.1)
+        self.assertTrue(self.pool.ejected(self.slow))
+        self.assertEqual(set(self.pool.get_server(self.conn)
+                             for _ in range(20)), set([self.fast]))
+        self.assertEqual([status.ejected for status in self.pool.status()],
+                         [False, True])
+
+    def test_eject_failures(self):
+        self.pool.failure(self.slow)
+        self.pool.observe(self.slow, 0.01)
+        self.pool.failure(self.slow)
+        self.assertFalse(self.pool.ejected(self.slow))
+        self.pool.failure(self.slow)
+        self.assertTrue(self.pool.ejected(self.slow))
+
+    def test_last_server(self):
+        for server in (self.fast, self.slow):
+            for _ in range(2):
+                self.pool.failure(server)
+        self.assertTrue(self.pool.ejected(self.fast))
+        self.assertFalse(self.pool.ejected(self.slow))
+        self.assertIs(self.pool.get_server(self.conn), self.slow)
+
+    def test_health_check(self):
+        self.pool.eject_time = 0
+        self.slow.check_availability = lambda: False
+        for _ in range(2):
+            self.pool.failure(self.slow)
+        self.pool.eject_time = 60
+        # ejected again after a failing health check
+        self.assertIs(self.pool.get_server(self.conn), self.fast)
+        self.assertTrue(self.pool.ejected(self.slow))
+        # reinstated without observations after a successful health check
+        self.pool._member(self.slow).ejected_until = 0
+        self.slow.check_availability = lambda: True
+        self.pool.observe(self.fast, 0.01)
+        self.assertIs(self.pool.get_server(self.conn), self.slow)
+        self.assertEqual(self.pool.status()[1].failures, 0)
+
+    def test_exhausted(self):
+        pool = LatencyServerPool([self.slow], eject_time=0)
+        self.slow.check_availability = lambda: False
+        pool.failure(self.slow)
+        pool._member(self.slow).ejected_until = 0
+        self.assertRaises(LDAPServerPoolExhaustedError, pool.get_server,
+                          self.conn)
+
+
+if __name__ == "__main__":
+    unittest.main()
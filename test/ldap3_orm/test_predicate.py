@@ -0,0 +1,113 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3 import MOCK_SYNC, OFFLINE_SLAPD_2_4, Server
+from ldap3.core.exceptions import LDAPInvalidFilterError
+
+from ldap3_orm.predicate import compile_predicate, select
+from test.ldap3_orm.fixtures import BASE_DN, User, directory
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+SCHEMA = Server("schema", get_info=OFFLINE_SLAPD_2_4).schema
+
+
+class PredicateTestCase(unittest.TestCase):
+
+    def assertMatches(self, search_filter, attributes, schema=SCHEMA):
+        self.assertTrue(compile_predicate(search_filter, schema)(attributes))
+
+    def assertNotMatches(self, search_filter, attributes, schema=SCHEMA):
+        self.assertFalse(compile_predicate(search_filter, schema)(attributes))
+
+    def test_attribute_names(self):
+        self.assertMatches("(givenname=G)", {"givenName": ["G"]})
+        self.assertMatches("(GIVENNAME=g)", {"givenname": "G"}, None)
+        self.assertMatches("(commonName=a)", {"CN": ["A"]})
+        self.assertNotMatches("(givenName=g)", {"sn": ["g"]})
+
+    def test_equality(self):
+        self.assertMatches("(cn=John  Smith)", {"cn": ["john smith"]})
+        self.assertMatches("(cn=john)", {"cn": ["x", "John"]})
+        self.assertNotMatches("(cn=john)", {"cn": ["johnny"]})
+        self.assertNotMatches("(userPassword=Secret)",
+                              {"userPassword": [b"secret"]})
+
+    def test_substrings(self):
+        self.assertMatches("(cn=*b*c)", {"cn": ["aBxC"]})
+        self.assertMatches("(cn=smith 5*)", {"cn": ["Smith  52"]})
+        self.assertMatches("(cn=a*\\2a*)", {"cn": ["a*"]})
+        self.assertMatches("(cn=a*\\28*)", {"cn": ["ab", "a\nb("]})
+        self.assertNotMatches("(cn=a*b*b)", {"cn": ["ab"]})
+        self.assertNotMatches("(cn=a.*)", {"cn": ["ab"]})
+
+    def test_ordering(self):
+        self.assertMatches("(uidNumber>=10)", {"uidNumber": ["12"]})
+        self.assertNotMatches("(uidNumber>=10)", {"uidNumber": ["9"]})
+        self.assertMatches("(createTimestamp>=20260101000000Z)",
+                           {"createTimestamp": ["20260201000000Z"]})
+        self.assertMatches("(sn<=b)", {"sn": ["A"]})
+
+    def test_undefined(self):
+        attributes = {"uidNumber": ["x"], "member": ["invalid"]}
+        for search_filter in ("(uidNumber=12)", "(uidNumber<=12)",
+                              "(member=uid=u01,%s)" % BASE_DN):
+            self.assertNotMatches(search_filter, attributes)
+            self.assertMatches("(!%s)" % search_filter, attributes)
+        self.assertMatches("(member=UID=u01, %s)" % BASE_DN,
+                           {"member": ["uid=u01,%s" % BASE_DN]})
+
+    def test_missing_attributes(self):
+        self.assertNotMatches("(mail=*)", {"uid": ["u01"]})
+        self.assertMatches("(!(mail=x))", {"uid": ["u01"]})
+        self.assertMatches("(|(mail=x)(uid=u0*))", {"uid": ["u01"]})
+        self.assertMatches("(mail=*)", {"MAIL": ["x"]})
+        self.assertNotMatches("(mail=*)", {"mail": []})
+
+    def test_extensible(self):
+        self.assertRaises(LDAPInvalidFilterError, compile_predicate,
+                          "(cn:caseExactMatch:=x)")
+
+    def test_entries(self):
+        conn = directory("server", MOCK_SYNC, users=10)
+        conn.bind()
+        users = User.search(conn=conn).all()
+        self.assertEqual(len(users), 10)
+        predicate = compile_predicate(
+            (User.surname == "user") & User.username.startswith("u0"),
+            SCHEMA)
+        self.assertEqual(sorted(user.entry_dn
+                                for user in users if predicate(user)),
+                         ["uid=u%02d,%s" % (i, BASE_DN)
+                          for i in range(1, 10, 2)])
+        self.assertEqual(len(list(select("(UID=U00)", users))), 1)
+        conn.search(BASE_DN, "(objectClass=inetOrgPerson)",
+                    attributes=["*"])
+        self.assertEqual(len(list(select("(&(sn=other)(!(uid=u00)))",
+                                         conn.response, SCHEMA))), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3 import SUBTREE
+
+from ldap3_orm.filter import UNPARSEABLE, fingerprint
+from ldap3_orm.querylog import QueryLog
+from test.ldap3_orm.fixtures import BASE_DN, User
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+
+class QueryLogTestCase(unittest.TestCase):
+
+    def test_fingerprint(self):
+        self.assertEqual(fingerprint((User.username == "guest") &
+                                     User.surname.startswith("U")),
+                         "(&(sn=?*)(uid=?))")
+        self.assertEqual(fingerprint("(|(SN=b)(uid=a))"),
+                         fingerprint("(|(uid=x)(sn=y))"))
+        self.assertEqual(fingerprint("(uid=guest"), UNPARSEABLE)
+
+    def test_shapes(self):
+        querylog = QueryLog()
+        for i in range(3):
+            querylog.record(BASE_DN, "(uid=u%02d)" % i, SUBTREE, ["uid"], 1,
+                            0.1)
+            querylog.record(BASE_DN, "(uid=u%02d" % i, SUBTREE, ["uid"], 0,
+                            0.2)
+        shapes = querylog.top()
+        self.assertEqual([(shape.fingerprint, shape.count)
+                          for shape in shapes],
+                         [(UNPARSEABLE, 3), ("(uid=?)", 3)])
+        self.assertAlmostEqual(shapes[1].total, 0.3)
+        self.assertEqual(shapes[1].entries, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# coding: utf-8
+
+import unittest
+
+from ldap3 import MODIFY_REPLACE, MOCK_ASYNC, MOCK_SYNC, Server
+
+from ldap3_orm.routing import RoutingConnection
+from test.ldap3_orm.fixtures import BASE_DN, USERS, directory
+
+
+__author__ = "Christian Felder <webmaster@bsm-felder.de>"
+__copyright__ = """Copyright 2026, Christian Felder
+
+This file is part of ldap3-orm, object-relational mapping for ldap3.
+
+ldap3-orm is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+ldap3-orm is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with ldap3-orm. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+
+
+def routing(client_strategy):
+    return RoutingConnection(directory("primary", client_strategy),
+                             directory("replica", client_strategy))
+
+
+class RoutingConnectionTestCase(unittest.TestCase):
+
+    def test_context_manager(self):
+        with routing(MOCK_SYNC) as conn:
+            self.assertTrue(conn.primary.bound)
+            self.assertTrue(conn.replica.bound)
+            self.assertTrue(conn.search(BASE_DN, "(uid=u01)"))
+        self.assertFalse(conn.primary.bound)
+        self.assertFalse(conn.replica.bound)
+
+    def test_message_ids(self):
+        conn = routing(MOCK_ASYNC)
+        conn.bind()
+        counter = Server._message_counter
+        write = conn.modify("uid=u01," + BASE_DN,
+                            {"sn": [(MODIFY_REPLACE, ["Modified"])]})
+        # message ids of different connections collide, e.g. after
+        # wrapping around
+        Server._message_counter = counter
+        read = conn.search("uid=u02," + BASE_DN, "(objectClass=*)")
+        response, result = conn.get_response(read)
+        self.assertEqual(result["type"], "searchResDone")
+        self.assertEqual([item["dn"] for item in response],
+                         ["uid=u02," + BASE_DN])
+        self.assertIs(conn._last, conn.replica)
+        response, result = conn.get_response(write)
+        self.assertEqual(result["type"], "modifyResponse")
+        self.assertEqual(result["result"], 0)
+
+    def test_paged_search_after_write(self):
+        conn = routing(MOCK_SYNC)
+        conn.bind()
+        responses = conn.extend.standard.paged_search(
+            BASE_DN, "(objectClass=inetOrgPerson)", paged_size=10,
+            generator=True)
+        dns = [next(responses)["dn"]]
+        # the search base is read from the primary for further searches
+        self.assertTrue(conn.modify("uid=u01," + BASE_DN,
+                                    {"sn": [(MODIFY_REPLACE, ["Modified"])]}))
+        dns += [response["dn"] for response in responses]
+        self.assertEqual(sorted(dns), ["uid=u%02d,%s" % (i, BASE_DN)
+                                       for i in range(USERS)])
+
+
+if __name__ == "__main__":
+    unittest.main()